@@ -0,0 +1,7 @@
+"""
+Benchmarks for the manage_sql hot paths.
+
+Each module can be executed on its own, for example:
+
+    python -m benchmarks.crud --output results.json
+"""
@@ -0,0 +1,154 @@
+import json
+import os
+import platform
+import sys
+import time
+
+BASELINES_DIR = os.path.join(os.path.dirname(__file__), 'baselines')
+
+class BenchmarkResult:
+    """
+    Timing of a single benchmark case.
+
+    Attributes:
+        name (str):
+            Unique key of the case, e.g. `sqlite.insert_data.n1000.c4`.
+        operations (int):
+            Number of operations executed.
+        seconds (float):
+            Wall clock time spent on all operations.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        operations: int,
+        seconds: float
+    ):
+        self.name = name
+        self.operations = operations
+        self.seconds = seconds
+
+    @property
+    def us_per_op(self) -> float:
+        return self.seconds / max(self.operations, 1) * 1e6
+
+    @property
+    def ops_per_sec(self) -> float:
+        return self.operations / self.seconds if self.seconds else 0.0
+
+    def to_dict(self):
+        return {
+            'operations': self.operations,
+            'seconds': round(self.seconds, 6),
+            'us_per_op': round(self.us_per_op, 3),
+            'ops_per_sec': round(self.ops_per_sec, 3)
+        }
+
+def timed(name: str, operations: int, target: object, *args) -> BenchmarkResult:
+    """Runs `target(*args)` once and measures it as `operations` operations."""
+
+    start = time.perf_counter()
+    target(*args)
+
+    return BenchmarkResult(name=name, operations=operations, seconds=time.perf_counter() - start)
+
+def environment() -> dict:
+    return {
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine()
+    }
+
+def write_results(results: list[BenchmarkResult], output: str = None, extra: dict = None) -> dict:
+    """Dumps the results as JSON to `output` (or stdout when it is `None`)."""
+
+    report = {
+        'environment': environment(),
+        'results': {result.name: result.to_dict() for result in results}
+    }
+
+    if extra:
+        report.update(extra)
+
+    text = json.dumps(report, indent=4, sort_keys=True)
+
+    if output:
+        with open(output, 'w', encoding='UTF-8') as file:
+            file.write(text + '\n')
+
+    else:
+        print(text)
+
+    return report
+
+def load_baseline(path: str) -> dict:
+    with open(path, 'r', encoding='UTF-8') as file:
+        return json.load(file)
+
+def save_baseline(path: str, report: dict, metric: str = 'us_per_op') -> None:
+    """Stores only the compared metric of each case, so the committed file stays small and reviewable."""
+
+    baseline = {
+        'metric': metric,
+        'environment': report['environment'],
+        'results': {name: values[metric] for name, values in report['results'].items()}
+    }
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    with open(path, 'w', encoding='UTF-8') as file:
+        file.write(json.dumps(baseline, indent=4, sort_keys=True) + '\n')
+
+def compare(report: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Compares a report against a baseline.
+
+    Args:
+        report (dict): Output of `write_results`.
+        baseline (dict): Content of a baseline file.
+        threshold (float): Allowed slowdown, `0.25` means 25% slower than the baseline.
+
+    Returns:
+        list[str]: One message per regressed case. Cases missing on either side are ignored.
+    """
+
+    metric = baseline.get('metric', 'us_per_op')
+    regressions: list[str] = []
+
+    for name, expected in baseline['results'].items():
+        current = report['results'].get(name)
+
+        if current is None or not expected:
+            continue
+
+        ratio = current[metric] / expected
+
+        if ratio > 1 + threshold:
+            regressions.append(
+                f'{name}: {current[metric]:.1f} {metric} vs baseline {expected:.1f} (+{(ratio - 1) * 100:.0f}%)'
+            )
+
+    return regressions
+
+def check_baseline(report: dict, baseline_path: str, threshold: float, update: bool = False, metric: str = 'us_per_op') -> int:
+    """
+    Updates or checks the baseline and returns the process exit code.
+    """
+
+    if update:
+        save_baseline(path=baseline_path, report=report, metric=metric)
+        print(f'Baseline written to {baseline_path}', file=sys.stderr)
+        return 0
+
+    if not os.path.exists(baseline_path):
+        print(f'No baseline at {baseline_path}, skipping comparison', file=sys.stderr)
+        return 0
+
+    regressions = compare(report=report, baseline=load_baseline(baseline_path), threshold=threshold)
+
+    for message in regressions:
+        print(f'REGRESSION {message}', file=sys.stderr)
+
+    return 1 if regressions else 0
@@ -0,0 +1,205 @@
+"""
+CRUD hot path benchmark.
+
+Measures `create_table`, `insert_data`, `select_data` (with and without a `Filter`),
+`update_data`, `detele_data` and `tables` for several table sizes and concurrency levels.
+
+SQLITE always runs. POSTGRESQL and MYSQL run when a server is configured through
+the environment:
+
+    MANAGE_SQL_BENCH_POSTGRES_URL   dsn of the PostgreSQL server
+    MANAGE_SQL_BENCH_MYSQL_HOST     host of the MySQL server (plus _USER, _PASSWORD, _DATABASE, _PORT)
+
+Usage:
+
+    python -m benchmarks.crud --output results.json
+    python -m benchmarks.crud --update-baseline
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from .common import BASELINES_DIR, BenchmarkResult, timed, write_results, check_baseline
+
+except ImportError:
+    from benchmarks.common import BASELINES_DIR, BenchmarkResult, timed, write_results, check_baseline
+
+TABLE = 'manage_sql_bench'
+DEFAULT_BASELINE = os.path.join(BASELINES_DIR, 'crud.json')
+
+def sqlite_backend(workdir: str):
+    from manage_sql import SQLITE
+
+    db = SQLITE(database='bench', path=os.path.join(workdir, 'sqlite'))
+    columns = [
+        db.Column(name='name', column_type=db.Column_types.text),
+        db.Column(name='age', column_type=db.Column_types.integer),
+        db.Column(name='score', column_type=db.Column_types.real)
+    ]
+
+    return db, columns
+
+def postgresql_backend(workdir: str, driver: str = 'psycopg2', **options):
+    from manage_sql import POSTGRESQL
+
+    db = POSTGRESQL(postgre_url=os.environ['MANAGE_SQL_BENCH_POSTGRES_URL'], driver=driver, **options)
+    columns = [
+        db.Column(name='name', column_type=db.Column_types.Char(60).varchar),
+        db.Column(name='age', column_type=db.Column_types.Integer.integer),
+        db.Column(name='score', column_type=db.Column_types.Float.double_precision)
+    ]
+
+    return db, columns
+
+def mysql_backend(workdir: str, driver: str = 'connector', **options):
+    from manage_sql import MYSQL
+
+    db = MYSQL(
+        host=os.environ['MANAGE_SQL_BENCH_MYSQL_HOST'],
+        username=os.environ.get('MANAGE_SQL_BENCH_MYSQL_USER', 'root'),
+        password=os.environ.get('MANAGE_SQL_BENCH_MYSQL_PASSWORD', ''),
+        database=os.environ.get('MANAGE_SQL_BENCH_MYSQL_DATABASE', 'manage_sql_bench'),
+        port=int(os.environ.get('MANAGE_SQL_BENCH_MYSQL_PORT', 3306)),
+        driver=driver,
+        **options
+    )
+    columns = [
+        db.Column(name='name', column_type=db.Column_types.Char(60).varchar),
+        db.Column(name='age', column_type=db.Column_types.Integer.integer),
+        db.Column(name='score', column_type=db.Column_types.Decimal(10, 2).double)
+    ]
+
+    return db, columns
+
+BACKENDS = {
+    'sqlite': (sqlite_backend, None),
+    'postgresql': (postgresql_backend, 'MANAGE_SQL_BENCH_POSTGRES_URL'),
+    'mysql': (mysql_backend, 'MANAGE_SQL_BENCH_MYSQL_HOST')
+}
+
+def configured_backends() -> list[str]:
+    return [name for name, (_, env) in BACKENDS.items() if env is None or os.environ.get(env)]
+
+def parallel(concurrency: int, target: object, items) -> None:
+    if concurrency == 1:
+        for item in items:
+            target(item)
+
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(target, items))
+
+def run_case(db, columns, backend: str, size: int, concurrency: int, repeat: int) -> list[BenchmarkResult]:
+    """
+    Runs every CRUD operation once for a table of `size` rows using `concurrency` threads.
+    """
+
+    key = lambda operation: f'{backend}.{operation}.n{size}.c{concurrency}'
+    sample = list(range(1, min(size, repeat) + 1))
+    rows = [(f'user {i}', i % 90, i * 0.5) for i in range(size)]
+    results: list[BenchmarkResult] = []
+
+    def insert(row):
+        db.insert_data(
+            tablename=TABLE,
+            insert_query=[
+                db.ColumnData(column='name', value=row[0]),
+                db.ColumnData(column='age', value=row[1]),
+                db.ColumnData(column='score', value=row[2])
+            ]
+        )
+
+    def select_all(_):
+        db.select_data(tablename=TABLE)
+
+    def select_filtered(row_id):
+        db.select_data(tablename=TABLE, condition=db.filter_by(column='id').EQUAL(value=row_id))
+
+    def update(row_id):
+        db.update_data(
+            tablename=TABLE,
+            edit_query=[db.ColumnData(column='age', value=row_id % 90)],
+            condition=db.filter_by(column='id').EQUAL(value=row_id)
+        )
+
+    def delete(row_id):
+        db.detele_data(tablename=TABLE, condition=db.delete_by(column='id').EQUAL(value=row_id))
+
+    def tables(_):
+        db.tables
+
+    def create(index):
+        db.create_table(tablename=f'{TABLE}_{index}', columns=columns)
+
+    scratch = range(min(repeat, 20))
+
+    db.drop_table(tablename=TABLE)
+    results.append(timed(key('create_table'), len(scratch), parallel, concurrency, create, scratch))
+
+    for index in scratch:
+        db.drop_table(tablename=f'{TABLE}_{index}')
+
+    db.create_table(tablename=TABLE, columns=columns)
+    results.append(timed(key('insert_data'), size, parallel, concurrency, insert, rows))
+    results.append(timed(key('select_data'), repeat, parallel, concurrency, select_all, range(repeat)))
+    results.append(timed(key('select_data_filter'), len(sample), parallel, concurrency, select_filtered, sample))
+    results.append(timed(key('update_data'), len(sample), parallel, concurrency, update, sample))
+    results.append(timed(key('tables'), repeat, parallel, concurrency, tables, range(repeat)))
+    results.append(timed(key('detele_data'), len(sample), parallel, concurrency, delete, sample))
+
+    db.drop_table(tablename=TABLE)
+
+    return results
+
+def run(backends: list[str], sizes: list[int], concurrency: list[int], repeat: int, rounds: int = 3) -> list[BenchmarkResult]:
+    """
+    Runs every case `rounds` times and keeps the fastest round, which filters out most scheduling noise.
+    """
+
+    results: dict[str, BenchmarkResult] = {}
+    workdir = tempfile.mkdtemp(prefix='manage_sql_bench_')
+
+    try:
+        for backend in backends:
+            factory, _ = BACKENDS[backend]
+            db, columns = factory(workdir)
+
+            for size in sizes:
+                for level in concurrency:
+                    print(f'{backend}: size={size} concurrency={level}', file=sys.stderr)
+
+                    for _ in range(rounds):
+                        for result in run_case(db, columns, backend, size, level, repeat):
+                            if result.name not in results or result.seconds < results[result.name].seconds:
+                                results[result.name] = result
+
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return list(results.values())
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the manage_sql CRUD hot paths.')
+    parser.add_argument('--backends', nargs='+', choices=list(BACKENDS), default=configured_backends())
+    parser.add_argument('--sizes', nargs='+', type=int, default=[100, 1000])
+    parser.add_argument('--concurrency', nargs='+', type=int, default=[1, 4])
+    parser.add_argument('--repeat', type=int, default=100, help='calls per read/update/delete case')
+    parser.add_argument('--rounds', type=int, default=3, help='runs per case, the fastest one is reported')
+    parser.add_argument('--output', help='write the JSON results to this file instead of stdout')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--threshold', type=float, default=0.50, help='allowed slowdown before failing (0.50 = 50%%)')
+    parser.add_argument('--update-baseline', action='store_true')
+    args = parser.parse_args(argv)
+
+    results = run(backends=args.backends, sizes=args.sizes, concurrency=args.concurrency, repeat=args.repeat, rounds=args.rounds)
+    report = write_results(results=results, output=args.output)
+
+    return check_baseline(report=report, baseline_path=args.baseline, threshold=args.threshold, update=args.update_baseline)
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,153 @@
+"""
+Driver comparison benchmark.
+
+Runs the CRUD workload of `benchmarks.crud` plus a bulk insert (`insert_rows`) and an
+`execute_query(many=True)` batch once per installed driver of each configured server:
+
+    POSTGRESQL  psycopg2, psycopg (psycopg 3, binary results and pipeline mode)
+    MYSQL       connector (C extension when installed), connector_pure, mysqlclient
+
+and prints, for every operation, the time per operation of each driver and its speedup
+over the default one. Servers are configured through the same environment variables as
+`benchmarks.crud`; drivers that are not installed are skipped.
+
+Usage:
+
+    python -m benchmarks.drivers --sizes 1000 --concurrency 1 4 --output drivers.json
+"""
+
+import argparse
+import shutil
+import sys
+import tempfile
+
+try:
+    from .common import BenchmarkResult, timed, write_results
+    from .crud import BACKENDS, TABLE, configured_backends, run_case
+
+except ImportError:
+    from benchmarks.common import BenchmarkResult, timed, write_results
+    from benchmarks.crud import BACKENDS, TABLE, configured_backends, run_case
+
+from manage_sql.Utils.utils_drivers import POSTGRES_DRIVERS, MYSQL_DRIVERS
+
+DRIVERS = {
+    'postgresql': POSTGRES_DRIVERS,
+    'mysql': MYSQL_DRIVERS
+}
+
+def run_batches(db, columns, key: str, size: int) -> list[BenchmarkResult]:
+    """The batched paths, where pipeline mode and the C drivers matter the most."""
+
+    rows = [(f'user {i}', i % 90, i * 0.5) for i in range(size)]
+    placeholders = ', '.join(['%s'] * 3)
+    results: list[BenchmarkResult] = []
+
+    db.drop_table(tablename=TABLE)
+    db.create_table(tablename=TABLE, columns=columns)
+
+    results.append(timed(f'{key}.insert_rows.n{size}', size, db.insert_rows, TABLE, ['name', 'age', 'score'], rows))
+    results.append(
+        timed(
+            f'{key}.execute_many.n{size}',
+            size,
+            db.execute_query,
+            f'INSERT INTO {TABLE} (name, age, score) VALUES ({placeholders})',
+            rows,
+            True
+        )
+    )
+
+    db.drop_table(tablename=TABLE)
+
+    return results
+
+def run(backends: list[str], sizes: list[int], concurrency: list[int], repeat: int, rounds: int) -> tuple[list[BenchmarkResult], dict]:
+    results: dict[str, BenchmarkResult] = {}
+    drivers: dict[str, list[str]] = {}
+    workdir = tempfile.mkdtemp(prefix='manage_sql_drivers_')
+
+    try:
+        for backend in backends:
+            factory, _ = BACKENDS[backend]
+
+            for driver in DRIVERS[backend]:
+                try:
+                    db, columns = factory(workdir, driver=driver)
+
+                except ImportError as e:
+                    print(f'{backend}[{driver}]: skipped ({e})', file=sys.stderr)
+                    continue
+
+                drivers.setdefault(backend, []).append(driver)
+                key = f'{backend}[{driver}]'
+
+                for size in sizes:
+                    for level in concurrency:
+                        print(f'{key}: size={size} concurrency={level}', file=sys.stderr)
+
+                        for _ in range(rounds):
+                            for result in run_case(db, columns, key, size, level, repeat) + run_batches(db, columns, key, size):
+                                if result.name not in results or result.seconds < results[result.name].seconds:
+                                    results[result.name] = result
+
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return list(results.values()), drivers
+
+def matrix(results: list[BenchmarkResult], drivers: dict[str, list[str]]) -> dict:
+    """Operation to driver to (us per operation, speedup over the first driver of the backend)."""
+
+    table: dict[str, dict] = {}
+
+    for result in results:
+        backend, _, rest = result.name.partition('[')
+        driver, _, operation = rest.partition('].')
+        table.setdefault(f'{backend}.{operation}', {})[driver] = round(result.us_per_op, 3)
+
+    for operation, timings in table.items():
+        default = timings.get(drivers[operation.split('.')[0]][0])
+
+        for driver, us in list(timings.items()):
+            timings[driver] = {'us_per_op': us, 'speedup': round(default / us, 2) if default and us else None}
+
+    return table
+
+def print_matrix(table: dict, drivers: dict[str, list[str]]) -> None:
+    for backend, names in drivers.items():
+        print(f'\n{"operation":<40}' + ''.join(f'{name:>22}' for name in names), file=sys.stderr)
+
+        for operation, timings in sorted(table.items()):
+            if not operation.startswith(f'{backend}.'):
+                continue
+
+            cells = [
+                f'{timings[name]["us_per_op"]:>12.1f} us x{timings[name]["speedup"] or 0:<5.2f}' if name in timings else f'{"-":>22}'
+                for name in names
+            ]
+            print(f'{operation:<40}' + ''.join(cells), file=sys.stderr)
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='Compare the database drivers on the same CRUD workload.')
+    parser.add_argument('--backends', nargs='+', choices=list(DRIVERS), default=[name for name in configured_backends() if name in DRIVERS])
+    parser.add_argument('--sizes', nargs='+', type=int, default=[1000])
+    parser.add_argument('--concurrency', nargs='+', type=int, default=[1, 4])
+    parser.add_argument('--repeat', type=int, default=100, help='calls per read/update/delete case')
+    parser.add_argument('--rounds', type=int, default=3, help='runs per case, the fastest one is reported')
+    parser.add_argument('--output', help='write the JSON results to this file instead of stdout')
+    args = parser.parse_args(argv)
+
+    if not args.backends:
+        print('No server configured, set MANAGE_SQL_BENCH_POSTGRES_URL and/or MANAGE_SQL_BENCH_MYSQL_HOST', file=sys.stderr)
+        return 0
+
+    results, drivers = run(backends=args.backends, sizes=args.sizes, concurrency=args.concurrency, repeat=args.repeat, rounds=args.rounds)
+    table = matrix(results, drivers)
+    print_matrix(table, drivers)
+    write_results(results=results, output=args.output, extra={'matrix': table})
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
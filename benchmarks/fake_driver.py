@@ -0,0 +1,163 @@
+"""
+A DB-API 2.0 stub driver that answers every query instantly with canned results.
+
+It stands in for `sqlite3`, `psycopg2` and `mysql.connector` so the time spent inside
+manage_sql itself can be measured without a database server.
+"""
+
+apilevel = '2.0'
+threadsafety = 3
+paramstyle = 'format'
+
+ROWS: list[tuple] = [(index, f'user {index}', index % 90, index * 0.5) for index in range(1, 11)]
+DESCRIPTION = [('id',), ('name',), ('age',), ('score',)]
+
+CANNED = {
+    # SQLITE.tables
+    'sqlite_master': [('bench', 'CREATE TABLE bench (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, age INTEGER, score REAL)')],
+    'table_info(': [
+        (0, 'id', 'INTEGER', 0, None, 1),
+        (1, 'name', 'TEXT', 0, None, 0),
+        (2, 'age', 'INTEGER', 0, None, 0),
+        (3, 'score', 'REAL', 0, None, 0)
+    ],
+    # POSTGRESQL.tables
+    'information_schema.tables': [('bench',)],
+    'information_schema.columns': [
+        ('id', 'integer', 'YES', 'YES', 'NO', "nextval('bench_id_seq'::regclass)"),
+        ('name', 'character varying', 'NO', 'NO', 'YES', None),
+        ('age', 'integer', 'NO', 'NO', 'YES', None),
+        ('score', 'double precision', 'NO', 'NO', 'YES', None)
+    ],
+    # MYSQL.tables
+    'SHOW TABLES': [('bench',)],
+    'SHOW COLUMNS': [
+        ('id', 'int', 'NO', 'PRI', None, 'auto_increment'),
+        ('name', 'varchar(60)', 'YES', '', None, ''),
+        ('age', 'int', 'YES', '', None, ''),
+        ('score', 'double', 'YES', '', None, '')
+    ]
+}
+
+class Error(Exception):
+    pass
+
+class InterfaceError(Error):
+    pass
+
+class OperationalError(Error):
+    pass
+
+class ProgrammingError(Error):
+    pass
+
+class Cursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self.description = None
+        self.rowcount = -1
+        self.lastrowid = None
+        self.arraysize = 1
+        self.__rows: list[tuple] = []
+        self.__position = 0
+
+    def execute(self, query: str, params=None, *args, **kwargs):
+        self.connection.statements += 1
+
+        for marker, rows in CANNED.items():
+            if marker in query:
+                self.__result(rows, [(f'c{index}',) for index in range(len(rows[0]))])
+                return self
+
+        if query.lstrip().upper().startswith(('SELECT', 'SHOW', 'PRAGMA', 'WITH')):
+            self.__result(ROWS, DESCRIPTION)
+
+        else:
+            self.__result([], None)
+            self.rowcount = 1
+
+        return self
+
+    def executemany(self, query: str, seq_of_params, *args, **kwargs):
+        count = 0
+
+        for params in seq_of_params:
+            self.execute(query, params)
+            count += 1
+
+        self.rowcount = count
+        return self
+
+    def executescript(self, script: str):
+        return self.execute(script)
+
+    def fetchone(self):
+        if self.__position >= len(self.__rows):
+            return None
+
+        row = self.__rows[self.__position]
+        self.__position += 1
+
+        return row
+
+    def fetchmany(self, size: int = None):
+        size = size or self.arraysize
+        rows = self.__rows[self.__position:self.__position + size]
+        self.__position += len(rows)
+
+        return rows
+
+    def fetchall(self):
+        rows = self.__rows[self.__position:]
+        self.__position = len(self.__rows)
+
+        return rows
+
+    def close(self):
+        pass
+
+    def __iter__(self):
+        return iter(self.fetchall())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __result(self, rows: list[tuple], description):
+        self.__rows = rows
+        self.__position = 0
+        self.description = description
+        self.rowcount = len(rows)
+
+class Connection:
+    def __init__(self, *args, **kwargs):
+        self.autocommit = False
+        self.in_transaction = False
+        self.statements = 0
+        self.closed = False
+
+    def cursor(self, *args, **kwargs) -> Cursor:
+        return Cursor(self)
+
+    def execute(self, query: str, params=None):
+        return self.cursor().execute(query, params)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def connect(*args, **kwargs) -> Connection:
+    return Connection(*args, **kwargs)
@@ -0,0 +1,129 @@
+"""
+Hashing throughput benchmark.
+
+Measures, for each algorithm and cost factor of `encrypt_value`/`encrypt_values`:
+
+    latency     milliseconds to hash one value, i.e. what a login pays
+    throughput  hashes per second of `encrypt_values` per executor and pool size,
+                i.e. how long a bulk migration takes
+
+and reports the highest cost of each algorithm whose latency fits `--budget-ms`.
+No database is needed.
+
+Usage:
+
+    python -m benchmarks.hashing --budget-ms 250
+    python -m benchmarks.hashing --algorithms pbkdf2_hmac --iterations 100000 210000 600000 --workers 1 4 8
+"""
+
+import argparse
+import os
+import sys
+import time
+
+try:
+    from .common import BenchmarkResult, write_results
+
+except ImportError:
+    from benchmarks.common import BenchmarkResult, write_results
+
+from manage_sql.Utils.utils_hashing import ALGORITHMS, EXECUTORS, hash_value, hash_values
+
+def costs(algorithm: str, iterations: list[int], scrypt_n: list[int]) -> list[tuple[str, dict]]:
+    """The (label, options) pairs measured for an algorithm."""
+
+    if algorithm == 'pbkdf2_hmac':
+        return [(f'i{count}', {'iterations': count}) for count in iterations]
+
+    if algorithm == 'scrypt':
+        return [(f'n{n}', {'n': n}) for n in scrypt_n]
+
+    return [('', {})]
+
+def latency(algorithm: str, options: dict, rounds: int) -> float:
+    """Fastest single hash of `rounds`, in milliseconds."""
+
+    best = float('inf')
+
+    for _ in range(rounds):
+        start = time.perf_counter()
+        hash_value('correct horse battery staple', algorithm=algorithm, **options)
+        best = min(best, time.perf_counter() - start)
+
+    return best * 1e3
+
+def run(args) -> tuple[list[BenchmarkResult], dict]:
+    results: list[BenchmarkResult] = []
+    latencies: dict = {}
+
+    for algorithm in args.algorithms:
+        count = args.sha512_values if algorithm == 'sha512' else args.values
+        values = [f'password {index}' for index in range(count)]
+
+        for label, options in costs(algorithm, args.iterations, args.scrypt_n):
+            name = '.'.join(part for part in ('hashing', algorithm, label) if part)
+            latencies[name] = round(latency(algorithm, options, args.rounds), 3)
+
+            for executor in args.executors:
+                for workers in args.workers:
+                    start = time.perf_counter()
+                    hash_values(values, workers=workers, executor=executor, algorithm=algorithm, **options)
+
+                    results.append(
+                        BenchmarkResult(name=f'{name}.{executor}.w{workers}', operations=count, seconds=time.perf_counter() - start)
+                    )
+
+    return results, latencies
+
+def within_budget(latencies: dict, budget_ms: float) -> dict:
+    """The most expensive setting of each algorithm whose single hash latency fits the budget."""
+
+    best: dict = {}
+
+    for name, milliseconds in latencies.items():
+        algorithm = name.split('.')[1]
+
+        if milliseconds <= budget_ms and milliseconds >= best.get(algorithm, ('', -1))[1]:
+            best[algorithm] = (name, milliseconds)
+
+    return {algorithm: {'case': name, 'latency_ms': milliseconds} for algorithm, (name, milliseconds) in best.items()}
+
+def print_table(results: list[BenchmarkResult], latencies: dict, budget: dict, budget_ms: float) -> None:
+    print(f'{"case":<48}{"hashes/s":>14}', file=sys.stderr)
+
+    for result in results:
+        print(f'{result.name:<48}{result.ops_per_sec:>14.1f}', file=sys.stderr)
+
+    print(f'\n{"case":<48}{"latency ms":>14}', file=sys.stderr)
+
+    for name, milliseconds in latencies.items():
+        print(f'{name:<48}{milliseconds:>14.3f}', file=sys.stderr)
+
+    print(f'\nHighest cost within {budget_ms} ms:', file=sys.stderr)
+
+    for algorithm, case in budget.items():
+        print(f'  {algorithm:<14}{case["case"]} ({case["latency_ms"]} ms)', file=sys.stderr)
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='Measure the latency and throughput of encrypt_value/encrypt_values.')
+    parser.add_argument('--algorithms', nargs='+', choices=ALGORITHMS, default=list(ALGORITHMS))
+    parser.add_argument('--iterations', nargs='+', type=int, default=[100000, 210000, 600000], help='pbkdf2_hmac costs')
+    parser.add_argument('--scrypt-n', nargs='+', type=int, default=[2 ** 14, 2 ** 15, 2 ** 16], help='scrypt costs')
+    parser.add_argument('--workers', nargs='+', type=int, default=sorted({1, os.cpu_count() or 1}))
+    parser.add_argument('--executors', nargs='+', choices=EXECUTORS, default=list(EXECUTORS))
+    parser.add_argument('--values', type=int, default=32, help='values hashed per pbkdf2_hmac/scrypt batch')
+    parser.add_argument('--sha512-values', type=int, default=100000, help='values hashed per sha512 batch')
+    parser.add_argument('--rounds', type=int, default=3, help='single hashes per latency case, the fastest one is reported')
+    parser.add_argument('--budget-ms', type=float, default=250.0, help='login latency budget used to pick the cost')
+    parser.add_argument('--output', help='write the JSON results to this file instead of stdout')
+    args = parser.parse_args(argv)
+
+    results, latencies = run(args)
+    budget = within_budget(latencies, args.budget_ms)
+    print_table(results=results, latencies=latencies, budget=budget, budget_ms=args.budget_ms)
+    write_results(results=results, output=args.output, extra={'latency_ms': latencies, 'within_budget': budget})
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
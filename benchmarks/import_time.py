@@ -0,0 +1,155 @@
+"""
+Import time benchmark.
+
+Runs each import statement in a fresh interpreter with `python -X importtime` and
+reports the time of the statement in microseconds (the best of `--rounds` runs), plus
+the ten slowest modules it loaded. Interpreter startup and `site` are not counted.
+
+It also guards the lazy backends: importing the package or a backend class must not
+load any database driver, the driver is only imported when a backend is constructed.
+Cases whose import fails (e.g. a backend that needs a newer Python) are skipped.
+
+Usage:
+
+    python -m benchmarks.import_time --output import_time.json
+    python -m benchmarks.import_time --update-baseline
+"""
+
+import argparse
+import importlib.util
+import os
+import subprocess
+import sys
+
+try:
+    from .common import BASELINES_DIR, BenchmarkResult, write_results, check_baseline
+
+except ImportError:
+    from benchmarks.common import BASELINES_DIR, BenchmarkResult, write_results, check_baseline
+
+DEFAULT_BASELINE = os.path.join(BASELINES_DIR, 'import_time.json')
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DRIVERS = ('psycopg2', 'psycopg', 'mysql', 'MySQLdb')
+
+CASES = {
+    # name: (statement, driver it needs, drivers it must not load)
+    'package': ('import manage_sql', None, DRIVERS),
+    'sqlite': ('from manage_sql import SQLITE', None, DRIVERS),
+    'postgresql': ('from manage_sql import POSTGRESQL', None, DRIVERS),
+    'mysql': ('from manage_sql import MYSQL', None, DRIVERS)
+}
+
+def installed(module: str) -> bool:
+    try:
+        return importlib.util.find_spec(module) is not None
+
+    except ImportError:
+        return False
+
+def available_cases() -> list[str]:
+    return [name for name, (_, driver, _) in CASES.items() if driver is None or installed(driver)]
+
+def parse_importtime(output: str) -> list[tuple[str, int, int]]:
+    """
+    Parses the `-X importtime` report.
+
+    Returns:
+        list[tuple[str, int, int]]: (module, self us, cumulative us) per imported module, in import order.
+    """
+
+    modules = []
+
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+
+        own, cumulative, name = line[len('import time:'):].split('|')
+        modules.append((name.strip(), int(own), int(cumulative)))
+
+    return modules
+
+def measure(statement: str) -> tuple[float, list[tuple[str, int, int]]]:
+    """
+    Runs `statement` in a new interpreter.
+
+    The time is taken inside the child around the statement itself, because `-X importtime`
+    does not log modules loaded through `importlib.import_module` (as the lazy backends are).
+
+    Returns:
+        tuple[float, list]: The seconds spent on the statement and the parsed `-X importtime` report.
+    """
+
+    code = (
+        'import time\n'
+        'start = time.perf_counter()\n'
+        f'{statement}\n'
+        'print(time.perf_counter() - start)\n'
+    )
+
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    return float(process.stdout.split()[-1]), parse_importtime(process.stderr)
+
+def run(cases: list[str], rounds: int = 5) -> tuple[list[BenchmarkResult], dict, list[str]]:
+    results: list[BenchmarkResult] = []
+    slowest: dict[str, list] = {}
+    violations: list[str] = []
+
+    for case in cases:
+        statement, _, forbidden = CASES[case]
+        best = None
+
+        try:
+            for _ in range(rounds):
+                seconds, modules = measure(statement)
+
+                if best is None or seconds < best[0]:
+                    best = (seconds, modules)
+
+        except subprocess.CalledProcessError as e:
+            print(f'{case}: skipped ({e.stderr.strip().splitlines()[-1]})', file=sys.stderr)
+            continue
+
+        seconds, modules = best
+        loaded = {name for name, _, _ in modules}
+
+        for driver in forbidden:
+            if any(name == driver or name.startswith(driver + '.') for name in loaded):
+                violations.append(f'{statement!r} imported {driver}')
+
+        results.append(BenchmarkResult(name=f'import.{case}', operations=1, seconds=seconds))
+        slowest[case] = [
+            {'module': name, 'self_us': own, 'cumulative_us': cumulative}
+            for name, own, cumulative in sorted(modules, key=lambda module: module[1], reverse=True)[:10]
+        ]
+
+    return results, slowest, violations
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='Measure the import time of manage_sql.')
+    parser.add_argument('--cases', nargs='+', choices=list(CASES), default=available_cases())
+    parser.add_argument('--rounds', type=int, default=5, help='interpreters started per case, the fastest one is reported')
+    parser.add_argument('--output', help='write the JSON results to this file instead of stdout')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--threshold', type=float, default=0.50, help='allowed slowdown before failing (0.50 = 50%%)')
+    parser.add_argument('--update-baseline', action='store_true')
+    args = parser.parse_args(argv)
+
+    results, slowest, violations = run(cases=args.cases, rounds=args.rounds)
+    report = write_results(results=results, output=args.output, extra={'slowest_modules': slowest, 'violations': violations})
+
+    for message in violations:
+        print(f'EAGER IMPORT {message}', file=sys.stderr)
+
+    status = check_baseline(report=report, baseline_path=args.baseline, threshold=args.threshold, update=args.update_baseline)
+
+    return 1 if violations else status
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,244 @@
+"""
+Library overhead microbenchmark.
+
+Runs every public method of SQLITE, POSTGRESQL and MYSQL against `fake_driver`, a
+DB-API stub that answers instantly, so what is left is the Python time spent inside
+manage_sql: `Filter` string building, `ColumnData` unpacking, the thread spawned by
+`SQLITE.__sql_threading`, the repeated `__connect` and so on.
+
+Reports the time per call in microseconds and the allocations per call measured
+with tracemalloc. A real server (or driver) is not needed.
+
+Usage:
+
+    python -m benchmarks.overhead --output overhead.json
+"""
+
+import argparse
+import importlib
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+import types
+
+try:
+    from . import fake_driver
+    from .common import BenchmarkResult, write_results, check_baseline
+
+except ImportError:
+    from benchmarks import fake_driver
+    from benchmarks.common import BenchmarkResult, write_results, check_baseline
+
+BACKENDS = {
+    # name: (module, class, driver attribute in the module, driver modules loaded by utils_drivers)
+    'sqlite': ('manage_sql.Utils.SQLITE', 'SQLITE', 'sq', ()),
+    'postgresql': ('manage_sql.Utils.POSTGRESQL', 'POSTGRESQL', None, ('psycopg2',)),
+    'mysql': ('manage_sql.Utils.MYSQL', 'MYSQL', None, ('mysql', 'mysql.connector'))
+}
+
+def install_fake_modules(names: tuple[str]) -> None:
+    """
+    Registers `fake_driver` under the driver module names, and an empty package under
+    their parents, so the backends load it instead of a real (or missing) driver.
+    """
+
+    for name in names:
+        if any(other.startswith(f'{name}.') for other in names):
+            package = types.ModuleType(name)
+            package.__path__ = []
+            sys.modules[name] = package
+
+        else:
+            parent, _, child = name.rpartition('.')
+            sys.modules[name] = fake_driver
+
+            if parent:
+                setattr(sys.modules[parent], child, fake_driver)
+
+def load_backend(name: str):
+    """Imports the backend class with its driver pointed at `fake_driver`."""
+
+    module_name, class_name, attribute, _ = BACKENDS[name]
+
+    for _, _, _, drivers in BACKENDS.values():
+        install_fake_modules(drivers)
+
+    module = importlib.import_module(module_name)
+
+    if attribute:
+        setattr(module, attribute, fake_driver)
+
+    return getattr(module, class_name)
+
+def build(name: str, workdir: str):
+    backend = load_backend(name)
+
+    if name == 'sqlite':
+        db = backend(database='bench', path=workdir)
+        text, integer = db.Column_types.text, db.Column_types.integer
+
+    elif name == 'postgresql':
+        db = backend(postgre_url='dbname=bench')
+        text, integer = db.Column_types.Text, db.Column_types.Integer.integer
+
+    else:
+        db = backend(host='localhost', username='bench', password='bench', database='bench')
+        text, integer = db.Column_types.Text.text, db.Column_types.Integer.integer
+
+    columns = [
+        db.Column(name='name', column_type=text),
+        db.Column(name='age', column_type=integer)
+    ]
+
+    return db, columns
+
+def cases(name: str, db, columns) -> dict:
+    """Every public method of the backend plus the internal pieces that wrap each call."""
+
+    class_name = BACKENDS[name][1]
+    row = lambda: [db.ColumnData(column='name', value='user'), db.ColumnData(column='age', value=30)]
+    condition = lambda: db.filter_by(column='id').EQUAL(value=1).AND.filterby(column='age').GATHER_THAN(value=18)
+    template = db.filter_by(column='id').EQUAL(value=db.param('id')).AND.filterby(column='age').GATHER_THAN(value=db.param('age')).compile()
+
+    suite = {
+        'Filter': condition,
+        'FilterTemplate.bind': lambda: template.bind(id=1, age=18),
+        'ColumnData': lambda: [db.ColumnData(column=f'column_{index}', value=index) for index in range(10)],
+        '__connect': lambda: getattr(db, f'_{class_name}__connect')[0].close(),
+        'create_table': lambda: db.create_table(tablename='bench', columns=columns),
+        'insert_data': lambda: db.insert_data(tablename='bench', insert_query=row()),
+        'insert_row': lambda: db.insert_row(tablename='bench', mapping={'name': 'user', 'age': 30}),
+        'insert_rows': lambda: db.insert_rows(tablename='bench', columns=['name', 'age'], rows=[('user', 30)] * 10),
+        'select_data': lambda: db.select_data(tablename='bench'),
+        'select_data_filter': lambda: db.select_data(tablename='bench', condition=condition()),
+        'select_data_template': lambda: db.select_data(tablename='bench', condition=template.bind(id=1, age=18)),
+        'select_data_join': lambda: db.select_data(tablename=db.join('bench').INNER('bench', on=('id', 'id'), alias='other'), columns=['bench.id', 'other.id', 'bench.name'], row_format='dict'),
+        'aggregate': lambda: db.aggregate(tablename='bench', aggregates={'total': ('sum', 'age'), 'rows': ('count', '*')}, group_by='name', condition=condition()),
+        'search': lambda: db.search(tablename='bench', query='user', columns=['id', 'name']),
+        'count': lambda: db.count(tablename='bench', condition=condition()),
+        'exists': lambda: db.exists(tablename='bench', condition=condition()),
+        'update_data': lambda: db.update_data(tablename='bench', edit_query=row(), condition=condition()),
+        'detele_data': lambda: db.detele_data(tablename='bench', condition=condition()),
+        'tables': lambda: db.tables,
+        'add_column': lambda: db.add_column(tablename='bench', column=columns[0]),
+        'drop_column': lambda: db.drop_column(tablename='bench', column_name='name'),
+        'drop_table': lambda: db.drop_table(tablename='bench'),
+        'execute_query': lambda: db.execute_query(query='SELECT * FROM bench'),
+        'encrypt_value': lambda: db.encrypt_value(value='password')
+    }
+
+    if name == 'sqlite':
+        suite['__sql_threading'] = lambda: db._SQLITE__sql_threading(target=lambda: None, args=())
+
+    return suite
+
+def measure(target: object, iterations: int, rounds: int) -> float:
+    """Returns the fastest round, in seconds, of `iterations` calls."""
+
+    best = float('inf')
+
+    for _ in range(rounds):
+        start = time.perf_counter()
+
+        for _ in range(iterations):
+            target()
+
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+def allocations(target: object, iterations: int) -> dict:
+    """
+    Measures the memory allocated by a call with tracemalloc.
+
+    Returns:
+        dict: `peak_bytes` is the transient peak of a call and `retained_bytes`
+        the memory still held after it, both averaged per call.
+    """
+
+    target()
+    tracemalloc.start()
+
+    try:
+        peak_total = 0
+        start_current, _ = tracemalloc.get_traced_memory()
+
+        for _ in range(iterations):
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            target()
+            _, peak = tracemalloc.get_traced_memory()
+            peak_total += peak - before
+
+        end_current, _ = tracemalloc.get_traced_memory()
+
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'peak_bytes': round(peak_total / iterations),
+        'retained_bytes': round((end_current - start_current) / iterations)
+    }
+
+def run(backends: list[str], iterations: int, rounds: int) -> tuple[list[BenchmarkResult], dict]:
+    results: list[BenchmarkResult] = []
+    memory: dict = {}
+    workdir = tempfile.mkdtemp(prefix='manage_sql_overhead_')
+
+    try:
+        for name in backends:
+            try:
+                db, columns = build(name, workdir)
+
+            except (ImportError, SyntaxError) as e:
+                print(f'{name}: skipped ({e})', file=sys.stderr)
+                continue
+
+            for case, target in cases(name, db, columns).items():
+                key = f'{name}.{case}'
+                target()
+
+                results.append(
+                    BenchmarkResult(name=key, operations=iterations, seconds=measure(target, iterations, rounds))
+                )
+                memory[key] = allocations(target, max(iterations // 10, 1))
+
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return results, memory
+
+def print_table(results: list[BenchmarkResult], memory: dict) -> None:
+    print(f'{"case":<36}{"us/call":>12}{"peak B":>12}{"retained B":>12}', file=sys.stderr)
+
+    for result in results:
+        print(
+            f'{result.name:<36}{result.us_per_op:>12.2f}'
+            f'{memory[result.name]["peak_bytes"]:>12}{memory[result.name]["retained_bytes"]:>12}',
+            file=sys.stderr
+        )
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='Measure the Python overhead manage_sql adds on top of the driver.')
+    parser.add_argument('--backends', nargs='+', choices=list(BACKENDS), default=list(BACKENDS))
+    parser.add_argument('--iterations', type=int, default=1000)
+    parser.add_argument('--rounds', type=int, default=5, help='runs per case, the fastest one is reported')
+    parser.add_argument('--output', help='write the JSON results to this file instead of stdout')
+    parser.add_argument('--baseline', help='compare against this baseline file')
+    parser.add_argument('--threshold', type=float, default=0.50)
+    parser.add_argument('--update-baseline', action='store_true')
+    args = parser.parse_args(argv)
+
+    results, memory = run(backends=args.backends, iterations=args.iterations, rounds=args.rounds)
+    print_table(results=results, memory=memory)
+    report = write_results(results=results, output=args.output, extra={'allocations': memory})
+
+    if args.baseline:
+        return check_baseline(report=report, baseline_path=args.baseline, threshold=args.threshold, update=args.update_baseline)
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""
+Prepared statements benchmark.
+
+Runs the hot `select_data` / `update_data` shapes (a point lookup and a point update by
+`id`) on a POSTGRESQL or MYSQL server in three modes:
+
+    unpooled    a new connection per call (the default)
+    pooled      `pool_size` connections reused, every statement parsed and planned again
+    prepared    pooled, with server-side prepared statements after `prepare_threshold` runs
+
+and prints the time per operation of each mode plus the prepared statement counters
+(`prepared_statements`). Servers are configured through the same environment variables
+as `benchmarks.crud`.
+
+Usage:
+
+    python -m benchmarks.prepared --repeat 5000 --concurrency 1 8 --output prepared.json
+"""
+
+import argparse
+import shutil
+import sys
+import tempfile
+
+try:
+    from .common import BenchmarkResult, timed, write_results
+    from .crud import BACKENDS, TABLE, configured_backends, parallel
+
+except ImportError:
+    from benchmarks.common import BenchmarkResult, timed, write_results
+    from benchmarks.crud import BACKENDS, TABLE, configured_backends, parallel
+
+SERVERS = ('postgresql', 'mysql')
+
+def modes(pool_size: int) -> dict:
+    return {
+        'unpooled': {},
+        'pooled': {'pool_size': pool_size, 'prepare_threshold': None},
+        'prepared': {'pool_size': pool_size}
+    }
+
+def run_mode(db, columns, key: str, rows: int, repeat: int, concurrency: int) -> list[BenchmarkResult]:
+    ids = [index % rows + 1 for index in range(repeat)]
+
+    def select(row_id):
+        db.select_data(tablename=TABLE, condition=db.filter_by(column='id').EQUAL(value=row_id))
+
+    def update(row_id):
+        db.update_data(
+            tablename=TABLE,
+            edit_query=[db.ColumnData(column='age', value=row_id % 90)],
+            condition=db.filter_by(column='id').EQUAL(value=row_id)
+        )
+
+    return [
+        timed(f'{key}.select_data.c{concurrency}', repeat, parallel, concurrency, select, ids),
+        timed(f'{key}.update_data.c{concurrency}', repeat, parallel, concurrency, update, ids)
+    ]
+
+def run(backends: list[str], rows: int, repeat: int, concurrency: list[int], pool_size: int) -> tuple[list[BenchmarkResult], dict]:
+    results: list[BenchmarkResult] = []
+    counters: dict[str, dict] = {}
+    workdir = tempfile.mkdtemp(prefix='manage_sql_prepared_')
+
+    try:
+        for backend in backends:
+            factory, _ = BACKENDS[backend]
+
+            for mode, options in modes(pool_size).items():
+                db, columns = factory(workdir, **options)
+                key = f'{backend}.{mode}'
+
+                db.drop_table(tablename=TABLE)
+                db.create_table(tablename=TABLE, columns=columns)
+                db.insert_rows(tablename=TABLE, columns=['name', 'age', 'score'], rows=[(f'user {i}', i % 90, i * 0.5) for i in range(rows)])
+
+                for level in concurrency:
+                    print(f'{key}: concurrency={level}', file=sys.stderr)
+                    results.extend(run_mode(db, columns, key, rows, repeat, level))
+
+                counters[key] = db.prepared_statements
+                db.drop_table(tablename=TABLE)
+                db.close()
+
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return results, counters
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='Compare unpooled, pooled and prepared execution of the hot queries.')
+    parser.add_argument('--backends', nargs='+', choices=SERVERS, default=[name for name in configured_backends() if name in SERVERS])
+    parser.add_argument('--rows', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=2000, help='calls per operation')
+    parser.add_argument('--concurrency', nargs='+', type=int, default=[1, 4])
+    parser.add_argument('--pool-size', type=int, default=8)
+    parser.add_argument('--output', help='write the JSON results to this file instead of stdout')
+    args = parser.parse_args(argv)
+
+    if not args.backends:
+        print('No server configured, set MANAGE_SQL_BENCH_POSTGRES_URL and/or MANAGE_SQL_BENCH_MYSQL_HOST', file=sys.stderr)
+        return 0
+
+    results, counters = run(backends=args.backends, rows=args.rows, repeat=args.repeat, concurrency=args.concurrency, pool_size=args.pool_size)
+
+    for result in results:
+        print(f'{result.name:<50}{result.us_per_op:>12.1f} us', file=sys.stderr)
+
+    for key, snapshot in counters.items():
+        print(f'{key:<30} hit rate {snapshot["hit_rate"]:.2%} ({snapshot["hits"]}/{snapshot["executions"]})', file=sys.stderr)
+
+    write_results(results=results, output=args.output, extra={'prepared_statements': counters})
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
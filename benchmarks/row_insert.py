@@ -0,0 +1,171 @@
+"""
+Per-row insert overhead benchmark.
+
+Compares, for a wide row, the Python cost per row of:
+
+    insert_data   one `ColumnData` per value, the statement is joined on every call
+    insert_row    a plain dict, the statement is cached per column set
+    insert_rows   a list of tuples inserted in a single call
+
+It also compares the size of the `ColumnData` objects of one row with and without
+`__slots__`. Every backend runs against `fake_driver`, so no server is needed and only
+manage_sql's own time and allocations are measured.
+
+Usage:
+
+    python -m benchmarks.row_insert --columns 20 --output row_insert.json
+"""
+
+import argparse
+import shutil
+import sys
+import tempfile
+import tracemalloc
+
+try:
+    from .common import BenchmarkResult, write_results, check_baseline
+    from .overhead import BACKENDS, build, measure
+
+except ImportError:
+    from benchmarks.common import BenchmarkResult, write_results, check_baseline
+    from benchmarks.overhead import BACKENDS, build, measure
+
+class DictColumnData:
+    """`ColumnData` as it was before `__slots__`, kept here as the reference point."""
+
+    def __init__(
+        self,
+        column: str,
+        value
+    ):
+        self.column = column
+        self.value = value
+
+def row_values(width: int, index: int = 0) -> tuple:
+    return tuple(f'value {index}' if column % 2 else index + column for column in range(width))
+
+def cases(db, width: int, batch: int) -> dict:
+    """Each case inserts `rows` rows per call: (target, rows)."""
+
+    names = tuple(f'column_{column}' for column in range(width))
+    values = row_values(width)
+    rows = [row_values(width, index) for index in range(batch)]
+
+    return {
+        'insert_data': (lambda: db.insert_data(tablename='bench', insert_query=[db.ColumnData(column=name, value=value) for name, value in zip(names, values)]), 1),
+        'insert_row': (lambda: db.insert_row(tablename='bench', mapping=dict(zip(names, values))), 1),
+        'insert_rows': (lambda: db.insert_rows(tablename='bench', columns=names, rows=rows), batch)
+    }
+
+def peak_bytes(target: object, iterations: int) -> int:
+    """Average tracemalloc peak of a call, in bytes."""
+
+    target()
+    tracemalloc.start()
+
+    try:
+        total = 0
+
+        for _ in range(iterations):
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            target()
+            _, peak = tracemalloc.get_traced_memory()
+            total += peak - before
+
+    finally:
+        tracemalloc.stop()
+
+    return round(total / iterations)
+
+def object_sizes(column_data: type, width: int) -> dict:
+    """Bytes held by the `ColumnData` objects of one row, with and without `__slots__`."""
+
+    names = [f'column_{column}' for column in range(width)]
+    values = row_values(width)
+
+    def retained(factory: type) -> int:
+        # Warm up first: the first instances of a class also allocate its shared key table.
+        [factory(column=name, value=value) for name, value in zip(names, values)]
+        tracemalloc.start()
+
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+            objects = [factory(column=name, value=value) for name, value in zip(names, values)]
+            after, _ = tracemalloc.get_traced_memory()
+
+        finally:
+            tracemalloc.stop()
+
+        del objects
+
+        return after - before
+
+    slots, dicts = retained(column_data), retained(DictColumnData)
+
+    return {'slots_bytes': slots, 'dict_bytes': dicts, 'saved_bytes_per_row': dicts - slots}
+
+def run(backends: list[str], width: int, batch: int, iterations: int, rounds: int) -> tuple[list[BenchmarkResult], dict]:
+    results: list[BenchmarkResult] = []
+    details: dict = {}
+    workdir = tempfile.mkdtemp(prefix='manage_sql_row_insert_')
+
+    try:
+        for name in backends:
+            try:
+                db, _ = build(name, workdir)
+
+            except (ImportError, SyntaxError) as e:
+                print(f'{name}: skipped ({e})', file=sys.stderr)
+                continue
+
+            details[f'{name}.ColumnData'] = object_sizes(db.ColumnData, width)
+
+            for case, (target, rows) in cases(db, width, batch).items():
+                key = f'{name}.{case}.c{width}'
+                calls = max(iterations // rows, 1)
+                target()
+
+                # One operation is one row, so us_per_op is directly the per-row cost.
+                results.append(BenchmarkResult(name=key, operations=calls * rows, seconds=measure(target, calls, rounds)))
+                details[key] = {'peak_bytes_per_row': round(peak_bytes(target, max(calls // 10, 1)) / rows)}
+
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return results, details
+
+def print_table(results: list[BenchmarkResult], details: dict) -> None:
+    print(f'{"case":<36}{"us/row":>12}{"peak B/row":>12}', file=sys.stderr)
+
+    for result in results:
+        print(f'{result.name:<36}{result.us_per_op:>12.2f}{details[result.name]["peak_bytes_per_row"]:>12}', file=sys.stderr)
+
+    for key, sizes in details.items():
+        if key.endswith('.ColumnData'):
+            print(f'{key:<36}{sizes["dict_bytes"]:>8} B -> {sizes["slots_bytes"]} B with __slots__', file=sys.stderr)
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='Measure the per-row cost of insert_data, insert_row and insert_rows.')
+    parser.add_argument('--backends', nargs='+', choices=list(BACKENDS), default=list(BACKENDS))
+    parser.add_argument('--columns', type=int, default=20, help='width of the inserted row')
+    parser.add_argument('--batch', type=int, default=1000, help='rows per insert_rows call')
+    parser.add_argument('--iterations', type=int, default=5000, help='rows inserted per round')
+    parser.add_argument('--rounds', type=int, default=5, help='runs per case, the fastest one is reported')
+    parser.add_argument('--output', help='write the JSON results to this file instead of stdout')
+    parser.add_argument('--baseline', help='compare against this baseline file')
+    parser.add_argument('--threshold', type=float, default=0.50)
+    parser.add_argument('--update-baseline', action='store_true')
+    args = parser.parse_args(argv)
+
+    results, details = run(backends=args.backends, width=args.columns, batch=args.batch, iterations=args.iterations, rounds=args.rounds)
+    print_table(results=results, details=details)
+    report = write_results(results=results, output=args.output, extra={'details': details})
+
+    if args.baseline:
+        return check_baseline(report=report, baseline_path=args.baseline, threshold=args.threshold, update=args.update_baseline)
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,4 +1,7 @@
-import mysql.connector as mysql
+import functools
+import itertools
+from datetime import date
+
 try:
     from ..Utils.utils_mysql import (
         Types,
@@ -6,8 +9,23 @@ try:
         Column,
         ColumnData,
         Filter,
-        EncryptValue
+        EncryptValue,
+        SEARCH_COLUMN,
+        Partition,
+        ROW_FORMATS,
+        KEY_BLOCK_SIZES,
+        MAXVALUE_PARTITION
     )
+    from ..Utils.utils_filters import param
+    from ..Utils.utils_partitions import INTERVALS, period_start, next_period, partition_name, partition_start
+    from ..Utils.utils_joins import Join, selection
+    from ..Utils.utils_rows import format_rows, column_types, insert_query, order_clause, aggregate_query
+    from ..Utils.utils_hashing import hash_value, hash_values, verify_hash
+    from ..Utils.utils_replicas import ReplicaRouter, is_read_only
+    from ..Utils.utils_drivers import MySQLDriver
+    from ..Utils.utils_pool import ConnectionPool, PreparedStats, is_schema_change
+    from ..Utils.utils_numpy import fill_columns, to_structured, to_frame
+    from ..Utils.utils_files import as_query, check_format, export_cursor, check_import_format, import_records
 
 except:
     from .utils_mysql import (
@@ -16,8 +34,23 @@ except:
         Column,
         ColumnData,
         Filter,
-        EncryptValue
+        EncryptValue,
+        SEARCH_COLUMN,
+        Partition,
+        ROW_FORMATS,
+        KEY_BLOCK_SIZES,
+        MAXVALUE_PARTITION
     )
+    from .utils_filters import param
+    from .utils_partitions import INTERVALS, period_start, next_period, partition_name, partition_start
+    from .utils_joins import Join, selection
+    from .utils_rows import format_rows, column_types, insert_query, order_clause, aggregate_query
+    from .utils_hashing import hash_value, hash_values, verify_hash
+    from .utils_replicas import ReplicaRouter, is_read_only
+    from .utils_drivers import MySQLDriver
+    from .utils_pool import ConnectionPool, PreparedStats, is_schema_change
+    from .utils_numpy import fill_columns, to_structured, to_frame
+    from .utils_files import as_query, check_format, export_cursor, check_import_format, import_records
 
 class MYSQL:
     """
@@ -30,7 +63,16 @@ class MYSQL:
         username: str,
         password: str,
         database: str = None,
-        port: int = 3306
+        port: int = 3306,
+        replicas: list[str] = None,
+        replica_strategy: str = 'round_robin',
+        read_your_writes: float = 0.0,
+        max_replica_lag: float = None,
+        max_replica_errors: int = 3,
+        driver: str = 'connector',
+        pool_size: int = 0,
+        prepare_threshold: int = 5,
+        prepared_max: int = 100
     ):
         """
         Initializes the MYSQL class to set up a connection to a MySQL database.
@@ -40,6 +82,20 @@ class MYSQL:
         :param password: The password for the given username.
         :param database: (Optional) The name of the database to connect to. If not provided, connection will attempt without a database.
         :param port: (Optional) The port number of the MySQL server. Defaults to 3306.
+        :param replicas: (Optional) Hosts of read replicas, as 'host' or 'host:port', with the same credentials and database.
+            `select_data`, `tables` and read-only `execute_query` are balanced across them; every write goes to the primary.
+        :param replica_strategy: (Optional) 'round_robin' (default) or 'least_outstanding'.
+        :param read_your_writes: (Optional) Seconds after a write during which reads stay on the primary. Defaults to 0.
+        :param max_replica_lag: (Optional) `Seconds_Behind_Source` above which a replica is left out for a while.
+        :param max_replica_errors: (Optional) Consecutive connection errors after which a replica is left out for a while.
+        :param driver: (Optional) 'connector' (default, mysql-connector-python with its C extension when installed),
+            'connector_pure' (its pure Python implementation) or 'mysqlclient'.
+        :param pool_size: (Optional) Idle connections kept for reuse, per server. Defaults to 0, a new connection per call.
+        :param prepare_threshold: (Optional) On pooled connections, executions of the same `select_data`, `update_data`,
+            `detele_data` or `insert_*` statement after which it runs on a `cursor(prepared=True)`. None disables it.
+            Defaults to 5. mysqlclient has no prepared statements.
+        :param prepared_max: (Optional) Statements tracked per connection; the least recently used is closed. Defaults to 100.
+        :raises ImportError: If the driver is not installed (`pip install manage-sql[mysql]` or `manage-sql[mysqlclient]`).
         """
 
         self.__host = host
@@ -47,24 +103,97 @@ class MYSQL:
         self.__password = password
         self.__database = database
         self.__port = port
+        self.__driver = MySQLDriver(name=driver)
+        self.__replicas: list[str] = list(replicas or [])
+        self.__router = ReplicaRouter(
+            replicas=len(self.__replicas),
+            strategy=replica_strategy,
+            read_your_writes=read_your_writes,
+            max_lag=max_replica_lag,
+            max_errors=max_replica_errors
+        ) if replicas else None
+        self.__prepare_threshold = prepare_threshold
+        self.__prepared_max = prepared_max
+        self.__prepared = PreparedStats()
+        self.__pool = self.__new_pool(self.__open, pool_size)
+        self.__replica_pools = [
+            self.__new_pool(functools.partial(self.__open_replica, index), pool_size)
+            for index in range(len(self.__replicas))
+        ] if pool_size else []
         self.Column_types = Types()
         self.Column = Column
         self.filter_by = Filter
         self.delete_by = Filter
+        self.param = param
+        self.join = Join
+        self.Partition = Partition
         self.ColumnData = ColumnData
         self.CURRENT_TIMESTAMP = 'CURRENT_TIMESTAMP'
     
     @property
     def __connect(self):
+        """
+        Opens a connection to the primary for a write.
+
+        :return: A tuple of (connection, cursor) for interacting with the database.
+        """
+
+        if self.__router is not None:
+            self.__router.wrote()
+
+        return self.__primary_connect
+
+    @property
+    def replicas_status(self) -> list[dict]:
+        """
+        The outstanding reads, consecutive errors and health of each replica, in the order of `replicas`.
+
+        :return: A list of dicts, empty when no replica is configured.
+        """
+
+        return self.__router.status() if self.__router is not None else []
+
+    @property
+    def prepared_statements(self) -> dict:
+        """
+        Counters of the statements run through server-side prepared statements on pooled connections.
+
+        :return: A dict of executions, hits (a prepared statement reused), prepares, misses (not hot yet), evictions and hit_rate.
+        """
+
+        return self.__prepared.snapshot()
+
+    def close(self) -> None:
+        """
+        Closes the pooled connections. Connections in use are closed when they are released.
+
+        :return: None
+        """
+
+        self.__flush()
+
+    @property
+    def __primary_connect(self):
+        """
+        Takes a pooled connection to the MySQL server, or opens one.
+
+        :return: A tuple of (connection, cursor) for interacting with the database.
+        """
+
+        connection = self.__pool.acquire() if self.__pool is not None else self.__open()
+
+        return connection, connection.cursor()
+
+    def __open(self):
         """
         Creates a connection to the MySQL server. This method supports connecting
         either with or without a specified database.
 
-        :return: A tuple of (connection, cursor) for interacting with the database.
+        :return: A driver connection.
         """
 
         def connect_without_database():
-            connection = mysql.connect(
+            connection = self.__driver.connect(
                 host = self.__host,
                 port = self.__port,
                 user = self.__username,
@@ -74,7 +203,7 @@ class MYSQL:
             return connection
         
         def connect_with_database():
-            connection = mysql.connect(
+            connection = self.__driver.connect(
                 host = self.__host,
                 port = self.__port,
                 database = self.__database,
@@ -102,9 +231,7 @@ class MYSQL:
                     connection.close()
                     self.__exception_error(message_error=e)
 
-        cursor = connection.cursor()
-
-        return connection, cursor
+        return connection
     
     @property
     def tables(self) -> list[Table]:
@@ -113,9 +240,10 @@ class MYSQL:
 
         :return: A list of Table objects representing each table in the database.
         """
-        
-        connection, cursor = self.__connect
-            
+
+        return self.__read(self.__read_tables)
+
+    def __read_tables(self, connection, cursor) -> list[Table]:
         cursor.execute(
             'SHOW TABLES'
         )
@@ -149,8 +277,6 @@ class MYSQL:
                     )
                 
                 db_tables.append(table_info)
-        
-        connection.close()
 
         return db_tables
     
@@ -169,32 +295,68 @@ class MYSQL:
         
         finally:
             connection.close()
+            # The pooled connections would keep using the dropped database.
+            self.__flush()
     
-    def create_table(self, tablename: str, columns: list[Column]) -> None:
+    def create_table(
+        self,
+        tablename: str,
+        columns: list[Column],
+        engine: str = None,
+        row_format: str = None,
+        key_block_size: int = None,
+        partition_by: Partition = None
+    ) -> None:
         """
         Creates a table in the connected database with the specified columns.
 
         :param tablename: The name of the table to create.
         :param columns: A list of Column objects representing the structure of the table.
+        :param engine: (Optional) Storage engine, e.g. 'InnoDB' or 'MEMORY' for a small lookup table kept in RAM
+            (without TEXT or BLOB columns, and emptied when the server restarts). Defaults to the server's.
+        :param row_format: (Optional) InnoDB row format, e.g. 'COMPRESSED' for a cold table, or 'DYNAMIC'.
+        :param key_block_size: (Optional) Compressed page size in KB (1, 2, 4, 8 or 16), with ROW_FORMAT=COMPRESSED.
+        :param partition_by: (Optional) A Partition object; the table is created with its partitions and the primary
+            key becomes (id, partition key), as MySQL requires.
         :return: None
+
+        Example:
+        >>> db.create_table('events', [db.Column('created_at', db.Column_types.DateTime.datetime)],
+        ...                 row_format='COMPRESSED', key_block_size=8, partition_by=db.Partition('created_at'))
         """
 
+        if row_format is not None and row_format.upper() not in ROW_FORMATS:
+            raise ValueError(f'O `row_format` deve ser um de {ROW_FORMATS}, e não {row_format!r}.')
+
+        if key_block_size is not None and key_block_size not in KEY_BLOCK_SIZES:
+            raise ValueError(f'O `key_block_size` deve ser um de {KEY_BLOCK_SIZES}, e não {key_block_size!r}.')
+
         try:
             columns_details: list[Column] = [
                 Column(
                     name='id',
                     column_type=self.Column_types.Integer.integer,
-                    primary_key=True,
+                    primary_key=partition_by is None,
                     auto_increment=True
                 ),
                 *columns
             ]
 
             all_columns = ', '.join(column.column_parameters for column in columns_details)
+
+            if partition_by is not None:
+                all_columns += f', PRIMARY KEY (id, {partition_by.column})'
+
+            options = ''.join([
+                f' ENGINE={engine}' if engine else '',
+                f' ROW_FORMAT={row_format.upper()}' if row_format else '',
+                f' KEY_BLOCK_SIZE={key_block_size}' if key_block_size else '',
+                f' {self.__partition_clause(partition_by)}' if partition_by else ''
+            ])
             
             connection, cursor = self.__connect
             cursor.execute(
-                f'CREATE TABLE IF NOT EXISTS {tablename} ({all_columns})'
+                f'CREATE TABLE IF NOT EXISTS {tablename} ({all_columns}){options}'
             )
 
             connection.close()
@@ -202,6 +364,109 @@ class MYSQL:
         except Exception as e:
             self.__exception_error(message_error=e)
     
+    def partitions(self, tablename: str) -> list[dict]:
+        """
+        Lists the partitions of a partitioned table.
+
+        :param tablename: The name of the partitioned table.
+        :return: The `name` and `bound` (the VALUES LESS THAN of a range partition, e.g. "'2024-02-01'" or 'MAXVALUE') of each partition.
+        """
+
+        rows = self.__read(lambda connection, cursor: self.__read_partitions(cursor, tablename))
+
+        return [{'name': name, 'bound': bound} for name, bound in rows]
+
+    def maintain_partitions(
+        self,
+        tablename: str,
+        interval: str = 'month',
+        ahead: int = 3,
+        retention: int = None,
+        expired: str = 'detach'
+    ) -> dict:
+        """
+        Rotates the partitions of a table partitioned by range on a date: adds the current interval and the
+        `ahead` next ones after the last partition (splitting the empty `pmax` partition when there is one),
+        and detaches or drops the ones older than `retention` intervals, which removes their rows instantly
+        instead of with a DELETE. Run it periodically (e.g. daily from a scheduler).
+
+        Only the partitions named by `create_table` or by this method (`p2024_01`) are expired.
+
+        :param tablename: The name of the partitioned table.
+        :param interval: (Optional) 'day', 'week', 'month' (default) or 'year', the one of its Partition.
+        :param ahead: (Optional) Future intervals to create in advance. Defaults to 3.
+        :param retention: (Optional) Past intervals kept besides the current one. Defaults to None, keeps all.
+        :param expired: (Optional) 'detach' (default) moves an expired partition to a `<tablename>_p2024_01` table,
+            to archive it; 'drop' deletes it.
+        :return: The names of the partitions 'created', 'detached' and 'dropped'.
+
+        Example:
+        >>> db.maintain_partitions('events', interval='month', ahead=3, retention=12, expired='drop')
+        {'created': ['p2025_02'], 'detached': [], 'dropped': ['p2024_01']}
+        """
+
+        if interval not in INTERVALS:
+            raise ValueError(f'O `interval` deve ser um de {INTERVALS}, e não {interval!r}.')
+
+        if expired not in ('detach', 'drop'):
+            raise ValueError(f"O `expired` deve ser 'detach' ou 'drop', e não {expired!r}.")
+
+        current = period_start(date.today(), interval)
+        result = {'created': [], 'detached': [], 'dropped': []}
+        connection, cursor = self.__connect
+
+        try:
+            existing = [name for name, _ in self.__read_partitions(cursor, tablename)]
+            starts = {name: partition_start('p', name) for name in existing}
+            starts = {name: start for name, start in starts.items() if start is not None}
+            # A range partition can only be added after the last one.
+            end = next_period(max(starts.values()), interval) if starts else current
+            added = [
+                start for start in (next_period(current, interval, index) for index in range(ahead + 1))
+                if start >= end
+            ]
+
+            if added:
+                definitions = ', '.join(
+                    f"PARTITION {partition_name('p', start, interval)} VALUES LESS THAN ('{next_period(start, interval)}')"
+                    for start in added
+                )
+
+                if MAXVALUE_PARTITION in existing:
+                    cursor.execute(
+                        f'ALTER TABLE {tablename} REORGANIZE PARTITION {MAXVALUE_PARTITION} INTO '
+                        f'({definitions}, PARTITION {MAXVALUE_PARTITION} VALUES LESS THAN (MAXVALUE))'
+                    )
+
+                else:
+                    cursor.execute(f'ALTER TABLE {tablename} ADD PARTITION ({definitions})')
+
+                result['created'] = [partition_name('p', start, interval) for start in added]
+
+            if retention is not None:
+                cutoff = next_period(current, interval, -retention)
+                names = [name for name, start in starts.items() if next_period(start, interval) <= cutoff]
+
+                if expired == 'detach':
+                    # An empty copy of the table, without partitions, takes the rows of the partition.
+                    for name in names:
+                        archive = f'{tablename}_{name}'
+                        cursor.execute(f'CREATE TABLE {archive} LIKE {tablename}')
+                        cursor.execute(f'ALTER TABLE {archive} REMOVE PARTITIONING')
+                        cursor.execute(f'ALTER TABLE {tablename} EXCHANGE PARTITION {name} WITH TABLE {archive}')
+
+                if names:
+                    cursor.execute(f"ALTER TABLE {tablename} DROP PARTITION {', '.join(names)}")
+                    result['detached' if expired == 'detach' else 'dropped'] = names
+
+        finally:
+            connection.close()
+
+            if any(result.values()):
+                self.__flush()
+
+        return result
+
     def insert_data(self, tablename: str, insert_query: list[ColumnData]) -> None:
         """
         Inserts data into a specified table.
@@ -218,8 +483,8 @@ class MYSQL:
         try:
             connection, cursor = self.__connect
 
-            cursor.execute(
-                f'INSERT INTO {tablename} ({columns}) VALUES ({key})', tuple(params)
+            self.__driver.execute(
+                connection, cursor, f'INSERT INTO {tablename} ({columns}) VALUES ({key})', tuple(params)
             )
 
             connection.commit()
@@ -228,6 +493,40 @@ class MYSQL:
         except Exception as e:
             self.__exception_error(message_error=e)
     
+    def insert_row(self, tablename: str, mapping: dict) -> None:
+        """
+        Inserts one row given as a dict, without building a ColumnData per value.
+
+        :param tablename: The name of the table to insert data into.
+        :param mapping: Column name to value.
+        :return: None
+        :raises Exception: The driver's error, e.g. an IntegrityError on a constraint violation.
+        """
+
+        connection, cursor = self.__connect
+
+        try:
+            self.__driver.execute(connection, cursor, insert_query(tablename, tuple(mapping), '%s'), tuple(mapping.values()))
+
+            connection.commit()
+
+        finally:
+            connection.close()
+
+    def insert_rows(self, tablename: str, columns: list[str], rows: list[tuple]) -> None:
+        """
+        Inserts many rows with multi-row `INSERT ... VALUES` statements in one transaction.
+
+        :param tablename: The name of the table to insert data into.
+        :param columns: Column names, in the order of the values in each row.
+        :param rows: The rows to insert. Any iterable of tuples (e.g. a generator) is accepted.
+        :return: None
+        :raises Exception: The driver's error, e.g. an IntegrityError when one row violates a constraint.
+            No row is inserted in that case.
+        """
+
+        self.__bulk_insert(tablename, tuple(columns), rows)
+
     def detele_data(self, tablename: str, condition: Filter = None):
         """
         Deletes data from the specified table, with an optional condition.
@@ -243,40 +542,243 @@ class MYSQL:
             cursor.execute(f'DELETE FROM {tablename}')
         
         else:
-            condition_query = condition._Filter__condition.strip()
-            condition_params = condition._Filter__params
+            condition_query = condition.sql
+            condition_params = condition.params
 
-            cursor.execute(f'DELETE FROM {tablename} {condition_query}', tuple(condition_params))
+            self.__driver.execute(connection, cursor, f'DELETE FROM {tablename} {condition_query}', tuple(condition_params))
         
         connection.commit()
         connection.close()
     
-    def select_data(self, tablename: str, columns: list[str] = ['*'], condition: Filter = None):
+    def select_data(
+        self,
+        tablename: str | Join,
+        columns: list[str] = ['*'],
+        condition: Filter = None,
+        row_format: str = 'tuple',
+        order_by: str | list[str] = None,
+        descending: bool = False
+    ):
         """
         Selects data from a specified table, with optional conditions.
 
-        :param tablename: The name of the table to select data from.
-        :param columns: (Optional) A list of column names to select. Defaults to selecting all columns.
+        :param tablename: The name of the table to select data from, or a `join` of several tables.
+        :param columns: (Optional) A list of column names to select. Defaults to selecting all columns. Over a join,
+            write them as `table.column`; a name selected twice comes back as `table_column`.
         :param condition: (Optional) A Filter object to specify the conditions for selection.
-        :return: A list of rows containing the selected data.
+        :param row_format: (Optional) 'tuple' (default), 'dict', 'namedtuple' or 'columns' (a dict of column name to list or `array.array`).
+        :param order_by: (Optional) Column(s) to sort the result by.
+        :param descending: (Optional) Sorts in descending order. Defaults to False.
+        :return: A list of rows containing the selected data, in the requested format.
+        """
+
+        order_query: str = order_clause(order_by, descending)
+        columns = selection(tablename, columns)
+
+        def select(connection, cursor) -> tuple:
+            if not condition:
+                cursor = self.__driver.execute(connection, cursor, f"SELECT {', '.join(columns)} FROM {tablename}{order_query}")
+
+            else:
+                condition_query: str = condition.sql
+                condition_params: tuple = condition.params
+
+                cursor = self.__driver.execute(
+                    connection, cursor, f"SELECT {', '.join(columns)} FROM {tablename} {condition_query}{order_query}", tuple(condition_params)
+                )
+
+            return cursor.fetchall(), cursor.description
+
+        dados, description = self.__read(select)
+
+        return format_rows(description, dados, row_format)
+
+
+    def aggregate(
+        self,
+        tablename: str | Join,
+        aggregates: dict[str, tuple[str, str]],
+        group_by: str | list[str] = None,
+        condition: Filter = None,
+        having: Filter = None,
+        row_format: str = 'dict',
+        order_by: str | list[str] = None,
+        descending: bool = False
+    ):
+        """
+        Computes aggregates in the database with a single `SELECT ... GROUP BY`, instead of fetching the rows.
+        Runs on a replica when there are replicas.
+
+        :param tablename: The name of the table to aggregate.
+        :param aggregates: Alias to (function, column). The function is 'count', 'count_distinct', 'sum', 'avg',
+            'min' or 'max'; the column may be '*' for 'count'.
+        :param group_by: (Optional) Column(s) to group by, first in each row. Without them there is one row.
+        :param condition: (Optional) A Filter object with the rows to aggregate.
+        :param having: (Optional) A Filter object with the groups to keep, e.g. `filter_by('total').GATHER_THAN(100)` on an alias.
+        :param row_format: (Optional) 'dict' (default), 'tuple', 'namedtuple' or 'columns'.
+        :param order_by: (Optional) Group column(s) or alias(es) to sort the result by.
+        :param descending: (Optional) Sorts in descending order. Defaults to False.
+        :return: One row per group, in the requested format.
+        """
+
+        query, params = aggregate_query(tablename, aggregates, group_by, condition, having, order_by, descending)
+
+        def read(connection, cursor) -> tuple:
+            cursor = self.__driver.execute(connection, cursor, query, params)
+
+            return cursor.fetchall(), cursor.description
+
+        dados, description = self.__read(read)
+
+        return format_rows(description, dados, row_format)
+
+    def count(self, tablename: str | Join, condition: Filter = None) -> int:
+        """
+        Counts the rows of a table with `SELECT COUNT(*)`.
+
+        :param tablename: The name of the table.
+        :param condition: (Optional) A Filter object with the rows to count. Defaults to every row.
+        :return: The number of rows.
+        """
+
+        query = f"SELECT COUNT(*) FROM {tablename} {condition.sql if condition else ''}".rstrip()
+        params = condition.params if condition else None
+
+        return self.__read(lambda connection, cursor: self.__driver.execute(connection, cursor, query, params).fetchall())[0][0]
+
+    def exists(self, tablename: str | Join, condition: Filter = None) -> bool:
+        """
+        Whether a table has a row matching `condition`, with `SELECT 1 ... LIMIT 1`, which stops at the first match.
+
+        :param tablename: The name of the table.
+        :param condition: (Optional) A Filter object with the row to look for. Defaults to any row.
+        :return: True when at least one row matches.
+        """
+
+        query = f"SELECT 1 FROM {tablename} {condition.sql + ' ' if condition else ''}LIMIT 1"
+        params = condition.params if condition else None
+
+        # fetchall drains the result, which the unbuffered cursor needs before the next statement.
+        return len(self.__read(lambda connection, cursor: self.__driver.execute(connection, cursor, query, params).fetchall())) > 0
+
+    def create_search_index(self, tablename: str, columns: list[str]) -> None:
+        """
+        Creates the full-text index of `search` and `Filter.MATCH`: an invisible generated
+        `search_text` column with the searched columns, which MySQL keeps up to date on every
+        write, and a FULLTEXT index on it. Needs MySQL 8.0.23 or later.
+
+        :param tablename: The name of the table to index.
+        :param columns: The text columns searched.
+        :return: None
+
+        Example:
+        >>> db.create_search_index('posts', ['title', 'body'])
+        >>> db.search('posts', 'database engines', columns=['id', 'title'])
         """
 
         connection, cursor = self.__connect
 
-        if not condition:
-            cursor.execute(f'SELECT {', '.join(columns)} FROM {tablename}')
+        try:
+            cursor.execute(
+                f"ALTER TABLE {tablename} ADD COLUMN {SEARCH_COLUMN} TEXT GENERATED ALWAYS AS (CONCAT_WS(' ', {', '.join(columns)})) STORED INVISIBLE, "
+                f'ADD FULLTEXT INDEX {tablename}_{SEARCH_COLUMN} ({SEARCH_COLUMN})'
+            )
 
-        else:
-            condition_query: str = condition._Filter__condition.strip()
-            condition_params: list = condition._Filter__params
+            connection.commit()
 
-            cursor.execute(f'SELECT {', '.join(columns)} FROM {tablename} {condition_query}', tuple(condition_params))
+        finally:
+            connection.close()
+            self.__flush()
 
-        dados = cursor.fetchall()
+    def drop_search_index(self, tablename: str) -> None:
+        """
+        Drops the full-text index of a table with its `search_text` column.
 
-        connection.close()
+        :param tablename: The name of the indexed table.
+        :return: None
+        """
+
+        connection, cursor = self.__connect
+
+        try:
+            cursor.execute(f'ALTER TABLE {tablename} DROP COLUMN {SEARCH_COLUMN}')
+
+            connection.commit()
+
+        finally:
+            connection.close()
+            self.__flush()
 
-        return dados
+    def search(
+        self,
+        tablename: str,
+        query: str,
+        columns: list[str] = ['*'],
+        condition: Filter = None,
+        limit: int = 20,
+        row_format: str = 'dict'
+    ):
+        """
+        Full-text search in the index of `create_search_index`, best matches first, in natural
+        language mode. Runs on a replica when there are replicas.
+
+        :param tablename: The name of the indexed table.
+        :param query: Words to look for; a row matching more of them, or rarer ones, ranks higher.
+        :param columns: (Optional) Columns to return. Defaults to all columns ('*').
+        :param condition: (Optional) A Filter object on the matched rows.
+        :param limit: (Optional) Maximum number of rows. Defaults to 20.
+        :param row_format: (Optional) 'dict' (default), 'tuple', 'namedtuple' or 'columns'.
+        :return: The matched rows with a last column `rank`, the relevance of MATCH ... AGAINST (higher is better).
+        """
+
+        selected = ', '.join(f'{tablename}.*' if column == '*' else column for column in columns)
+        match = f'MATCH ({tablename}.{SEARCH_COLUMN}) AGAINST (%s IN NATURAL LANGUAGE MODE)'
+        statement = (
+            f'SELECT {selected}, {match} AS `rank` FROM {tablename} '
+            f"WHERE {match} {'AND (' + condition.sql.removeprefix('WHERE ') + ') ' if condition else ''}"
+            f'ORDER BY `rank` DESC LIMIT %s'
+        )
+        params = (query, query, *(condition.params if condition else ()), limit)
+
+        def read(connection, cursor) -> tuple:
+            cursor = self.__driver.execute(connection, cursor, statement, params)
+
+            return cursor.fetchall(), cursor.description
+
+        dados, description = self.__read(read)
+
+        return format_rows(description, dados, row_format)
+    
+    def select_numpy(self, tablename: str, columns: list[str] = ['*'], condition: Filter = None, chunk_size: int = 10000):
+        """
+        Selects data from a specified table into a structured NumPy array.
+
+        Rows are read from an unbuffered cursor and copied chunk by chunk into preallocated
+        column buffers typed from the table's declared types.
+
+        :param tablename: The name of the table to select data from.
+        :param columns: (Optional) A list of column names to select. Defaults to selecting all columns.
+        :param condition: (Optional) A Filter object to specify the conditions for selection.
+        :param chunk_size: (Optional) Number of rows fetched per `fetchmany` call. Defaults to 10000.
+        :return: A structured numpy array with one field per column.
+        :raises ImportError: If numpy is not installed (`pip install manage-sql[numpy]`).
+        """
+
+        return to_structured(self.__select_columns(tablename, columns, condition, chunk_size))
+
+    def select_frame(self, tablename: str, columns: list[str] = ['*'], condition: Filter = None, chunk_size: int = 10000):
+        """
+        Selects data from a specified table into a pandas DataFrame.
+
+        :param tablename: The name of the table to select data from.
+        :param columns: (Optional) A list of column names to select. Defaults to selecting all columns.
+        :param condition: (Optional) A Filter object to specify the conditions for selection.
+        :param chunk_size: (Optional) Number of rows fetched per `fetchmany` call. Defaults to 10000.
+        :return: A pandas DataFrame with one typed column per selected column.
+        :raises ImportError: If pandas is not installed (`pip install manage-sql[pandas]`).
+        """
+
+        return to_frame(self.__select_columns(tablename, columns, condition, chunk_size))
     
     def update_data(self, tablename: str, edit_query: list[ColumnData], condition: Filter = None):
         """
@@ -293,13 +795,13 @@ class MYSQL:
         params: list = [edit.value for edit in edit_query]
 
         if not condition:
-            cursor.execute(f"UPDATE {tablename} SET {columns}", tuple(params))
+            self.__driver.execute(connection, cursor, f"UPDATE {tablename} SET {columns}", tuple(params))
         
         else:
-            condition_query: str = condition._Filter__condition.strip()
-            params.extend(condition._Filter__params)
+            condition_query: str = condition.sql
+            params.extend(condition.params)
 
-            cursor.execute(f"UPDATE {tablename} SET {columns} {condition_query}", tuple(params))
+            self.__driver.execute(connection, cursor, f"UPDATE {tablename} SET {columns} {condition_query}", tuple(params))
         
         connection.commit()
         connection.close()
@@ -319,6 +821,7 @@ class MYSQL:
             cursor.execute(f'ALTER TABLE {tablename} ADD COLUMN {column_details}')
 
             connection.commit()
+            self.__flush()
         
         except:
             pass
@@ -340,6 +843,7 @@ class MYSQL:
             cursor.execute(f'ALTER TABLE {tablename} DROP COLUMN {column_name}')
 
             connection.commit()
+            self.__flush()
         
         except:
             pass
@@ -361,35 +865,350 @@ class MYSQL:
 
         connection.commit()
         connection.close()
+        self.__flush()
     
-    def execute_query(self, query: str):
+    def execute_query(self, query: str, params: tuple | dict | list = None, many: bool = False):
         """
-        Executes a raw SQL query against the database.
+        Executes a raw SQL query against the database. Read-only queries (see `is_read_only`)
+        run on a replica when there are replicas.
 
-        :param query: The SQL query to execute.
-        :return: The result of the query, typically a list of rows.
+        :param query: The SQL query to execute, with `%s` (or `%(name)s`) placeholders.
+        :param params: (Optional) Values bound to the placeholders. With `many=True`, a list of them, one per execution.
+        :param many: (Optional) Runs the query once per item of `params` with `executemany`, in one transaction.
+            INSERTs are sent as a single multi-row statement.
+        :return: A list of rows for a query that returns rows, otherwise the number of rows changed.
         """
 
+        if not many and is_read_only(query):
+            def read(connection, cursor) -> list:
+                cursor.execute(query, params)
+
+                return cursor.fetchall()
+
+            return self.__read(read)
+
+        connection, cursor = self.__connect
+
         try:
-            connection, cursor = self.__connect
+            if many:
+                cursor.executemany(query, params)
 
-            cursor.execute(query)
+            else:
+                cursor.execute(query, params)
+
+            result = cursor.fetchall() if cursor.description is not None else cursor.rowcount
+            connection.commit()
+
+            return result
+
+        except Exception:
+            connection.rollback()
+            raise
 
-            return cursor.fetchall()
-        
         finally:
             connection.close()
+
+            if is_schema_change(query):
+                self.__flush()
+
+    def execute_script(self, script: str) -> None:
+        """
+        Executes several SQL statements separated by `;` in one roundtrip.
+
+        :param script: The SQL statements. Values cannot be bound, use `execute_query` for that.
+        :raises Exception: If one of the statements fails. Statements that commit implicitly (DDL) stay applied.
+        """
+
+        connection, cursor = self.__connect
+
+        try:
+            self.__driver.execute_script(cursor, script)
+            connection.commit()
+
+        except Exception:
+            connection.rollback()
+            raise
+
+        finally:
+            connection.close()
+            self.__flush()
+    
+    def export(self, source: str, path: str, format: str = 'csv', compression: str = None, batch_size: int = 10000) -> dict:
+        """
+        Streams a table or a query to a file without loading it in memory.
+
+        Rows are read from an unbuffered cursor, `batch_size` rows at a time.
+
+        :param source: The name of the table, or a full SELECT query.
+        :param path: Destination file.
+        :param format: (Optional) 'csv' (with header), 'jsonl' or 'parquet' (requires pyarrow). Defaults to 'csv'.
+        :param compression: (Optional) None, 'gzip' or 'zstd' (requires zstandard). For parquet it selects the column codec.
+        :param batch_size: (Optional) Number of rows held in memory at a time. Defaults to 10000.
+        :return: A dict with rows, bytes, seconds, rows_per_second and bytes_per_second of the export.
+        """
+
+        check_format(format=format, compression=compression)
+
+        connection, _ = self.__primary_connect
+
+        try:
+            stream = self.__driver.stream_cursor(connection)
+            stream.execute(as_query(source))
+
+            return export_cursor(stream, path, format, compression, batch_size)
+
+        finally:
+            connection.close()
+    
+    def import_file(
+        self,
+        tablename: str,
+        path: str,
+        format: str = 'csv',
+        mapping: dict[str, str] = None,
+        batch_size: int = 10000,
+        reject_path: str = None,
+        progress: object = None,
+        compression: str = None
+    ) -> dict:
+        """
+        Loads a CSV or JSON Lines file into a table, parsing it incrementally.
+
+        Values are coerced to the column types reported by `tables` and each batch is sent as
+        multi-row `INSERT ... VALUES` statements. Batches that fail are retried row by row, and
+        the rows that still fail are written to `reject_path`.
+
+        :param tablename: The name of the table to insert data into.
+        :param path: Source file. CSV files must have a header row.
+        :param format: (Optional) 'csv' or 'jsonl'. Defaults to 'csv'.
+        :param mapping: (Optional) File field to table column. Defaults to the fields named like a table column.
+        :param batch_size: (Optional) Number of rows per batch. Defaults to 10000.
+        :param reject_path: (Optional) JSON Lines file receiving the bad rows with their line number and error.
+        :param progress: (Optional) Called as `progress(rows, rejected)` after every batch.
+        :param compression: (Optional) None, 'gzip' or 'zstd'.
+        :return: A dict with rows, rejected, bytes, seconds, rows_per_second and bytes_per_second of the import.
+        """
+
+        check_import_format(format=format, compression=compression)
+
+        return import_records(
+            path=path,
+            format=format,
+            types=column_types(self.tables, tablename),
+            write=lambda columns, rows: self.__bulk_insert(tablename, columns, rows),
+            mapping=mapping,
+            batch_size=batch_size,
+            reject_path=reject_path,
+            progress=progress,
+            compression=compression
+        )
     
-    def encrypt_value(self, value) -> str:
+    def encrypt_value(self, value, algorithm: str = 'sha512', **options) -> str:
         """
         Encrypts a given value.
 
         :param value: The value to encrypt.
+        :param algorithm: (Optional) 'sha512' (default, unsalted), or the salted and iterated 'pbkdf2_hmac' or 'scrypt'.
+        :param options: (Optional) Cost of the iterated algorithms: `iterations` and `hash_name` for pbkdf2_hmac, `n`, `r` and `p` for scrypt.
         :return: The encrypted string representation of the value.
         """
 
-        return EncryptValue(value).value_hashed
+        if algorithm == 'sha512' and not options:
+            return EncryptValue(value).value_hashed
+
+        return hash_value(value, algorithm=algorithm, **options)
+
+    def encrypt_values(self, values, workers: int = None, executor: str = 'thread', algorithm: str = 'sha512', **options) -> list[str]:
+        """
+        Encrypts many values in parallel, keeping their order.
+
+        :param values: The values to encrypt.
+        :param workers: (Optional) Pool size. Defaults to the number of CPUs; 1 hashes serially.
+        :param executor: (Optional) 'thread' (default) or 'process'. Threads scale for pbkdf2_hmac and scrypt,
+            which release the GIL; short sha512 inputs only scale with 'process'.
+        :param algorithm: (Optional) 'sha512', 'pbkdf2_hmac' or 'scrypt', see `encrypt_value`.
+        :param options: (Optional) Cost of the iterated algorithms, see `encrypt_value`.
+        :return: One hash per value.
+        """
+
+        return hash_values(values, workers=workers, executor=executor, algorithm=algorithm, **options)
+
+    def verify_value(self, value, hashed: str) -> bool:
+        """
+        Checks a value against a hash returned by `encrypt_value` or `encrypt_values`.
+
+        :param value: The value to check (e.g. the password typed at login).
+        :param hashed: The stored hash. The algorithm, cost and salt are read from it.
+        :return: True when the value matches.
+        """
+
+        return verify_hash(value, hashed)
     
+    def __bulk_insert(self, tablename: str, columns: tuple[str], rows: list[tuple], rows_per_statement: int = 1000) -> None:
+        """
+        Inserts many rows with multi-row `INSERT ... VALUES` statements in a single transaction.
+
+        :raises Exception: Errors are raised to the caller after rolling the rows back.
+        """
+
+        connection, cursor = self.__connect
+        rows = iter(rows)
+
+        try:
+            while True:
+                chunk = list(itertools.islice(rows, rows_per_statement))
+
+                if not chunk:
+                    break
+
+                cursor.execute(
+                    insert_query(tablename, columns, '%s', len(chunk)),
+                    [value for row in chunk for value in row]
+                )
+
+            connection.commit()
+
+        except Exception:
+            connection.rollback()
+            raise
+
+        finally:
+            connection.close()
+    
+    def __select_columns(self, tablename: str, columns: list[str], condition: Filter, chunk_size: int) -> dict:
+        types = column_types(self.tables, tablename)
+        condition_query: str = condition.sql if condition else ''
+        condition_params: tuple = condition.params if condition else None
+
+        connection, cursor = self.__primary_connect
+
+        try:
+            cursor.execute(f"SELECT COUNT(*) FROM {tablename} {condition_query}", condition_params)
+            total = cursor.fetchall()[0][0]
+
+            stream = self.__driver.stream_cursor(connection)
+            stream.execute(f"SELECT {', '.join(columns)} FROM {tablename} {condition_query}", condition_params)
+
+            return fill_columns(stream, types, total, chunk_size)
+
+        finally:
+            connection.close()
+    
+    def __read(self, work: object):
+        """
+        Runs `work(connection, cursor)` on a replica chosen by the router, or on the primary when there is
+        no replica, inside the read-your-writes window, or when the replica fails or lags.
+        """
+
+        index = self.__router.pick() if self.__router is not None else None
+
+        if index is not None:
+            try:
+                with self.__router.using(index, errors=self.__driver.errors):
+                    connection = self.__replica_connect(index)
+
+                    try:
+                        cursor = connection.cursor()
+
+                        if not self.__router.lag_due(index) or self.__router.record_lag(index, self.__replica_lag(cursor)):
+                            return work(connection, cursor)
+
+                    finally:
+                        connection.close()
+
+            except self.__driver.errors:
+                pass
+
+        connection, cursor = self.__primary_connect
+
+        try:
+            return work(connection, cursor)
+
+        finally:
+            connection.close()
+
+    def __replica_connect(self, index: int):
+        if self.__replica_pools:
+            return self.__replica_pools[index].acquire()
+
+        return self.__open_replica(index)
+
+    def __open_replica(self, index: int):
+        host, _, port = self.__replicas[index].partition(':')
+
+        return self.__driver.connect(
+            host = host,
+            port = int(port) if port else self.__port,
+            database = self.__database,
+            user = self.__username,
+            password = self.__password
+        )
+
+    def __new_pool(self, open: object, size: int) -> ConnectionPool | None:
+        if not size:
+            return None
+
+        statements = None
+
+        if self.__prepare_threshold:
+            statements = lambda connection: self.__driver.statements(connection, self.__prepare_threshold, self.__prepared_max, self.__prepared)
+
+        return ConnectionPool(open=open, size=size, reset=self.__driver.reset, statements=statements)
+
+    def __flush(self) -> None:
+        """Drops the pooled connections after a schema change, whose prepared statements may be stale."""
+
+        for pool in [self.__pool, *self.__replica_pools]:
+            if pool is not None:
+                pool.flush()
+
+    def __replica_lag(self, cursor) -> float | None:
+        """`Seconds_Behind_Source` of the replica, 0 on a server that is not a replica, None when replication is stopped."""
+
+        try:
+            cursor.execute('SHOW REPLICA STATUS')
+
+        except self.__driver.ProgrammingError:
+            # Servers before 8.0.22 only know the old name.
+            cursor.execute('SHOW SLAVE STATUS')
+
+        status = cursor.fetchall()
+
+        if not status:
+            return 0.0
+
+        names = [column[0] for column in cursor.description]
+        position = names.index('Seconds_Behind_Source') if 'Seconds_Behind_Source' in names else names.index('Seconds_Behind_Master')
+        seconds = status[0][position]
+
+        return None if seconds is None else float(seconds)
+
+    def __partition_clause(self, partition: Partition) -> str:
+        if partition.method == 'hash':
+            return f'PARTITION BY HASH ({partition.column}) PARTITIONS {partition.modulus}'
+
+        current = period_start(date.today(), partition.interval)
+        definitions = [
+            f"PARTITION {partition_name('p', start, partition.interval)} VALUES LESS THAN ('{next_period(start, partition.interval)}')"
+            for start in (next_period(current, partition.interval, index) for index in range(partition.ahead + 1))
+        ]
+
+        if partition.default:
+            definitions.append(f'PARTITION {MAXVALUE_PARTITION} VALUES LESS THAN (MAXVALUE)')
+
+        return f"PARTITION BY RANGE COLUMNS ({partition.column}) ({', '.join(definitions)})"
+
+    @staticmethod
+    def __read_partitions(cursor, tablename: str) -> list[tuple]:
+        cursor.execute(
+            'SELECT PARTITION_NAME, PARTITION_DESCRIPTION FROM information_schema.PARTITIONS '
+            'WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND PARTITION_NAME IS NOT NULL '
+            'ORDER BY PARTITION_ORDINAL_POSITION',
+            (tablename,)
+        )
+
+        return cursor.fetchall()
+
     def __exception_error(self, message_error: str):
         print(f'Error: {message_error}')
         exit()
\ No newline at end of file
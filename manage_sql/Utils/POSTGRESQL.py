@@ -1,4 +1,7 @@
-import psycopg2 as postgresql
+import functools
+import itertools
+import time
+from datetime import date
 
 try:
     from ..Utils.utils_postgres import (
@@ -7,8 +10,23 @@ try:
         Column,
         ColumnData,
         Filter,
-        EncryptValue
+        EncryptValue,
+        copy_text,
+        SEARCH_COLUMN,
+        TRIGRAM_OPERATORS,
+        Partition,
+        sql_literal
     )
+    from ..Utils.utils_filters import param
+    from ..Utils.utils_partitions import INTERVALS, period_start, next_period, partition_name, partition_start
+    from ..Utils.utils_joins import Join, selection
+    from ..Utils.utils_rows import format_rows, column_types, insert_query, order_clause, aggregate_query
+    from ..Utils.utils_hashing import hash_value, hash_values, verify_hash
+    from ..Utils.utils_replicas import ReplicaRouter, is_read_only
+    from ..Utils.utils_drivers import PostgresDriver
+    from ..Utils.utils_pool import ConnectionPool, PreparedStats, is_schema_change
+    from ..Utils.utils_numpy import fill_columns, to_structured, to_frame
+    from ..Utils.utils_files import as_query, check_format, export_cursor, open_output, report, check_import_format, import_records
 
 except:
     from .utils_postgres import (
@@ -17,8 +35,23 @@ except:
         Column,
         ColumnData,
         Filter,
-        EncryptValue
+        EncryptValue,
+        copy_text,
+        SEARCH_COLUMN,
+        TRIGRAM_OPERATORS,
+        Partition,
+        sql_literal
     )
+    from .utils_filters import param
+    from .utils_partitions import INTERVALS, period_start, next_period, partition_name, partition_start
+    from .utils_joins import Join, selection
+    from .utils_rows import format_rows, column_types, insert_query, order_clause, aggregate_query
+    from .utils_hashing import hash_value, hash_values, verify_hash
+    from .utils_replicas import ReplicaRouter, is_read_only
+    from .utils_drivers import PostgresDriver
+    from .utils_pool import ConnectionPool, PreparedStats, is_schema_change
+    from .utils_numpy import fill_columns, to_structured, to_frame
+    from .utils_files import as_query, check_format, export_cursor, open_output, report, check_import_format, import_records
 
 class POSTGRESQL:
     """
@@ -35,6 +68,9 @@ class POSTGRESQL:
         Column (Column): A reference to the `Column` object.
         filter_by (Filter): A reference to the `Filter` object for filtering.
         delete_by (Filter): A reference to the `Filter` object for deleting.
+        param (param): Named placeholder of a reusable filter, see `Filter.compile`.
+        join (Join): Builds the joined tables of a `select_data` over several tables.
+        Partition (Partition): How `create_table` partitions a table.
         ColumnData (ColumnData): A reference to column data.
         CURRENT_TIMESTAMP (str): String constant for the PostgreSQL current timestamp.
     """
@@ -46,7 +82,17 @@ class POSTGRESQL:
         username: str = None,
         database: str = None,
         password: str = None,
-        port: int = 5432
+        port: int = 5432,
+        replicas: list[str] = None,
+        replica_strategy: str = 'round_robin',
+        read_your_writes: float = 0.0,
+        max_replica_lag: float = None,
+        max_replica_errors: int = 3,
+        driver: str = 'psycopg2',
+        binary: bool = True,
+        pool_size: int = 0,
+        prepare_threshold: int = 5,
+        prepared_max: int = 100
     ):
         """
         Initializes the POSTGRESQL class with optional connection details.
@@ -58,6 +104,22 @@ class POSTGRESQL:
             database (str): The name of the database to connect to.
             password (str): The password for connecting to the database.
             port (int): The port number for PostgreSQL, default is 5432.
+            replicas (list[str], optional): DSNs of read replicas. `select_data`, `tables` and read-only
+                `execute_query` are balanced across them; every write goes to the primary.
+            replica_strategy (str, optional): 'round_robin' (default) or 'least_outstanding'.
+            read_your_writes (float, optional): Seconds after a write during which reads stay on the primary. Defaults to 0.
+            max_replica_lag (float, optional): Replay lag, in seconds, above which a replica is left out for a while.
+            max_replica_errors (int, optional): Consecutive connection errors after which a replica is left out for a while.
+            driver (str, optional): 'psycopg2' (default) or 'psycopg' (psycopg 3, which batches the statements of
+                `insert_rows` and `execute_query(many=True)` in pipeline mode).
+            binary (bool, optional): With psycopg 3, transfers results in binary format. Defaults to True.
+            pool_size (int, optional): Idle connections kept for reuse, per server. Defaults to 0, a new connection per call.
+            prepare_threshold (int, optional): On pooled connections, executions of the same `select_data`, `update_data`,
+                `detele_data` or `insert_*` statement after which it is prepared on the server. None disables it. Defaults to 5.
+            prepared_max (int, optional): Statements tracked per connection; the least recently used is deallocated. Defaults to 100.
+
+        Raises:
+            ImportError: If the driver is not installed (`pip install manage-sql[postgresql]` or `manage-sql[psycopg]`).
         """
 
         self.__postgres_url = postgre_url
@@ -66,82 +128,134 @@ class POSTGRESQL:
         self.__password = password
         self.__database = database
         self.__port = port
+        self.__driver = PostgresDriver(name=driver, binary=binary)
+        self.__replicas: list[str] = list(replicas or [])
+        self.__router = ReplicaRouter(
+            replicas=len(self.__replicas),
+            strategy=replica_strategy,
+            read_your_writes=read_your_writes,
+            max_lag=max_replica_lag,
+            max_errors=max_replica_errors
+        ) if replicas else None
+        self.__prepare_threshold = prepare_threshold
+        self.__prepared_max = prepared_max
+        self.__prepared = PreparedStats()
+        self.__pool = self.__new_pool(self.__open, pool_size)
+        self.__replica_pools = [
+            self.__new_pool(functools.partial(self.__driver.connect, dsn=replica), pool_size)
+            for replica in self.__replicas
+        ] if pool_size else []
         self.Column_types = Types()
         self.Column = Column
         self.filter_by = Filter
         self.delete_by = Filter
+        self.param = param
+        self.join = Join
+        self.Partition = Partition
         self.ColumnData = ColumnData
         self.CURRENT_TIMESTAMP = 'CURRENT_TIMESTAMP'
     
     @property
     def __connect(self):
         """
-        Private property that establishes a connection to the PostgreSQL database.
+        Private property that opens a connection to the primary for a write.
+
+        Returns:
+            tuple: A connection object and a cursor object.
+        """
+
+        if self.__router is not None:
+            self.__router.wrote()
+
+        return self.__primary_connect
+
+    @property
+    def replicas_status(self) -> list[dict]:
+        """
+        The outstanding reads, consecutive errors and health of each replica, in the order of `replicas`.
+
+        Returns:
+            list[dict]: Empty when no replica is configured.
+        """
+
+        return self.__router.status() if self.__router is not None else []
+
+    @property
+    def prepared_statements(self) -> dict:
+        """
+        Counters of the statements run through server-side prepared statements on pooled connections.
+
+        Returns:
+            dict: executions, hits (a prepared statement reused), prepares, misses (not hot yet), evictions and hit_rate.
+        """
+
+        return self.__prepared.snapshot()
+
+    def close(self) -> None:
+        """Closes the pooled connections. Connections in use are closed when they are released."""
+
+        self.__flush()
+
+    @property
+    def __primary_connect(self):
+        """
+        Private property that takes a pooled connection to the PostgreSQL database, or opens one.
 
         Returns:
             tuple: A connection object and a cursor object.
         """
 
+        connection = self.__pool.acquire() if self.__pool is not None else self.__open()
+
+        return connection, self.__driver.cursor(connection)
+
+    def __open(self):
+        """
+        Private method that establishes a connection to the PostgreSQL database.
+
+        Returns:
+            connection: A driver connection in autocommit mode.
+        """
+
         def connect_with_url():
-            connection = postgresql.connect(
+            return self.__driver.connect(
                 dsn=self.__postgres_url
             )
 
-            connection.autocommit = True
-
-            return connection
-
         def connect_without_database():
-            connection = postgresql.connect(
+            return self.__driver.connect(
                 host = self.__host,
                 port = self.__port,
                 user = self.__username,
                 password = self.__password
             )
-            
-            connection.autocommit = True
-            return connection
         
         def connect_with_database():
-            connection = postgresql.connect(
+            return self.__driver.connect(
                 host = self.__host,
                 port = self.__port,
-                database = self.__database,
+                dbname = self.__database,
                 user = self.__username,
                 password = self.__password
             )
-
-            connection.autocommit = True
-            return connection
         
         if self.__postgres_url != None:
-            connection = connect_with_url()
-
-            cursor = connection.cursor()
-            return connection, cursor
+            return connect_with_url()
         
         else:
             if not self.__database:
-                connection = connect_without_database()
-
-                cursor = connection.cursor()
-                return connection, cursor
+                return connect_without_database()
             
             else:
                 try:
-                    connection = connect_with_database()
-
-                    cursor = connection.cursor()
-                    return connection, cursor
+                    return connect_with_database()
                 
                 except:
                     try:
                         connection = connect_without_database()
                         connection.cursor().execute(f'CREATE DATABASE IF NOT EXISTS {self.__database}')
 
-                        connection = connect_with_database()
-                        cursor = connection.cursor()
-                        return connection, cursor
+                        return connect_with_database()
                     
                     except Exception as e:
                         self.__exception_error(message_error=e)
@@ -157,11 +271,14 @@ class POSTGRESQL:
         Returns:
             list[Table]: A list of Table objects representing the database tables.
         """
-        
-        connection, cursor = self.__connect
-            
+
+        return self.__read(self.__read_tables)
+
+    def __read_tables(self, connection, cursor) -> list[Table]:
+        # The partitions of a partitioned table are listed with it, not as tables.
         cursor.execute(
-            "SELECT table_name FROM information_schema.tables WHERE table_schema='public'"
+            "SELECT table_name FROM information_schema.tables WHERE table_schema='public' "
+            "AND table_name NOT IN (SELECT relname FROM pg_class WHERE relispartition)"
         )
 
         tables = cursor.fetchall()
@@ -206,8 +323,6 @@ class POSTGRESQL:
                     )
                 
                 db_tables.append(table_info)
-        
-        connection.close()
 
         return db_tables
     
@@ -221,6 +336,8 @@ class POSTGRESQL:
         """
 
         try:
+            # The server refuses to drop a database with open connections.
+            self.__flush()
             connection, cursor = self.__connect
 
             if self.__database != None:
@@ -235,16 +352,22 @@ class POSTGRESQL:
         finally:
             connection.close()
     
-    def create_table(self, tablename: str, columns: list[Column]) -> None:
+    def create_table(self, tablename: str, columns: list[Column], partition_by: Partition = None) -> None:
         """
         Creates a new table in the database with the specified columns.
 
         Args:
             tablename (str): The name of the table to be created.
             columns (list[Column]): A list of Column objects representing the table schema.
+            partition_by (Partition, optional): Partitions the table and creates its partitions. The primary key
+                becomes (id, partition key), as PostgreSQL requires. Defaults to None, a plain table.
 
         Raises:
             Exception: If there's an error in creating the table.
+
+        Example:
+            >>> db.create_table('events', [db.Column('created_at', db.Column_types.DateTime.timestamp)],
+            ...                 partition_by=db.Partition('created_at', interval='month', ahead=3))
         """
 
         try:
@@ -252,22 +375,195 @@ class POSTGRESQL:
                 Column(
                     name='id',
                     column_type=self.Column_types.Integer.serial,
-                    primary_key=True
+                    primary_key=partition_by is None
                 ),
                 *columns
             ]
 
             all_columns = ', '.join(column.column_parameters for column in columns_details)
+
+            if partition_by is not None:
+                all_columns += f', PRIMARY KEY (id, {partition_by.column})'
             
             connection, cursor = self.__connect
             cursor.execute(
-                f'CREATE TABLE IF NOT EXISTS {tablename} ({all_columns})'
+                f"CREATE TABLE IF NOT EXISTS {tablename} ({all_columns}){' ' + partition_by.clause if partition_by else ''}"
             )
 
             connection.close()
+
+            if partition_by is not None:
+                self.__create_partitions(tablename, partition_by)
+
+            for column in columns:
+                if column.trigram:
+                    self.create_index(tablename=tablename, columns=column.name, trigram=column.trigram)
         
         except Exception as e:
             self.__exception_error(message_error=e)
+
+    def partitions(self, tablename: str) -> list[dict]:
+        """
+        Lists the partitions of a partitioned table.
+
+        Args:
+            tablename (str): The name of the partitioned table.
+
+        Returns:
+            list[dict]: The `name` and `bound` (e.g. "FOR VALUES FROM ('2024-01-01') TO ('2024-02-01')") of each partition.
+        """
+
+        rows = self.__read(lambda connection, cursor: self.__read_partitions(cursor, tablename))
+
+        return [{'name': name, 'bound': bound} for name, bound in rows]
+
+    def maintain_partitions(
+        self,
+        tablename: str,
+        interval: str = 'month',
+        ahead: int = 3,
+        retention: int = None,
+        expired: str = 'detach'
+    ) -> dict:
+        """
+        Keeps the partitions of a table partitioned by range on a date or timestamp: creates the current
+        interval and the `ahead` next ones, and detaches or drops the ones older than `retention` intervals,
+        which removes their rows without a DELETE. Run it periodically (e.g. daily from a scheduler).
+
+        Only the partitions named by `create_table` or by this method (`<tablename>_p2024_01`) are expired.
+
+        Args:
+            tablename (str): The name of the partitioned table.
+            interval (str, optional): 'day', 'week', 'month' (default) or 'year', the one of its `Partition`.
+            ahead (int, optional): Future intervals to create in advance. Defaults to 3.
+            retention (int, optional): Past intervals kept besides the current one. Defaults to None, keeps all.
+            expired (str, optional): 'detach' (default) keeps an expired partition as a standalone table,
+                to archive it; 'drop' deletes it.
+
+        Returns:
+            dict: The names of the partitions 'created', 'detached' and 'dropped'.
+
+        Example:
+            >>> db.maintain_partitions('events', interval='month', ahead=3, retention=12, expired='drop')
+            {'created': ['events_p2025_02'], 'detached': [], 'dropped': ['events_p2024_01']}
+        """
+
+        if interval not in INTERVALS:
+            raise ValueError(f'O `interval` deve ser um de {INTERVALS}, e não {interval!r}.')
+
+        if expired not in ('detach', 'drop'):
+            raise ValueError(f"O `expired` deve ser 'detach' ou 'drop', e não {expired!r}.")
+
+        current = period_start(date.today(), interval)
+        result = {'created': [], 'detached': [], 'dropped': []}
+        connection, cursor = self.__connect
+
+        try:
+            existing = [name for name, _ in self.__read_partitions(cursor, tablename)]
+
+            for index in range(ahead + 1):
+                start = next_period(current, interval, index)
+                name = partition_name(f'{tablename}_p', start, interval)
+
+                if name not in existing:
+                    cursor.execute(
+                        f'CREATE TABLE IF NOT EXISTS {name} PARTITION OF {tablename} '
+                        f'FOR VALUES FROM ({sql_literal(start)}) TO ({sql_literal(next_period(start, interval))})'
+                    )
+                    result['created'].append(name)
+
+            if retention is not None:
+                cutoff = next_period(current, interval, -retention)
+
+                for name in existing:
+                    start = partition_start(f'{tablename}_p', name)
+
+                    if start is None or next_period(start, interval) > cutoff:
+                        continue
+
+                    if expired == 'drop':
+                        cursor.execute(f'DROP TABLE IF EXISTS {name}')
+                        result['dropped'].append(name)
+
+                    else:
+                        cursor.execute(f'ALTER TABLE {tablename} DETACH PARTITION {name}')
+                        result['detached'].append(name)
+
+        finally:
+            connection.close()
+
+            if any(result.values()):
+                self.__flush()
+
+        return result
+
+    def create_index(
+        self,
+        tablename: str,
+        columns: str | list[str],
+        name: str = None,
+        unique: bool = False,
+        trigram: str = None
+    ) -> None:
+        """
+        Creates an index on a table, if it does not exist yet.
+
+        Args:
+            tablename (str): The name of the table.
+            columns (str | list[str]): The indexed column(s).
+            name (str, optional): Name of the index. Defaults to `<tablename>_<columns>_idx` (`_trgm` for a trigram index).
+            unique (bool, optional): Rejects duplicate values. Defaults to False.
+            trigram (str, optional): 'gin' or 'gist' for a pg_trgm index, which serves `CONTAIN`, `NOT_CONTAIN`
+                and `SIMILAR_TO` filters on text columns; the extension is created if needed. GIN is faster to
+                read, GiST faster to update. Defaults to None, a B-tree index.
+
+        Example:
+            >>> db.create_index('users', 'email', unique=True)
+            >>> db.create_index('users', 'name', trigram='gin')
+            >>> db.select_data('users', condition=db.filter_by('name').CONTAIN('silva', ignore_case=True))
+        """
+
+        columns = [columns] if isinstance(columns, str) else list(columns)
+
+        if trigram is not None and trigram not in TRIGRAM_OPERATORS:
+            raise ValueError(f'O `trigram` deve ser um de {tuple(TRIGRAM_OPERATORS)}, e não {trigram!r}.')
+
+        if trigram and unique:
+            raise ValueError('Um índice de trigramas não pode ser `unique`.')
+
+        name = name or f"{tablename}_{'_'.join(columns)}_{'trgm' if trigram else 'idx'}"
+        indexed = ', '.join(f'{column} {TRIGRAM_OPERATORS[trigram]}' if trigram else column for column in columns)
+        connection, cursor = self.__connect
+
+        try:
+            if trigram:
+                cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+            cursor.execute(
+                f"CREATE {'UNIQUE ' if unique else ''}INDEX IF NOT EXISTS {name} ON {tablename}"
+                f"{f' USING {trigram.upper()}' if trigram else ''} ({indexed})"
+            )
+
+        finally:
+            connection.close()
+            self.__flush()
+
+    def drop_index(self, name: str) -> None:
+        """
+        Drops an index, if it exists.
+
+        Args:
+            name (str): The name of the index.
+        """
+
+        connection, cursor = self.__connect
+
+        try:
+            cursor.execute(f'DROP INDEX IF EXISTS {name}')
+
+        finally:
+            connection.close()
+            self.__flush()
     
     def insert_data(self, tablename: str, insert_query: list[ColumnData]) -> None:
         """
@@ -288,8 +584,8 @@ class POSTGRESQL:
         try:
             connection, cursor = self.__connect
 
-            cursor.execute(
-                f'INSERT INTO {tablename} ({columns}) VALUES ({key})', tuple(params)
+            self.__driver.execute(
+                connection, cursor, f'INSERT INTO {tablename} ({columns}) VALUES ({key})', tuple(params)
             )
 
             connection.commit()
@@ -298,6 +594,42 @@ class POSTGRESQL:
         except Exception as e:
             self.__exception_error(message_error=e)
     
+    def insert_row(self, tablename: str, mapping: dict) -> None:
+        """
+        Inserts one row given as a dict, without building a ColumnData per value.
+
+        Args:
+            tablename (str): The name of the table where data will be inserted.
+            mapping (dict): Column name to value.
+
+        Raises:
+            Exception: The driver's error, e.g. an IntegrityError on a constraint violation.
+        """
+
+        connection, cursor = self.__connect
+
+        try:
+            self.__driver.execute(connection, cursor, insert_query(tablename, tuple(mapping), '%s'), tuple(mapping.values()))
+
+        finally:
+            connection.close()
+
+    def insert_rows(self, tablename: str, columns: list[str], rows: list[tuple]) -> None:
+        """
+        Inserts many rows with multi-row `INSERT ... VALUES` statements in one transaction.
+
+        Args:
+            tablename (str): The name of the table where data will be inserted.
+            columns (list[str]): Column names, in the order of the values in each row.
+            rows (list[tuple]): The rows to insert. Any iterable of tuples (e.g. a generator) is accepted.
+
+        Raises:
+            Exception: The driver's error, e.g. an IntegrityError when one row violates a constraint.
+                No row is inserted in that case.
+        """
+
+        self.__insert_values(tablename, tuple(columns), rows)
+
     def detele_data(self, tablename: str, condition: Filter = None):
         """
         Deletes data from a specified table, optionally filtered by a condition.
@@ -316,43 +648,277 @@ class POSTGRESQL:
             cursor.execute(f'DELETE FROM {tablename}')
         
         else:
-            condition_query = condition._Filter__condition.strip()
-            condition_params = condition._Filter__params
+            condition_query = condition.sql
+            condition_params = condition.params
 
-            cursor.execute(f'DELETE FROM {tablename} {condition_query}', tuple(condition_params))
+            self.__driver.execute(connection, cursor, f'DELETE FROM {tablename} {condition_query}', tuple(condition_params))
         
         connection.commit()
         connection.close()
     
-    def select_data(self, tablename: str, columns: list[str] = ['*'], condition: Filter = None):
+    def select_data(
+        self,
+        tablename: str | Join,
+        columns: list[str] = ['*'],
+        condition: Filter = None,
+        row_format: str = 'tuple',
+        order_by: str | list[str] = None,
+        descending: bool = False
+    ):
         """
         Selects data from a specified table.
 
         Args:
-            tablename (str): The name of the table to select data from.
-            columns (list[str], optional): A list of columns to retrieve. Defaults to all columns.
+            tablename (str | Join): The name of the table to select data from, or a `join` of several tables.
+            columns (list[str], optional): A list of columns to retrieve. Defaults to all columns. Over a join, write
+                them as `table.column`; a name selected twice comes back as `table_column`.
             condition (Filter, optional): A Filter object for query conditions.
+            row_format (str, optional): 'tuple' (default), 'dict', 'namedtuple' or 'columns' (a dict of column name to list or `array.array`).
+            order_by (str | list[str], optional): Column(s) to sort the result by.
+            descending (bool, optional): Sorts in descending order. Defaults to False.
 
         Returns:
-            list: A list of tuples containing the fetched rows.
+            list | dict: The fetched rows in the requested format.
         """
 
+        order_query: str = order_clause(order_by, descending)
+        columns = selection(tablename, columns)
+
+        def select(connection, cursor) -> tuple:
+            if not condition:
+                cursor = self.__driver.execute(connection, cursor, f"SELECT {', '.join(columns)} FROM {tablename}{order_query}")
+
+            else:
+                condition_query: str = condition.sql
+                condition_params: tuple = condition.params
+
+                cursor = self.__driver.execute(
+                    connection, cursor, f"SELECT {', '.join(columns)} FROM {tablename} {condition_query}{order_query}", tuple(condition_params)
+                )
+
+            return cursor.fetchall(), cursor.description
+
+        dados, description = self.__read(select)
+
+        return format_rows(description, dados, row_format)
+
+
+    def aggregate(
+        self,
+        tablename: str | Join,
+        aggregates: dict[str, tuple[str, str]],
+        group_by: str | list[str] = None,
+        condition: Filter = None,
+        having: Filter = None,
+        row_format: str = 'dict',
+        order_by: str | list[str] = None,
+        descending: bool = False
+    ):
+        """
+        Computes aggregates in the database with a single `SELECT ... GROUP BY`, instead of fetching the rows.
+        Runs on a replica when there are replicas.
+
+        Args:
+            tablename (str): The name of the table to aggregate.
+            aggregates (dict[str, tuple[str, str]]): Alias to (function, column). The function is 'count',
+                'count_distinct', 'sum', 'avg', 'min' or 'max'; the column may be '*' for 'count'.
+            group_by (str | list[str], optional): Column(s) to group by, first in each row. Without them there is one row.
+            condition (Filter, optional): Rows to aggregate.
+            having (Filter, optional): Groups to keep, e.g. `filter_by('total').GATHER_THAN(100)` on an alias.
+            row_format (str, optional): 'dict' (default), 'tuple', 'namedtuple' or 'columns'.
+            order_by (str | list[str], optional): Group column(s) or alias(es) to sort the result by.
+            descending (bool, optional): Sorts in descending order. Defaults to False.
+
+        Returns:
+            list | dict: One row per group, in the requested format.
+
+        Example:
+            >>> db.aggregate('orders', {'total': ('sum', 'price'), 'orders': ('count', '*')}, group_by='customer_id')
+        """
+
+        query, params = aggregate_query(tablename, aggregates, group_by, condition, having, order_by, descending)
+
+        def read(connection, cursor) -> tuple:
+            cursor = self.__driver.execute(connection, cursor, query, params)
+
+            return cursor.fetchall(), cursor.description
+
+        dados, description = self.__read(read)
+
+        return format_rows(description, dados, row_format)
+
+    def count(self, tablename: str | Join, condition: Filter = None) -> int:
+        """
+        Counts the rows of a table with `SELECT COUNT(*)`.
+
+        Args:
+            tablename (str): The name of the table.
+            condition (Filter, optional): Rows to count. Defaults to every row.
+
+        Returns:
+            int: The number of rows.
+        """
+
+        query = f"SELECT COUNT(*) FROM {tablename} {condition.sql if condition else ''}".rstrip()
+        params = condition.params if condition else None
+
+        return self.__read(lambda connection, cursor: self.__driver.execute(connection, cursor, query, params).fetchall())[0][0]
+
+    def exists(self, tablename: str | Join, condition: Filter = None) -> bool:
+        """
+        Whether a table has a row matching `condition`, with `SELECT 1 ... LIMIT 1`, which stops at the first match.
+
+        Args:
+            tablename (str): The name of the table.
+            condition (Filter, optional): Row to look for. Defaults to any row.
+
+        Returns:
+            bool: True when at least one row matches.
+        """
+
+        query = f"SELECT 1 FROM {tablename} {condition.sql + ' ' if condition else ''}LIMIT 1"
+        params = condition.params if condition else None
+
+        return len(self.__read(lambda connection, cursor: self.__driver.execute(connection, cursor, query, params).fetchall())) > 0
+
+    def create_search_index(self, tablename: str, columns: list[str], language: str = 'simple') -> None:
+        """
+        Creates the full-text index of `search` and `Filter.MATCH`: a generated `search_vector`
+        tsvector column, which PostgreSQL keeps up to date on every write, with a GIN index.
+        Adding the column rewrites the table once.
+
+        Args:
+            tablename (str): The name of the table to index.
+            columns (list[str]): The text columns searched. The first ones weigh more in the rank
+                (weights A, B, C, then D for the rest).
+            language (str, optional): Text search configuration, e.g. 'portuguese' to match word stems.
+                Defaults to 'simple'. `search` and `MATCH` must use the same one.
+
+        Example:
+            >>> db.create_search_index('posts', ['title', 'body'], language='portuguese')
+            >>> db.search('posts', 'banco de dados', columns=['id', 'title'], language='portuguese')
+        """
+
+        document = ' || '.join(
+            f"setweight(to_tsvector('{language}', coalesce({column}::text, '')), '{'ABCD'[min(index, 3)]}')"
+            for index, column in enumerate(columns)
+        )
         connection, cursor = self.__connect
 
-        if not condition:
-            cursor.execute(f'SELECT {', '.join(columns)} FROM {tablename}')
+        try:
+            cursor.execute(f'ALTER TABLE {tablename} ADD COLUMN IF NOT EXISTS {SEARCH_COLUMN} tsvector GENERATED ALWAYS AS ({document}) STORED')
+            cursor.execute(f'CREATE INDEX IF NOT EXISTS {tablename}_{SEARCH_COLUMN}_idx ON {tablename} USING GIN ({SEARCH_COLUMN})')
 
-        else:
-            condition_query: str = condition._Filter__condition.strip()
-            condition_params: list = condition._Filter__params
+            connection.commit()
 
-            cursor.execute(f'SELECT {', '.join(columns)} FROM {tablename} {condition_query}', tuple(condition_params))
+        finally:
+            connection.close()
+            self.__flush()
 
-        dados = cursor.fetchall()
+    def drop_search_index(self, tablename: str) -> None:
+        """
+        Drops the full-text index of a table, its `search_vector` column and GIN index.
 
-        connection.close()
+        Args:
+            tablename (str): The name of the indexed table.
+        """
+
+        connection, cursor = self.__connect
+
+        try:
+            cursor.execute(f'ALTER TABLE {tablename} DROP COLUMN IF EXISTS {SEARCH_COLUMN}')
+
+            connection.commit()
 
-        return dados
+        finally:
+            connection.close()
+            self.__flush()
+
+    def search(
+        self,
+        tablename: str,
+        query: str,
+        columns: list[str] = ['*'],
+        condition: Filter = None,
+        limit: int = 20,
+        row_format: str = 'dict',
+        language: str = 'simple'
+    ):
+        """
+        Full-text search in the index of `create_search_index`, best matches first. Runs on a replica when there are replicas.
+
+        Args:
+            tablename (str): The name of the indexed table.
+            query (str): Words to look for, with the `websearch_to_tsquery` syntax: `a b` (both), `a or b`,
+                `"a b"` (phrase), `-a` (without).
+            columns (list[str], optional): Columns to return. Defaults to all columns ('*'), `search_vector` included.
+            condition (Filter, optional): Filter on the matched rows.
+            limit (int, optional): Maximum number of rows. Defaults to 20.
+            row_format (str, optional): 'dict' (default), 'tuple', 'namedtuple' or 'columns'.
+            language (str, optional): Text search configuration of the index. Defaults to 'simple'.
+
+        Returns:
+            list | dict: The matched rows with a last column `rank`, the `ts_rank` relevance (higher is better).
+        """
+
+        selected = ', '.join(f'{tablename}.*' if column == '*' else column for column in columns)
+        statement = (
+            f'SELECT {selected}, ts_rank({tablename}.{SEARCH_COLUMN}, search.query) AS rank '
+            f'FROM {tablename}, websearch_to_tsquery(%s::regconfig, %s) AS search(query) '
+            f"WHERE {tablename}.{SEARCH_COLUMN} @@ search.query {'AND (' + condition.sql.removeprefix('WHERE ') + ') ' if condition else ''}"
+            f'ORDER BY rank DESC LIMIT %s'
+        )
+        params = (language, query, *(condition.params if condition else ()), limit)
+
+        def read(connection, cursor) -> tuple:
+            cursor = self.__driver.execute(connection, cursor, statement, params)
+
+            return cursor.fetchall(), cursor.description
+
+        dados, description = self.__read(read)
+
+        return format_rows(description, dados, row_format)
+    
+    def select_numpy(self, tablename: str, columns: list[str] = ['*'], condition: Filter = None, chunk_size: int = 10000):
+        """
+        Selects data from a specified table into a structured NumPy array.
+
+        Rows are streamed through a server-side cursor and copied chunk by chunk into
+        preallocated column buffers typed from the table's declared types.
+
+        Args:
+            tablename (str): The name of the table to select data from.
+            columns (list[str], optional): A list of columns to retrieve. Defaults to all columns.
+            condition (Filter, optional): A Filter object for query conditions.
+            chunk_size (int, optional): Number of rows fetched per roundtrip. Defaults to 10000.
+
+        Returns:
+            numpy.ndarray: A structured array with one field per column.
+
+        Raises:
+            ImportError: If numpy is not installed (`pip install manage-sql[numpy]`).
+        """
+
+        return to_structured(self.__select_columns(tablename, columns, condition, chunk_size))
+
+    def select_frame(self, tablename: str, columns: list[str] = ['*'], condition: Filter = None, chunk_size: int = 10000):
+        """
+        Selects data from a specified table into a pandas DataFrame.
+
+        Args:
+            tablename (str): The name of the table to select data from.
+            columns (list[str], optional): A list of columns to retrieve. Defaults to all columns.
+            condition (Filter, optional): A Filter object for query conditions.
+            chunk_size (int, optional): Number of rows fetched per roundtrip. Defaults to 10000.
+
+        Returns:
+            pandas.DataFrame: One typed column per selected column.
+
+        Raises:
+            ImportError: If pandas is not installed (`pip install manage-sql[pandas]`).
+        """
+
+        return to_frame(self.__select_columns(tablename, columns, condition, chunk_size))
     
     def update_data(self, tablename: str, edit_query: list[ColumnData], condition: Filter = None):
         """
@@ -372,13 +938,13 @@ class POSTGRESQL:
         params: list = [edit.value for edit in edit_query]
 
         if not condition:
-            cursor.execute(f"UPDATE {tablename} SET {columns}", tuple(params))
+            self.__driver.execute(connection, cursor, f"UPDATE {tablename} SET {columns}", tuple(params))
         
         else:
-            condition_query: str = condition._Filter__condition.strip()
-            params.extend(condition._Filter__params)
+            condition_query: str = condition.sql
+            params.extend(condition.params)
 
-            cursor.execute(f"UPDATE {tablename} SET {columns} {condition_query}", tuple(params))
+            self.__driver.execute(connection, cursor, f"UPDATE {tablename} SET {columns} {condition_query}", tuple(params))
         
         connection.commit()
         connection.close()
@@ -401,6 +967,10 @@ class POSTGRESQL:
             cursor.execute(f'ALTER TABLE {tablename} ADD COLUMN {column_details}')
 
             connection.commit()
+            self.__flush()
+
+            if column.trigram:
+                self.create_index(tablename=tablename, columns=column.name, trigram=column.trigram)
         
         except:
             pass
@@ -425,6 +995,7 @@ class POSTGRESQL:
             cursor.execute(f'ALTER TABLE {tablename} DROP COLUMN {column_name}')
 
             connection.commit()
+            self.__flush()
         
         except:
             pass
@@ -449,41 +1020,409 @@ class POSTGRESQL:
 
         connection.commit()
         connection.close()
+        self.__flush()
     
-    def encrypt_value(self, value) -> str:
+    def export(self, source: str, path: str, format: str = 'csv', compression: str = None, batch_size: int = 10000) -> dict:
+        """
+        Streams a table or a query to a file without loading it in memory.
+
+        CSV exports use `COPY ... TO STDOUT`, so the server formats the rows. The other
+        formats read through a server-side cursor, `batch_size` rows at a time.
+
+        Args:
+            source (str): The name of the table, or a full SELECT query.
+            path (str): Destination file.
+            format (str, optional): 'csv' (with header), 'jsonl' or 'parquet' (requires pyarrow). Defaults to 'csv'.
+            compression (str, optional): None, 'gzip' or 'zstd' (requires zstandard). For parquet it selects the column codec.
+            batch_size (int, optional): Number of rows held in memory at a time. Defaults to 10000.
+
+        Returns:
+            dict: rows, bytes, seconds, rows_per_second and bytes_per_second of the export.
+        """
+
+        check_format(format=format, compression=compression)
+
+        query = as_query(source)
+        connection, cursor = self.__primary_connect
+
+        try:
+            if format == 'csv':
+                start = time.perf_counter()
+
+                with open_output(path=path, compression=compression) as file:
+                    self.__driver.copy_to(cursor, f'COPY ({query}) TO STDOUT WITH (FORMAT csv, HEADER true)', file)
+
+                return report(rows=cursor.rowcount, path=path, start=start)
+
+            stream = self.__driver.cursor(connection, name='manage_sql_export', itersize=batch_size)
+
+            try:
+                stream.execute(query)
+
+                return export_cursor(stream, path, format, compression, batch_size)
+
+            finally:
+                stream.close()
+
+        finally:
+            connection.close()
+
+    def import_file(
+        self,
+        tablename: str,
+        path: str,
+        format: str = 'csv',
+        mapping: dict[str, str] = None,
+        batch_size: int = 10000,
+        reject_path: str = None,
+        progress: object = None,
+        compression: str = None
+    ) -> dict:
+        """
+        Loads a CSV or JSON Lines file into a table, parsing it incrementally.
+
+        Values are coerced to the column types reported by `tables` and each batch is sent
+        with `COPY ... FROM STDIN`. Batches that fail are retried row by row, and the rows
+        that still fail are written to `reject_path`.
+
+        Args:
+            tablename (str): The name of the table where data will be inserted.
+            path (str): Source file. CSV files must have a header row.
+            format (str, optional): 'csv' or 'jsonl'. Defaults to 'csv'.
+            mapping (dict[str, str], optional): File field to table column. Defaults to the fields named like a table column.
+            batch_size (int, optional): Number of rows per COPY. Defaults to 10000.
+            reject_path (str, optional): JSON Lines file receiving the bad rows with their line number and error.
+            progress (callable, optional): Called as `progress(rows, rejected)` after every batch.
+            compression (str, optional): None, 'gzip' or 'zstd'.
+
+        Returns:
+            dict: rows, rejected, bytes, seconds, rows_per_second and bytes_per_second of the import.
+        """
+
+        check_import_format(format=format, compression=compression)
+
+        return import_records(
+            path=path,
+            format=format,
+            types=column_types(self.tables, tablename),
+            write=lambda columns, rows: self.__bulk_insert(tablename, columns, rows),
+            mapping=mapping,
+            batch_size=batch_size,
+            reject_path=reject_path,
+            progress=progress,
+            compression=compression
+        )
+
+    def encrypt_value(self, value, algorithm: str = 'sha512', **options) -> str:
         """
         Encrypts a given value.
 
         Args:
             value: The value to encrypt.
+            algorithm (str, optional): 'sha512' (default, unsalted), or the salted and iterated 'pbkdf2_hmac' or 'scrypt'.
+            **options: Cost of the iterated algorithms: `iterations` and `hash_name` for pbkdf2_hmac, `n`, `r` and `p` for scrypt.
 
         Returns:
             str: The encrypted value.
         """
 
-        return EncryptValue(value).value_hashed
+        if algorithm == 'sha512' and not options:
+            return EncryptValue(value).value_hashed
+
+        return hash_value(value, algorithm=algorithm, **options)
+
+    def encrypt_values(self, values, workers: int = None, executor: str = 'thread', algorithm: str = 'sha512', **options) -> list[str]:
+        """
+        Encrypts many values in parallel, keeping their order.
+
+        Args:
+            values (Iterable[str]): The values to encrypt.
+            workers (int, optional): Pool size. Defaults to the number of CPUs; 1 hashes serially.
+            executor (str, optional): 'thread' (default) or 'process'. Threads scale for pbkdf2_hmac and scrypt,
+                which release the GIL; short sha512 inputs only scale with 'process'.
+            algorithm (str, optional): 'sha512', 'pbkdf2_hmac' or 'scrypt', see `encrypt_value`.
+            **options: Cost of the iterated algorithms, see `encrypt_value`.
 
-    def execute_query(self, query: str):
+        Returns:
+            list[str]: One hash per value.
         """
-        Executes a raw SQL query.
+
+        return hash_values(values, workers=workers, executor=executor, algorithm=algorithm, **options)
+
+    def verify_value(self, value, hashed: str) -> bool:
+        """
+        Checks a value against a hash returned by `encrypt_value` or `encrypt_values`.
 
         Args:
-            query (str): The raw SQL query to execute.
+            value: The value to check (e.g. the password typed at login).
+            hashed (str): The stored hash. The algorithm, cost and salt are read from it.
 
         Returns:
-            list: A list of tuples representing the result of the query.
+            bool: True when the value matches.
+        """
+
+        return verify_hash(value, hashed)
+
+    def execute_query(self, query: str, params: tuple | dict | list = None, many: bool = False):
         """
+        Executes a raw SQL query. Read-only queries (see `is_read_only`) run on a replica when there are replicas.
+
+        Args:
+            query (str): The raw SQL query to execute, with `%s` (or `%(name)s`) placeholders.
+            params (tuple | dict | list, optional): Values bound to the placeholders. With `many=True`,
+                a list of them, one per execution.
+            many (bool, optional): Runs the query once per item of `params` with `executemany`, in one transaction.
+
+        Returns:
+            list | int: A list of tuples for a query that returns rows, otherwise the number of rows changed.
+
+        Example:
+            >>> db.execute_query('SELECT * FROM users WHERE age > %s', (30,))
+            >>> db.execute_query('UPDATE users SET age = %s WHERE id = %s', [(36, 1), (41, 2)], many=True)
+        """
+
+        if not many and is_read_only(query):
+            def read(connection, cursor) -> list:
+                cursor.execute(query, params)
+
+                return cursor.fetchall()
+
+            return self.__read(read)
+
+        connection, cursor = self.__connect
 
         try:
-            connection, cursor = self.__connect
+            if many:
+                connection.autocommit = False
 
-            cursor.execute(query)
+                try:
+                    cursor.executemany(query, params)
+                    connection.commit()
+
+                except Exception:
+                    connection.rollback()
+                    raise
+
+            else:
+                cursor.execute(query, params)
 
-            return cursor.fetchall()
+            return cursor.fetchall() if cursor.description is not None else cursor.rowcount
         
         finally:
             connection.close()
+
+            if is_schema_change(query):
+                self.__flush()
+
+    def execute_script(self, script: str) -> None:
+        """
+        Executes several SQL statements separated by `;` in one roundtrip, as a single transaction.
+
+        Args:
+            script (str): The SQL statements. Values cannot be bound, use `execute_query` for that.
+
+        Raises:
+            Exception: If one of the statements fails; none of them is applied.
+        """
+
+        connection, cursor = self.__connect
+
+        try:
+            # Without parameters psycopg2 sends the text as one simple query, which the server runs in one implicit transaction.
+            cursor.execute(script)
+
+        finally:
+            connection.close()
+            self.__flush()
+    
+    def __create_partitions(self, tablename: str, partition: Partition) -> None:
+        if partition.method == 'range':
+            self.maintain_partitions(tablename, partition.interval, partition.ahead)
+
+        connection, cursor = self.__connect
+
+        try:
+            if partition.method == 'list':
+                for suffix, values in partition.values.items():
+                    cursor.execute(
+                        f'CREATE TABLE IF NOT EXISTS {tablename}_{suffix} PARTITION OF {tablename} '
+                        f"FOR VALUES IN ({', '.join(sql_literal(value) for value in values)})"
+                    )
+
+            elif partition.method == 'hash':
+                for remainder in range(partition.modulus):
+                    cursor.execute(
+                        f'CREATE TABLE IF NOT EXISTS {tablename}_p{remainder} PARTITION OF {tablename} '
+                        f'FOR VALUES WITH (MODULUS {partition.modulus}, REMAINDER {remainder})'
+                    )
+
+            if partition.default:
+                cursor.execute(f'CREATE TABLE IF NOT EXISTS {tablename}_default PARTITION OF {tablename} DEFAULT')
+
+        finally:
+            connection.close()
+
+    @staticmethod
+    def __read_partitions(cursor, tablename: str) -> list[tuple]:
+        cursor.execute(
+            'SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) FROM pg_inherits AS i '
+            'JOIN pg_class AS c ON c.oid = i.inhrelid WHERE i.inhparent = %s::regclass ORDER BY c.relname',
+            (tablename,)
+        )
+
+        return cursor.fetchall()
+
+    def __bulk_insert(self, tablename: str, columns: list[str], rows: list[tuple]) -> None:
+        """
+        Inserts many rows in one roundtrip with `COPY ... FROM STDIN`.
+
+        Raises:
+            Exception: Errors are raised to the caller, the whole batch is rejected by the server.
+        """
+
+        connection, cursor = self.__connect
+
+        try:
+            self.__driver.copy_from(cursor, f"COPY {tablename} ({', '.join(columns)}) FROM STDIN", copy_text(rows))
+
+        finally:
+            connection.close()
     
+    def __insert_values(self, tablename: str, columns: tuple[str], rows: list[tuple], rows_per_statement: int = 1000) -> None:
+        """
+        Inserts many rows with multi-row `INSERT ... VALUES` statements in a single transaction.
+        With psycopg 3 the statements are pipelined instead of waiting for each other.
+
+        Raises:
+            Exception: Errors are raised to the caller after rolling the rows back.
+        """
+
+        connection, cursor = self.__connect
+        rows = iter(rows)
+
+        try:
+            connection.autocommit = False
+
+            with self.__driver.pipeline(connection):
+                while True:
+                    chunk = list(itertools.islice(rows, rows_per_statement))
+
+                    if not chunk:
+                        break
+
+                    cursor.execute(
+                        insert_query(tablename, columns, '%s', len(chunk)),
+                        [value for row in chunk for value in row]
+                    )
+
+            connection.commit()
+
+        except Exception:
+            connection.rollback()
+            raise
+
+        finally:
+            connection.close()
+    
+    def __select_columns(self, tablename: str, columns: list[str], condition: Filter, chunk_size: int) -> dict:
+        """
+        Streams a SELECT into typed column buffers, see `select_numpy`.
+        """
+
+        types = column_types(self.tables, tablename)
+        condition_query: str = condition.sql if condition else ''
+        condition_params: tuple = condition.params if condition else None
+
+        connection, cursor = self.__primary_connect
+
+        try:
+            cursor.execute(f"SELECT COUNT(*) FROM {tablename} {condition_query}", condition_params)
+            total = cursor.fetchone()[0]
+
+            # A named cursor keeps the result on the server; withhold lets it live outside a transaction.
+            stream = self.__driver.cursor(connection, name='manage_sql_select_columns', itersize=chunk_size)
+
+            try:
+                stream.execute(f"SELECT {', '.join(columns)} FROM {tablename} {condition_query}", condition_params)
+
+                return fill_columns(stream, types, total, chunk_size)
+
+            finally:
+                stream.close()
+
+        finally:
+            connection.close()
+    
+    def __read(self, work: object):
+        """
+        Runs `work(connection, cursor)` on a replica chosen by the router, or on the primary when there is
+        no replica, inside the read-your-writes window, or when the replica fails or lags.
+        """
+
+        index = self.__router.pick() if self.__router is not None else None
+
+        if index is not None:
+            try:
+                with self.__router.using(index, errors=self.__driver.errors):
+                    connection = self.__replica_connect(index)
+
+                    try:
+                        cursor = self.__driver.cursor(connection)
+
+                        if not self.__router.lag_due(index) or self.__router.record_lag(index, self.__replica_lag(cursor)):
+                            return work(connection, cursor)
+
+                    finally:
+                        connection.close()
+
+            except self.__driver.errors:
+                pass
+
+        connection, cursor = self.__primary_connect
+
+        try:
+            return work(connection, cursor)
+
+        finally:
+            connection.close()
+
+    def __replica_connect(self, index: int):
+        if self.__replica_pools:
+            return self.__replica_pools[index].acquire()
+
+        return self.__driver.connect(dsn=self.__replicas[index])
+
+    def __new_pool(self, open: object, size: int) -> ConnectionPool | None:
+        if not size:
+            return None
+
+        statements = None
+
+        if self.__prepare_threshold:
+            statements = lambda connection: self.__driver.statements(connection, self.__prepare_threshold, self.__prepared_max, self.__prepared)
+
+        return ConnectionPool(open=open, size=size, reset=self.__driver.reset, statements=statements)
+
+    def __flush(self) -> None:
+        """Drops the pooled connections after a schema change, whose prepared statements may be stale."""
+
+        for pool in [self.__pool, *self.__replica_pools]:
+            if pool is not None:
+                pool.flush()
+
+    def __replica_lag(self, cursor) -> float:
+        """
+        Seconds since the last transaction replayed by the replica, 0 on a server that is not in recovery
+        or that has replayed all the WAL it received. Without that check an idle primary would look like lag.
+        """
+
+        cursor.execute(
+            "SELECT CASE WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+            "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+        )
+
+        return float(cursor.fetchone()[0])
+
     def __exception_error(self, message_error: str):
         """
         Handles exceptions and prints the error message.
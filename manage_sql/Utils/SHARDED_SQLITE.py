@@ -0,0 +1,641 @@
+import heapq
+import itertools
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+
+# How the partial result of each shard is combined, None (no row) being neutral.
+MERGE = {
+    'count': lambda a, b: a + b,
+    'sum': lambda a, b: a + b,
+    'min': min,
+    'max': max
+}
+
+try:
+    from ..Utils.SQLITE import SQLITE
+    from ..Utils.utils_sqlite import (
+        Types,
+        Table,
+        Column,
+        ColumnData,
+        Filter
+    )
+    from ..Utils.utils_filters import param
+    from ..Utils.utils_joins import Join, selection, output_name
+    from ..Utils.utils_rows import format_rows
+
+except:
+    from .SQLITE import SQLITE
+    from .utils_sqlite import (
+        Types,
+        Table,
+        Column,
+        ColumnData,
+        Filter
+    )
+    from .utils_filters import param
+    from .utils_joins import Join, selection, output_name
+    from .utils_rows import format_rows
+
+class ShardedSQLITE:
+    """
+    Spreads the rows of each table over N SQLite files, partitioned by the hash of a shard key.
+
+    Every shard is a `SQLITE` database named `{database}_{index}` in `path`. Writes and
+    reads that carry the shard key go to a single shard; the others fan out to every
+    shard in a thread pool (sqlite3 releases the GIL while a statement runs) and the
+    results are merged, in order when `order_by` is given.
+
+    Tables created without a shard key are not partitioned and live in the first shard.
+
+    Attributes:
+        database (str):
+            Prefix of the shard files.
+        path (str, optional):
+            The folder where the shard files are saved. Defaults to 'database'.
+        shards (int, optional):
+            Number of shard files. Defaults to 4. It must not change once data is written.
+        shard_keys (dict[str, str], optional):
+            Table name to shard key column, for tables created by an earlier process.
+        workers (int, optional):
+            Size of the fan-out thread pool. Defaults to the number of shards.
+
+    Example:
+    ----------
+    >>> db = ShardedSQLITE('events', shards=8)
+    >>> db.create_table('events', [db.Column('user_id', db.Column_types.integer)], shard_key='user_id')
+    >>> db.insert_row('events', {'user_id': 42})
+    >>> db.select_data('events', condition=db.filter_by('user_id').EQUAL(42))  # one shard
+    >>> db.select_data('events', order_by='user_id')                           # every shard, merged
+    """
+    def __init__(
+        self,
+        database: str,
+        path: str = 'database',
+        shards: int = 4,
+        shard_keys: dict[str, str] = None,
+        workers: int = None
+    ):
+        if shards < 1:
+            raise ValueError(f'O número de `shards` deve ser maior que zero, e não {shards}.')
+
+        self.__shards: list[SQLITE] = [SQLITE(database=f'{database}_{index}', path=path) for index in range(shards)]
+        self.__shard_keys: dict[str, str] = dict(shard_keys or {})
+        self.__columns: dict[str, tuple[str]] = {}
+        self.__workers: int = workers or shards
+        self.__pool: ThreadPoolExecutor = None
+        self.__pool_lock = threading.Lock()
+        self.Column_types = Types
+        self.Column = Column
+        self.filter_by = Filter
+        self.delete_by = Filter
+        self.param = param
+        self.join = Join
+        self.ColumnData = ColumnData
+
+    @property
+    def shards(self) -> list[SQLITE]:
+        """The `SQLITE` database of each shard."""
+
+        return list(self.__shards)
+
+    @property
+    def tables(self) -> list[Table]:
+        """
+        Retrieves the tables of the database. Every shard has the same schema.
+
+        Returns:
+            list[Table]: A list of Table objects containing table names and their respective columns.
+        """
+
+        return self.__shards[0].tables
+
+    @property
+    def drop_database(self) -> None:
+        """
+        Drops every shard by removing the database folder.
+        """
+
+        self.close()
+        self.__shards[0].drop_database
+
+    def shard_for(self, tablename: str, value) -> SQLITE:
+        """
+        Returns the shard that stores the rows of `tablename` whose shard key equals `value`.
+
+        Args:
+            tablename (str):
+                Name of the table.
+            value:
+                Value of the shard key.
+
+        Returns:
+            SQLITE: The shard database.
+        """
+
+        if tablename not in self.__shard_keys:
+            return self.__shards[0]
+
+        return self.__shards[self.__shard_index(value)]
+
+    def create_table(self, tablename: str, columns: list[Column], shard_key: str = None) -> None:
+        """
+        Creates the table in every shard.
+
+        Args:
+            tablename (str):
+                Name of the table to be created.
+            columns (list[Column]):
+                List of Column objects defining the structure of the table columns.
+            shard_key (str, optional):
+                Column whose hash picks the shard of each row. Without it the table is not partitioned.
+                The automatic `id` is numbered per shard, so shard by another column or insert explicit ids.
+        """
+
+        if shard_key is not None:
+            self.__shard_keys[tablename] = shard_key
+
+        self.__columns.pop(tablename, None)
+        self.__fan_out(lambda shard: shard.create_table(tablename=tablename, columns=columns))
+
+    def insert_data(self, tablename: str, insert_query: list[ColumnData]) -> None:
+        """
+        Inserts a row into the shard of its shard key.
+
+        Args:
+            tablename (str):
+                Name of the table where data will be inserted.
+            insert_query (list[ColumnData]):
+                List of ColumnData objects, one of them for the shard key.
+        """
+
+        value = self.__key_value(tablename, {edit.column: edit.value for edit in insert_query})
+        self.shard_for(tablename, value).insert_data(tablename=tablename, insert_query=insert_query)
+
+    def insert_row(self, tablename: str, mapping: dict) -> None:
+        """
+        Inserts one row given as a dict into the shard of its shard key.
+
+        Args:
+            tablename (str):
+                Name of the table where data will be inserted.
+            mapping (dict):
+                Column name to value, including the shard key.
+        """
+
+        self.shard_for(tablename, self.__key_value(tablename, mapping)).insert_row(tablename=tablename, mapping=mapping)
+
+    def insert_rows(self, tablename: str, columns: list[str], rows: list[tuple]) -> None:
+        """
+        Groups the rows by shard and inserts every group in parallel, one transaction per shard.
+
+        Args:
+            tablename (str):
+                Name of the table where data will be inserted.
+            columns (list[str]):
+                Column names, in the order of the values in each row. Must include the shard key.
+            rows (list[tuple]):
+                The rows to insert.
+        """
+
+        if tablename not in self.__shard_keys:
+            self.__shards[0].insert_rows(tablename=tablename, columns=columns, rows=rows)
+            return
+
+        key = self.__shard_keys[tablename]
+
+        if key not in columns:
+            raise ValueError(f'A coluna `{key}`, chave de shard da tabela `{tablename}`, deve estar em `columns`.')
+
+        position = list(columns).index(key)
+        groups: dict[int, list[tuple]] = {}
+
+        for row in rows:
+            groups.setdefault(self.__shard_index(row[position]), []).append(row)
+
+        self.__fan_out(
+            lambda index: self.__shards[index].insert_rows(tablename=tablename, columns=columns, rows=groups[index]),
+            list(groups)
+        )
+
+    def select_data(
+        self,
+        tablename: str | Join,
+        columns: list[str] = ['*'],
+        condition: Filter = None,
+        row_format: str = 'tuple',
+        order_by: str | list[str] = None,
+        descending: bool = False
+    ):
+        """
+        Selects data from one shard when `condition` is `filter_by(shard_key).EQUAL(value)`,
+        otherwise from every shard in parallel.
+
+        A `join` runs inside each shard, so the tables it joins to a sharded table must be
+        sharded on the same key (their matching rows live in the same shard).
+
+        Args:
+            tablename (str | Join):
+                Name of the table to select data from, or a `join` of several tables.
+            columns (list[str], optional):
+                List of column names to select. Defaults to all columns ('*'), which a join
+                across shards does not accept.
+            condition (Filter, optional):
+                Condition to filter the data.
+            row_format (str, optional):
+                Shape of the result: 'tuple' (default), 'dict', 'namedtuple' or 'columns'.
+            order_by (str | list[str], optional):
+                Column(s) to sort the result by. Each shard sorts its rows and the sorted
+                streams are merged, so the whole result is never sorted again. The columns
+                must be part of the selection.
+            descending (bool, optional):
+                Sorts in descending order. Defaults to False.
+
+        Returns:
+            list | dict: The rows of every shard, in the requested format.
+        """
+
+        shards = self.__targets(tablename, condition)
+
+        if len(shards) == 1:
+            return shards[0].select_data(tablename, columns, condition, row_format, order_by, descending)
+
+        names = self.__column_names(tablename, columns)
+        results = self.__fan_out(lambda shard: shard.select_data(tablename, columns, condition, 'tuple', order_by, descending), shards)
+
+        if order_by:
+            order = [order_by] if isinstance(order_by, str) else order_by
+
+            if isinstance(tablename, Join):
+                order = [output_name(column) for column in order]
+
+            missing = [column for column in order if column not in names]
+
+            if missing:
+                raise ValueError(f'As colunas de `order_by` devem estar em `columns`: {missing}.')
+
+            positions = [names.index(column) for column in order]
+            # NULLs first, as SQLite sorts them; comparing None with a value would raise.
+            rows = list(heapq.merge(
+                *results,
+                key=lambda row: [(row[position] is not None, row[position]) for position in positions],
+                reverse=descending
+            ))
+
+        else:
+            rows = [row for result in results for row in result]
+
+        return format_rows([(name,) for name in names], rows, row_format)
+
+    def aggregate(
+        self,
+        tablename: str | Join,
+        aggregates: dict[str, tuple[str, str]],
+        group_by: str | list[str] = None,
+        condition: Filter = None,
+        having: Filter = None,
+        row_format: str = 'dict',
+        order_by: str | list[str] = None,
+        descending: bool = False
+    ):
+        """
+        Computes aggregates on the shard of the condition, or on every shard in parallel.
+
+        Across shards, each shard aggregates its rows and the partial results are merged by
+        group: counts and sums are added, minimums and maximums compared, and 'avg' is computed
+        from the merged sum and count.
+
+        Args:
+            tablename (str):
+                Name of the table to aggregate.
+            aggregates (dict[str, tuple[str, str]]):
+                Alias to (function, column), see `SQLITE.aggregate`. 'count_distinct' needs a single shard.
+            group_by (str | list[str], optional):
+                Column(s) to group by.
+            condition (Filter, optional):
+                Rows to aggregate.
+            having (Filter, optional):
+                Groups to keep. It needs a single shard.
+            row_format (str, optional):
+                'dict' (default), 'tuple', 'namedtuple' or 'columns'.
+            order_by (str | list[str], optional):
+                Group column(s) or alias(es) to sort the result by.
+            descending (bool, optional):
+                Sorts in descending order. Defaults to False.
+
+        Returns:
+            list | dict: One row per group, in the requested format.
+        """
+
+        shards = self.__targets(tablename, condition)
+
+        if len(shards) == 1:
+            return shards[0].aggregate(tablename, aggregates, group_by, condition, having, row_format, order_by, descending)
+
+        if having is not None or any(spec[0] == 'count_distinct' for spec in aggregates.values()):
+            raise ValueError('O `having` e o `count_distinct` só são suportados quando o filtro indica um único shard.')
+
+        groups = [group_by] if isinstance(group_by, str) else list(group_by or [])
+        partials: dict[str, tuple[str, str]] = {}
+
+        for alias, (function, column) in aggregates.items():
+            if function == 'avg':
+                partials[f'{alias}__sum'] = ('sum', column)
+                partials[f'{alias}__count'] = ('count', column)
+
+            else:
+                partials[alias] = (function, column)
+
+        functions = [function for function, _ in partials.values()]
+        merged: dict[tuple, list] = {}
+
+        for result in self.__fan_out(lambda shard: shard.aggregate(tablename, partials, groups, condition, row_format='tuple'), shards):
+            for row in result:
+                key, values = tuple(row[:len(groups)]), row[len(groups):]
+                current = merged.get(key)
+
+                if current is None:
+                    merged[key] = list(values)
+                    continue
+
+                for index, value in enumerate(values):
+                    if value is not None:
+                        current[index] = value if current[index] is None else MERGE[functions[index]](current[index], value)
+
+        names = list(partials)
+        rows = []
+
+        for key, values in merged.items():
+            partial = dict(zip(names, values))
+            row = list(key)
+
+            for alias, (function, _) in aggregates.items():
+                if function == 'avg':
+                    count = partial[f'{alias}__count']
+                    row.append(partial[f'{alias}__sum'] / count if count else None)
+
+                else:
+                    row.append(partial[alias])
+
+            rows.append(tuple(row))
+
+        names = [*groups, *aggregates]
+
+        if order_by:
+            order = [order_by] if isinstance(order_by, str) else order_by
+            positions = [names.index(column) for column in order]
+            # NULLs first, as SQLite sorts them.
+            rows.sort(key=lambda row: [(row[position] is not None, row[position]) for position in positions], reverse=descending)
+
+        return format_rows([(output_name(name),) for name in names], rows, row_format)
+
+    def count(self, tablename: str | Join, condition: Filter = None) -> int:
+        """
+        Counts the rows of the shard of the condition, or of every shard in parallel.
+
+        Args:
+            tablename (str): Name of the table.
+            condition (Filter, optional): Rows to count. Defaults to every row.
+
+        Returns:
+            int: The number of rows.
+        """
+
+        return sum(self.__fan_out(lambda shard: shard.count(tablename, condition), self.__targets(tablename, condition)))
+
+    def exists(self, tablename: str | Join, condition: Filter = None) -> bool:
+        """
+        Whether the shard of the condition, or any shard, has a row matching `condition`.
+
+        Args:
+            tablename (str): Name of the table.
+            condition (Filter, optional): Row to look for. Defaults to any row.
+
+        Returns:
+            bool: True when at least one row matches.
+        """
+
+        return any(self.__fan_out(lambda shard: shard.exists(tablename, condition), self.__targets(tablename, condition)))
+
+    def create_search_index(self, tablename: str, columns: list[str], tokenize: str = 'unicode61 remove_diacritics 2') -> None:
+        """
+        Creates the full-text index of the table in every shard, see `SQLITE.create_search_index`.
+
+        Args:
+            tablename (str):
+                Name of the table to index.
+            columns (list[str]):
+                The text columns searched.
+            tokenize (str, optional):
+                FTS5 tokenizer. Defaults to 'unicode61 remove_diacritics 2'.
+        """
+
+        self.__fan_out(lambda shard: shard.create_search_index(tablename, columns, tokenize))
+
+    def drop_search_index(self, tablename: str) -> None:
+        """
+        Drops the full-text index of the table in every shard.
+
+        Args:
+            tablename (str):
+                Name of the indexed table.
+        """
+
+        self.__fan_out(lambda shard: shard.drop_search_index(tablename))
+
+    def search(
+        self,
+        tablename: str,
+        query: str,
+        columns: list[str] = ['*'],
+        condition: Filter = None,
+        limit: int = 20,
+        row_format: str = 'dict'
+    ):
+        """
+        Full-text search in the shard of the condition, or in every shard in parallel, keeping
+        the `limit` best matches of all shards. Each shard ranks with the statistics of its own
+        rows, so ranks are comparable when the rows are spread evenly.
+
+        Args:
+            tablename (str):
+                Name of the indexed table.
+            query (str):
+                Words to look for, with the FTS5 syntax.
+            columns (list[str], optional):
+                Columns to return. Defaults to all columns ('*').
+            condition (Filter, optional):
+                Filter on the matched rows.
+            limit (int, optional):
+                Maximum number of rows. Defaults to 20.
+            row_format (str, optional):
+                'dict' (default), 'tuple', 'namedtuple' or 'columns'.
+
+        Returns:
+            list | dict: The matched rows with a last column `rank`, higher is better.
+        """
+
+        shards = self.__targets(tablename, condition)
+
+        if len(shards) == 1:
+            return shards[0].search(tablename, query, columns, condition, limit, row_format)
+
+        names = [*self.__column_names(tablename, columns), 'rank']
+        results = self.__fan_out(lambda shard: shard.search(tablename, query, columns, condition, limit, 'tuple'), shards)
+        rows = list(itertools.islice(heapq.merge(*results, key=itemgetter(-1), reverse=True), limit))
+
+        return format_rows([(name,) for name in names], rows, row_format)
+
+    def update_data(self, tablename: str, edit_query: list[ColumnData], condition: Filter = None):
+        """
+        Updates data in the shard of the condition, or in every shard.
+
+        Args:
+            tablename (str):
+                Name of the table where data will be updated.
+            edit_query (list[ColumnData]):
+                List of ColumnData objects containing the new data. The shard key cannot be changed.
+            condition (Filter, optional):
+                Condition to specify which records to update.
+        """
+
+        key = self.__shard_keys.get(tablename)
+
+        if key is not None and any(edit.column == key for edit in edit_query):
+            raise ValueError(f'A chave de shard `{key}` não pode ser actualizada, apague e insira a linha.')
+
+        self.__fan_out(
+            lambda shard: shard.update_data(tablename=tablename, edit_query=edit_query, condition=condition),
+            self.__targets(tablename, condition)
+        )
+
+    def detele_data(self, tablename: str, condition: Filter = None):
+        """
+        Deletes data from the shard of the condition, or from every shard.
+
+        Args:
+            tablename (str): Name of the table where data will be deleted.
+            condition (Filter, optional): Filtering condition to specify which records to delete.
+        """
+
+        self.__fan_out(
+            lambda shard: shard.detele_data(tablename=tablename, condition=condition),
+            self.__targets(tablename, condition)
+        )
+
+    def add_column(self, tablename: str, column: Column):
+        """
+        Adds a new column to the table in every shard.
+
+        Args:
+            tablename (str):
+                Name of the table where the column will be added.
+            column (Column):
+                The Column object defining the new column.
+        """
+
+        self.__columns.pop(tablename, None)
+        self.__fan_out(lambda shard: shard.add_column(tablename=tablename, column=column))
+
+    def drop_column(self, tablename: str, column_name: str):
+        """
+        Drops a column of the table in every shard.
+
+        Args:
+            tablename (str):
+                Name of the table from which the column will be dropped.
+            column_name (str):
+                Name of the column to be dropped.
+        """
+
+        self.__columns.pop(tablename, None)
+        self.__fan_out(lambda shard: shard.drop_column(tablename=tablename, column_name=column_name))
+
+    def drop_table(self, tablename: str):
+        """
+        Drops the table from every shard.
+
+        Args:
+            tablename (str):
+                Name of the table to be dropped.
+        """
+
+        self.__columns.pop(tablename, None)
+        self.__shard_keys.pop(tablename, None)
+        self.__fan_out(lambda shard: shard.drop_table(tablename=tablename))
+
+    def close(self) -> None:
+        """Stops the fan-out thread pool. It is started again on the next fan-out."""
+
+        with self.__pool_lock:
+            pool, self.__pool = self.__pool, None
+
+        if pool is not None:
+            pool.shutdown()
+
+    def __shard_index(self, value) -> int:
+        # crc32 instead of hash(): str hashes are salted per process, the placement must not be.
+        return zlib.crc32(str(value).encode('UTF-8')) % len(self.__shards)
+
+    def __key_value(self, tablename: str, mapping: dict):
+        key = self.__shard_keys.get(tablename)
+
+        if key is None:
+            return None
+
+        if key not in mapping:
+            raise ValueError(f'A coluna `{key}`, chave de shard da tabela `{tablename}`, deve ter um valor.')
+
+        return mapping[key]
+
+    def __targets(self, tablename: str | Join, condition: Filter) -> list[SQLITE]:
+        """The shards a statement must run on: one for a point condition on the shard key, else all."""
+
+        # A join runs on the shards of its base table, whose key may be qualified in the condition.
+        alias = tablename.name if isinstance(tablename, Join) else tablename
+        tablename = tablename.table if isinstance(tablename, Join) else tablename
+        key = self.__shard_keys.get(tablename)
+
+        if key is None:
+            return [self.__shards[0]]
+
+        if condition is not None and condition.sql in (f'WHERE {key} = ?', f'WHERE {alias}.{key} = ?'):
+            return [self.shard_for(tablename, condition.params[0])]
+
+        return self.__shards
+
+    def __column_names(self, tablename: str | Join, columns: list[str]) -> list[str]:
+        if isinstance(tablename, Join):
+            if columns == ['*']:
+                raise ValueError('Indique as colunas (`table.column`) de um join em vários shards.')
+
+            return [output_name(column) for column in selection(tablename, columns)]
+
+        if columns != ['*']:
+            return list(columns)
+
+        if tablename not in self.__columns:
+            self.__columns[tablename] = tuple(
+                column.name for table in self.__shards[0].tables if table.name == tablename for column in table.columns
+            )
+
+        return list(self.__columns[tablename])
+
+    def __fan_out(self, target: object, items: list = None) -> list:
+        """Calls `target` on every item (every shard by default) in the pool and returns the results in order."""
+
+        items = self.__shards if items is None else items
+
+        if len(items) == 1:
+            return [target(items[0])]
+
+        # Without the lock, threads sharing this instance could each start a pool and leak all but one.
+        with self.__pool_lock:
+            if self.__pool is None:
+                self.__pool = ThreadPoolExecutor(max_workers=self.__workers, thread_name_prefix='manage_sql_shard')
+
+            pool = self.__pool
+
+        return list(pool.map(target, items))
@@ -1,7 +1,10 @@
 import threading
+import weakref
 import sqlite3 as sq
 import os
+import re
 import shutil
+import time
 
 try:
     from ..Utils.utils_sqlite import (
@@ -10,8 +13,15 @@ try:
         Column,
         ColumnData,
         Filter,
-        EncryptValue
+        EncryptValue,
+        SEARCH_SUFFIX
     )
+    from ..Utils.utils_filters import param
+    from ..Utils.utils_joins import Join, selection
+    from ..Utils.utils_rows import format_rows, column_types, insert_query, order_clause, aggregate_query
+    from ..Utils.utils_hashing import hash_value, hash_values, verify_hash
+    from ..Utils.utils_numpy import fill_columns, to_structured, to_frame
+    from ..Utils.utils_files import as_query, check_format, export_cursor, check_import_format, import_records, compress_file, require_zstd, COMPRESSIONS
 
 except:
     from .utils_sqlite import (
@@ -20,8 +30,18 @@ except:
         Column,
         ColumnData,
         Filter,
-        EncryptValue
+        EncryptValue,
+        SEARCH_SUFFIX
     )
+    from .utils_filters import param
+    from .utils_joins import Join, selection
+    from .utils_rows import format_rows, column_types, insert_query, order_clause, aggregate_query
+    from .utils_hashing import hash_value, hash_values, verify_hash
+    from .utils_numpy import fill_columns, to_structured, to_frame
+    from .utils_files import as_query, check_format, export_cursor, check_import_format, import_records, compress_file, require_zstd, COMPRESSIONS
+
+MEMORY = ':memory:'
+ALIAS = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
 
 class SQLITE:
     """
@@ -32,6 +52,10 @@ class SQLITE:
             The name of the SQLite database file.
         path (str, optional):
             The path to the folder where the database will be saved. Defaults to 'database'.
+            ':memory:' keeps the database in RAM for as long as the SQLITE object lives.
+        shared (bool, optional):
+            For an in-memory database, whether every SQLITE of the process opened with the
+            same `database` name sees the same data. Defaults to False.
         Column_types (Types):
             Defines column types for the database tables.
         Column (Column):
@@ -40,13 +64,18 @@ class SQLITE:
             Defines filtering rules for queries.
         delete_by (Filter):
             Defines rules for deletion by filtering.
+        param (param):
+            Named placeholder of a reusable filter, see `Filter.compile`.
+        join (Join):
+            Builds the joined tables of a `select_data` over several tables.
         ColumnData (ColumnData):
             Manages column data, such as values to be inserted or updated.
     """
     def __init__(
         self,
         database: str,
-        path: str = 'database'
+        path: str = 'database',
+        shared: bool = False
     ):
         """
         Initializes the SQLITE class with the provided database name and path.
@@ -56,6 +85,15 @@ class SQLITE:
                 Name of the database file.
             path : str, optional
                 Directory where the database file will be stored. Defaults to 'database'.
+                ':memory:' creates an in-memory database instead.
+            shared : bool, optional
+                Shares an in-memory database with the other SQLITE objects of the process
+                that use the same `database` name. Defaults to False.
+
+        Example:
+        ----------
+        >>> cache = SQLITE('scratch', path=':memory:')
+        >>> cache.load_from_disk('database/hot.db')
         """
 
         self.__database = database
@@ -64,10 +102,13 @@ class SQLITE:
         self.Column = Column
         self.filter_by = Filter
         self.delete_by = Filter
+        self.param = param
+        self.join = Join
         self.ColumnData = ColumnData
         self.__sql_multiprocess = SQLITE_MULTI(
             database= self.__database,
-            path= self.__path
+            path= self.__path,
+            shared= shared
         )
     
     @property
@@ -79,48 +120,74 @@ class SQLITE:
         """
         Retrieves a list of all tables in the database.
 
+        Tables of attached databases are listed with their schema-qualified name (`alias.table`).
+
         Returns:
             list[Table]: A list of Table objects containing table names and their respective columns.
         """
 
         connection, cursor = self.__connect
-            
-        tables = cursor.execute(
-            'SELECT name FROM sqlite_master WHERE type = "table"'
-        ).fetchall()
 
-        db_tables: list[Table] = []
-
-        for table in tables:
-            if table[0] != 'sqlite_sequence':
-                table_info = Table(name=table[0])
-                columns = cursor.execute(
-                    f"PRAGMA table_info({table[0]})"
+        try:
+            tables = [
+                (schema, table[0], table[1] or '')
+                for schema in ('main', *self.__sql_multiprocess.attached)
+                for table in cursor.execute(
+                    f'SELECT name, sql FROM {schema}.sqlite_master WHERE type = "table"'
                 ).fetchall()
-
-                for column in columns:
-                    table_info.columns.append(
-                        Column(
-                            name=column[1],
-                            column_type=self.Column_types(value=column[2])
+            ]
+            # Full-text indexes of `create_search_index` and the tables that store them.
+            virtual = tuple(f'{table}_' for _, table, sql in tables if sql.startswith('CREATE VIRTUAL TABLE'))
+
+            db_tables: list[Table] = []
+
+            for schema, table, sql in tables:
+                if table != 'sqlite_sequence' and not sql.startswith('CREATE VIRTUAL TABLE') and not table.startswith(virtual):
+                    table_info = Table(name=table if schema == 'main' else f'{schema}.{table}')
+                    columns = cursor.execute(
+                        f"PRAGMA {schema}.table_info({table})"
+                    ).fetchall()
+
+                    for column in columns:
+                        table_info.columns.append(
+                            Column(
+                                name=column[1],
+                                column_type=self.Column_types(value=column[2])
+                            )
                         )
-                    )
-                
-                db_tables.append(table_info)
-        
-        connection.close()
+                    
+                    db_tables.append(table_info)
+
+        finally:
+            connection.close()
 
         return db_tables
     
+    @property
+    def attached(self) -> dict[str, str]:
+        """The attached databases, alias to file."""
+
+        return dict(self.__sql_multiprocess.attached)
+
+    @property
+    def in_memory(self) -> bool:
+        """Whether the database lives in RAM (`path=':memory:'`)."""
+
+        return self.__path == MEMORY
+
     @property
     def drop_database(self) -> None:
         """
-        Drops the SQLite database by removing the database file.
+        Drops the SQLite database by removing the database file. An in-memory database is freed.
         """
 
         connection, _ = self.__connect
         connection.close()
 
+        if self.in_memory:
+            self.__sql_multiprocess.release_memory()
+            return
+
         try:
             shutil.rmtree(self.__path)
         
@@ -134,26 +201,27 @@ class SQLITE:
         Args:
             tablename (str): Name of the table to be created.
             columns (list[Column]): List of Column objects defining the structure of the table columns.
+
+        Raises:
+            sqlite3.Error:
+                If the table cannot be created, e.g. on an invalid column definition.
         """
 
-        try:
-            columns_details: list[Column] = [
-                Column(
-                    name='id',
-                    column_type=self.Column_types.integer,
-                    primary_key=True,
-                    auto_increment=True
-                ),
-                *columns
-            ]
-            
-            all_columns = ", ".join(column.column_parameters for column in columns_details)
-            self.__sql_threading(
-                target=self.__sql_multiprocess.create_table_multi,
-                args=(tablename, all_columns),
-            )
-        except Exception as e:
-            self.__exception_error(message_error=e)
+        columns_details: list[Column] = [
+            Column(
+                name='id',
+                column_type=self.Column_types.integer,
+                primary_key=True,
+                auto_increment=True
+            ),
+            *columns
+        ]
+        
+        all_columns = ", ".join(column.column_parameters for column in columns_details)
+        self.__sql_threading(
+            target=self.__sql_multiprocess.create_table_multi,
+            args=(tablename, all_columns),
+        )
     
     def insert_data(self, tablename: str, insert_query: list[ColumnData]) -> None:
         """
@@ -162,20 +230,70 @@ class SQLITE:
         Args:
             tablename: (str): Name of the table where data will be inserted.
             insert_query: (list[ColumnData]): List of ColumnData objects containing the data to be inserted.
+
+        Raises:
+            sqlite3.Error:
+                If the insert fails, e.g. on a UNIQUE or NOT NULL violation.
         """
 
         columns: str = ', '.join([f"{edit.column}" for edit in insert_query])
         params: list = [edit.value for edit in insert_query]
         key: str = ', '.join('?' for _ in insert_query)
 
-        try:
-            self.__sql_threading(
-                target=self.__sql_multiprocess.insert_data_multi,
-                args=(tablename, columns, key, params)
-            )
-        
-        except Exception as e:
-            self.__exception_error(message_error=e)
+        self.__sql_threading(
+            target=self.__sql_multiprocess.insert_data_multi,
+            args=(tablename, columns, key, params)
+        )
+
+    def insert_row(self, tablename: str, mapping: dict) -> None:
+        """
+        Inserts one row given as a dict, without building a ColumnData per value.
+
+        Args:
+            tablename (str):
+                Name of the table where data will be inserted.
+            mapping (dict):
+                Column name to value.
+
+        Example:
+        ----------
+        >>> db.insert_row('users', {'name': 'John', 'age': 35})
+
+        Raises:
+            sqlite3.Error:
+                If the insert fails, e.g. on a UNIQUE or NOT NULL violation.
+        """
+
+        self.__sql_threading(
+            target=self.__sql_multiprocess.insert_rows_multi,
+            args=(tablename, tuple(mapping), (tuple(mapping.values()),))
+        )
+
+    def insert_rows(self, tablename: str, columns: list[str], rows: list[tuple]) -> None:
+        """
+        Inserts many rows with a single `executemany` in one transaction.
+
+        Args:
+            tablename (str):
+                Name of the table where data will be inserted.
+            columns (list[str]):
+                Column names, in the order of the values in each row.
+            rows (list[tuple]):
+                The rows to insert. Any iterable of tuples (e.g. a generator) is accepted.
+
+        Example:
+        ----------
+        >>> db.insert_rows('users', ['name', 'age'], [('John', 35), ('Jane', 40)])
+
+        Raises:
+            sqlite3.Error:
+                If one of the rows fails, e.g. on a UNIQUE violation. No row is inserted in that case.
+        """
+
+        self.__sql_threading(
+            target=self.__sql_multiprocess.insert_rows_multi,
+            args=(tablename, tuple(columns), rows)
+        )
 
     def detele_data(self, tablename: str, condition: Filter = None):
         """
@@ -184,231 +302,965 @@ class SQLITE:
         Args:
             tablename (str): Name of the table where data will be deleted.
             condition (Filter, optional): Filtering condition to specify which records to delete.
+
+        Raises:
+            sqlite3.Error:
+                If the delete fails, e.g. on a FOREIGN KEY violation.
         """
         
-        try:
-            if not condition:
-                self.__sql_threading(
-                    target=self.__sql_multiprocess.delete_data_multi,
-                    args=(tablename,)
-                )
-            
-            else:
-                condition_query = condition._Filter__condition.strip()
-                condition_params = condition._Filter__params
-
-                self.__sql_threading(
-                    target=self.__sql_multiprocess.delete_data_multi,
-                    args=(tablename, condition_params, condition_query)
-                )
+        if not condition:
+            self.__sql_threading(
+                target=self.__sql_multiprocess.delete_data_multi,
+                args=(tablename,)
+            )
         
-        except Exception as e:
-            self.__exception_error(message_error=e)
+        else:
+            condition_query = condition.sql
+            condition_params = condition.params
+
+            self.__sql_threading(
+                target=self.__sql_multiprocess.delete_data_multi,
+                args=(tablename, condition_params, condition_query)
+            )
     
-    def select_data(self, tablename: str, columns: list[str] = ['*'], condition: Filter = None):
+    def select_data(
+        self,
+        tablename: str | Join,
+        columns: list[str] = ['*'],
+        condition: Filter = None,
+        row_format: str = 'tuple',
+        order_by: str | list[str] = None,
+        descending: bool = False
+    ):
         """
         Selects data from the specified table.
 
         Args:
-            tablename (str):
-                Name of the table to select data from.
+            tablename (str | Join):
+                Name of the table to select data from, or a `join` of several tables.
             columns (list[str], optional):
-                List of column names to select. Defaults to all columns ('*').
+                List of column names to select. Defaults to all columns ('*'). Over a join, write
+                them as `table.column`; a name selected twice comes back as `table_column`.
             condition (Filter, optional):
                 Condition to filter the data.
+            row_format (str, optional):
+                Shape of the result: 'tuple' (default), 'dict', 'namedtuple' or 'columns'
+                (a dict of column name to list, or `array.array` for numeric columns).
+            order_by (str | list[str], optional):
+                Column(s) to sort the result by.
+            descending (bool, optional):
+                Sorts in descending order. Defaults to False.
 
         Returns:
-            list: List of fetched records from the table.
+            list | dict: List of fetched records from the table, or a dict of columns when row_format is 'columns'.
         """
 
+        order_query: str = order_clause(order_by, descending)
+        columns = selection(tablename, columns)
         connection, cursor = self.__connect
 
-        if not condition:
-            cursor.execute(f"SELECT {', '.join(columns)} FROM {tablename}")
+        try:
+            if not condition:
+                cursor.execute(f"SELECT {', '.join(columns)} FROM {tablename}{order_query}")
 
-        else:
-            condition_query: str = condition._Filter__condition.strip()
-            condition_params: list = condition._Filter__params
+            else:
+                condition_query: str = condition.sql
+                condition_params: tuple = condition.params
 
-            cursor.execute(f"SELECT {', '.join(columns)} FROM {tablename} {condition_query}", tuple(condition_params))
+                cursor.execute(f"SELECT {', '.join(columns)} FROM {tablename} {condition_query}{order_query}", tuple(condition_params))
 
-        dados = cursor.fetchall()
+            dados = cursor.fetchall()
+            description = cursor.description
 
-        connection.close()
+        finally:
+            connection.close()
 
-        return dados
-    
-    def update_data(self, tablename: str, edit_query: list[ColumnData], condition: Filter = None):
+        return format_rows(description, dados, row_format)
+
+    def aggregate(
+        self,
+        tablename: str | Join,
+        aggregates: dict[str, tuple[str, str]],
+        group_by: str | list[str] = None,
+        condition: Filter = None,
+        having: Filter = None,
+        row_format: str = 'dict',
+        order_by: str | list[str] = None,
+        descending: bool = False
+    ):
         """
-        Updates data in the specified table.
+        Computes aggregates in the database with a single `SELECT ... GROUP BY`, instead of
+        fetching the rows.
 
         Args:
             tablename (str):
-                Name of the table where data will be updated.
-            edit_query (list[ColumnData]):
-                List of ColumnData objects containing the new data.
+                Name of the table to aggregate.
+            aggregates (dict[str, tuple[str, str]]):
+                Alias to (function, column). The function is 'count', 'count_distinct', 'sum',
+                'avg', 'min' or 'max'; the column may be '*' for 'count'.
+            group_by (str | list[str], optional):
+                Column(s) to group by. They come first in each row. Without them there is one row.
             condition (Filter, optional):
-                Condition to specify which records to update.
+                Rows to aggregate.
+            having (Filter, optional):
+                Groups to keep, e.g. `filter_by('total').GATHER_THAN(100)` on an alias.
+            row_format (str, optional):
+                'dict' (default), 'tuple', 'namedtuple' or 'columns'.
+            order_by (str | list[str], optional):
+                Group column(s) or alias(es) to sort the result by.
+            descending (bool, optional):
+                Sorts in descending order. Defaults to False.
+
+        Returns:
+            list | dict: One row per group, in the requested format.
+
+        Example:
+        ----------
+        >>> db.aggregate('vendas', {'total': ('sum', 'valor'), 'vendas': ('count', '*')}, group_by='loja')
+        [{'loja': 'Maputo', 'total': 1520.0, 'vendas': 12}, ...]
         """
 
-        columns: str = ', '.join([f"{edit.column} = ?" for edit in edit_query])
-        params: list = [edit.value for edit in edit_query]
+        query, params = aggregate_query(tablename, aggregates, group_by, condition, having, order_by, descending)
+        connection, cursor = self.__connect
 
         try:
-            
+            cursor.execute(query, params)
 
-            if not condition:
-                self.__sql_threading(
-                    target=self.__sql_multiprocess.update_data_multi,
-                    args=(tablename, columns, params)
-                )
-            
-            else:
-                condition_query: str = condition._Filter__condition.strip()
-                params.extend(condition._Filter__params)
+            return format_rows(cursor.description, cursor.fetchall(), row_format)
 
-                self.__sql_threading(
-                    target=self.__sql_multiprocess.update_data_multi,
-                    args=(tablename, columns, params, condition_query)
-                )
+        finally:
+            connection.close()
 
-        except Exception as e:
-            self.__exception_error(message_error=e)
-    
-    def add_column(self, tablename: str, column: Column):
+    def count(self, tablename: str | Join, condition: Filter = None) -> int:
         """
-        Adds a new column to an existing table.
+        Counts the rows of a table with `SELECT COUNT(*)`.
 
         Args:
             tablename (str):
-                Name of the table where the column will be added.
-            column (Column):
-                The Column object defining the new column.
+                Name of the table.
+            condition (Filter, optional):
+                Rows to count. Defaults to every row.
+
+        Returns:
+            int: The number of rows.
         """
 
+        connection, cursor = self.__connect
+
         try:
-            connection, cursor = self.__connect
+            if not condition:
+                cursor.execute(f'SELECT COUNT(*) FROM {tablename}')
 
-            column_details = column.column_parameters
-            cursor.execute(f"ALTER TABLE {tablename} ADD COLUMN {column_details}")
+            else:
+                cursor.execute(f'SELECT COUNT(*) FROM {tablename} {condition.sql}', condition.params)
 
-            connection.commit()
-        
-        except Exception as e:
-            self.__exception_error(
-                message_error=e
-            )
+            return cursor.fetchone()[0]
 
         finally:
             connection.close()
-    
-    def drop_column(self, tablename: str, column_name: str):
+
+    def exists(self, tablename: str | Join, condition: Filter = None) -> bool:
         """
-        Drops a column from an existing table.
+        Whether a table has a row matching `condition`, with `SELECT 1 ... LIMIT 1`, which stops
+        at the first match.
 
         Args:
             tablename (str):
-                Name of the table from which the column will be dropped.
-            column_name (str):
-                Name of the column to be dropped.
+                Name of the table.
+            condition (Filter, optional):
+                Row to look for. Defaults to any row.
+
+        Returns:
+            bool: True when at least one row matches.
         """
 
+        connection, cursor = self.__connect
+
         try:
-            connection, cursor = self.__connect
-            cursor.execute(f"ALTER TABLE {tablename} DROP COLUMN {column_name}")
+            if not condition:
+                cursor.execute(f'SELECT 1 FROM {tablename} LIMIT 1')
 
-            connection.commit()
-        
-        except Exception as e:
-            self.__exception_error(
-                message_error=e
-            )
+            else:
+                cursor.execute(f'SELECT 1 FROM {tablename} {condition.sql} LIMIT 1', condition.params)
+
+            return cursor.fetchone() is not None
 
         finally:
             connection.close()
-    
-    def drop_table(self, tablename: str):
+
+    def create_search_index(self, tablename: str, columns: list[str], tokenize: str = 'unicode61 remove_diacritics 2') -> None:
         """
-        Drops a table from the database.
+        Creates the full-text index of `search` and `Filter.MATCH`: an FTS5 table `<tablename>_fts`
+        over the table's rows, kept in sync by triggers on INSERT, UPDATE and DELETE. The rows
+        already in the table are indexed in the same call.
 
         Args:
             tablename (str):
-                Name of the table to be dropped.
+                Name of the table to index.
+            columns (list[str]):
+                The text columns searched.
+            tokenize (str, optional):
+                FTS5 tokenizer. Defaults to 'unicode61 remove_diacritics 2', which ignores
+                case and accents.
+
+        Example:
+        ----------
+        >>> db.create_search_index('posts', ['title', 'body'])
+        >>> db.search('posts', 'sqlite OR postgres', columns=['id', 'title'])
+        [{'id': 7, 'title': 'SQLite vs PostgreSQL', 'rank': 4.31}, ...]
         """
 
-        connection, cursor = self.__connect
+        index = f'{tablename}{SEARCH_SUFFIX}'
+        names = ', '.join(columns)
+        new = ', '.join(f'new.{column}' for column in columns)
+        old = ', '.join(f'old.{column}' for column in columns)
 
-        cursor.execute(f"DROP TABLE IF EXISTS {tablename}")
+        self.__sql_threading(
+            target=self.__sql_multiprocess.execute_script_multi,
+            args=(f'''
+                BEGIN;
+                CREATE VIRTUAL TABLE IF NOT EXISTS {index} USING fts5({names}, content='{tablename}', content_rowid='rowid', tokenize='{tokenize}');
+                CREATE TRIGGER IF NOT EXISTS {index}_insert AFTER INSERT ON {tablename} BEGIN
+                    INSERT INTO {index} (rowid, {names}) VALUES (new.rowid, {new});
+                END;
+                CREATE TRIGGER IF NOT EXISTS {index}_delete AFTER DELETE ON {tablename} BEGIN
+                    INSERT INTO {index} ({index}, rowid, {names}) VALUES ('delete', old.rowid, {old});
+                END;
+                CREATE TRIGGER IF NOT EXISTS {index}_update AFTER UPDATE OF {names} ON {tablename} BEGIN
+                    INSERT INTO {index} ({index}, rowid, {names}) VALUES ('delete', old.rowid, {old});
+                    INSERT INTO {index} (rowid, {names}) VALUES (new.rowid, {new});
+                END;
+                INSERT INTO {index} ({index}) VALUES ('rebuild');
+                COMMIT;
+            ''',)
+        )
 
-        connection.commit()
-        connection.close()
-    
-    def execute_query(self, query: str):
+    def drop_search_index(self, tablename: str) -> None:
         """
-        Executes a raw SQL query on the SQLite database.
+        Drops the full-text index of a table and its triggers.
 
         Args:
+            tablename (str):
+                Name of the indexed table.
+        """
+
+        index = f'{tablename}{SEARCH_SUFFIX}'
+
+        self.__sql_threading(
+            target=self.__sql_multiprocess.execute_script_multi,
+            args=(f'''
+                DROP TRIGGER IF EXISTS {index}_insert;
+                DROP TRIGGER IF EXISTS {index}_delete;
+                DROP TRIGGER IF EXISTS {index}_update;
+                DROP TABLE IF EXISTS {index};
+            ''',)
+        )
+
+    def search(
+        self,
+        tablename: str,
+        query: str,
+        columns: list[str] = ['*'],
+        condition: Filter = None,
+        limit: int = 20,
+        row_format: str = 'dict'
+    ):
+        """
+        Full-text search in the index of `create_search_index`, best matches first.
+
+        Args:
+            tablename (str):
+                Name of the indexed table.
             query (str):
-                The raw SQL query string to be executed.
+                Words to look for, with the FTS5 syntax: `a b` (both), `a OR b`, `"a b"` (phrase), `a*` (prefix).
+            columns (list[str], optional):
+                Columns to return. Defaults to all columns ('*').
+            condition (Filter, optional):
+                Filter on the matched rows.
+            limit (int, optional):
+                Maximum number of rows. Defaults to 20.
+            row_format (str, optional):
+                'dict' (default), 'tuple', 'namedtuple' or 'columns'.
 
         Returns:
-            list:
-            A list of tuples representing the fetched results from the query.
-            If the query does not return any result (e.g., INSERT, UPDATE), it will return an empty list.
+            list | dict: The matched rows with a last column `rank`, the BM25 relevance (higher is better).
+        """
 
-        Example:
-        ----------
-        >>> db.execute_query('SELECT * FROM users WHERE age > 30')
-        [(1, 'John', 35), (2, 'Jane', 40)]
+        index = f'{tablename}{SEARCH_SUFFIX}'
+        selected = ', '.join(f'{tablename}.*' if column == '*' else column for column in columns)
+        params = (query, *(condition.params if condition else ()), limit)
+        connection, cursor = self.__connect
 
-        Raises:
-            Exception:
-                If there is an error in executing the SQL query, the exception is logged or raised.
-        """
-        
-        self.__sql_threading(
-            target=self.__sql_multiprocess.execute_query_multi,
-            args=(query,)
-        )
-            
+        try:
+            cursor.execute(
+                f'SELECT {selected}, search.rank AS rank FROM {tablename} '
+                f'JOIN (SELECT rowid, -bm25({index}) AS rank FROM {index} WHERE {index} MATCH ?) AS search ON search.rowid = {tablename}.rowid '
+                f"{condition.sql + ' ' if condition else ''}ORDER BY search.rank DESC LIMIT ?",
+                params
+            )
+
+            return format_rows(cursor.description, cursor.fetchall(), row_format)
+
+        finally:
+            connection.close()
     
-    def encrypt_value(self, value) -> str:
+    def select_numpy(self, tablename: str, columns: list[str] = ['*'], condition: Filter = None, chunk_size: int = 10000):
         """
-        Encrypts a given value using a predefined encryption method.
+        Selects data from the specified table into a structured NumPy array.
 
         Args:
-            value (str):
-                The value to be encrypted (usually a sensitive value like a password).
+            tablename (str):
+                Name of the table to select data from.
+            columns (list[str], optional):
+                List of column names to select. Defaults to all columns ('*').
+            condition (Filter, optional):
+                Condition to filter the data.
+            chunk_size (int, optional):
+                Number of rows fetched per `fetchmany` call. Defaults to 10000.
 
         Returns:
-            str:
-                The encrypted (hashed) version of the input value.
+            numpy.ndarray: A structured array with one field per column, typed from the table's declared `Types`.
 
-        Example:
-        ----------
-        >>> db.encrypt_value('mypassword')
-        '5f4dcc3b5aa765d61d8327deb882cf99'
+        Raises:
+            ImportError:
+                If numpy is not installed (`pip install manage-sql[numpy]`).
+        """
 
-        Notes:
-        ----------
-        The encryption algorithm used is defined in the EncryptValue class, which must be
-        implemented to handle the encryption logic, such as hashing with salt.
+        return to_structured(self.__select_columns(tablename, columns, condition, chunk_size))
 
-        Raises:
-            Exception:
-                If there is an error during encryption, the exception is logged or raised.
+    def select_frame(self, tablename: str, columns: list[str] = ['*'], condition: Filter = None, chunk_size: int = 10000):
         """
-        return EncryptValue(value).value_hashed
+        Selects data from the specified table into a pandas DataFrame.
 
-    def __exception_error(self, message_error: str):
-        print(f"Error: {message_error}")
-        exit()
-    
-    def __sql_threading(self, target: object, args: tuple) -> None:
-        try:
+        Args:
+            tablename (str):
+                Name of the table to select data from.
+            columns (list[str], optional):
+                List of column names to select. Defaults to all columns ('*').
+            condition (Filter, optional):
+                Condition to filter the data.
+            chunk_size (int, optional):
+                Number of rows fetched per `fetchmany` call. Defaults to 10000.
+
+        Returns:
+            pandas.DataFrame: One typed column per selected column.
+
+        Raises:
+            ImportError:
+                If pandas is not installed (`pip install manage-sql[pandas]`).
+        """
+
+        return to_frame(self.__select_columns(tablename, columns, condition, chunk_size))
+
+    def update_data(self, tablename: str, edit_query: list[ColumnData], condition: Filter = None):
+        """
+        Updates data in the specified table.
+
+        Args:
+            tablename (str):
+                Name of the table where data will be updated.
+            edit_query (list[ColumnData]):
+                List of ColumnData objects containing the new data.
+            condition (Filter, optional):
+                Condition to specify which records to update.
+
+        Raises:
+            sqlite3.Error:
+                If the update fails, e.g. on a UNIQUE violation.
+        """
+
+        columns: str = ', '.join([f"{edit.column} = ?" for edit in edit_query])
+        params: list = [edit.value for edit in edit_query]
+
+        if not condition:
+            self.__sql_threading(
+                target=self.__sql_multiprocess.update_data_multi,
+                args=(tablename, columns, params)
+            )
+        
+        else:
+            condition_query: str = condition.sql
+            params.extend(condition.params)
+
+            self.__sql_threading(
+                target=self.__sql_multiprocess.update_data_multi,
+                args=(tablename, columns, params, condition_query)
+            )
+    
+    def add_column(self, tablename: str, column: Column):
+        """
+        Adds a new column to an existing table.
+
+        Args:
+            tablename (str):
+                Name of the table where the column will be added.
+            column (Column):
+                The Column object defining the new column.
+
+        Raises:
+            sqlite3.Error:
+                If the column cannot be added, e.g. when it already exists.
+        """
+
+        connection, cursor = self.__connect
+
+        try:
+            column_details = column.column_parameters
+            cursor.execute(f"ALTER TABLE {tablename} ADD COLUMN {column_details}")
+
+            connection.commit()
+
+        finally:
+            connection.close()
+    
+    def drop_column(self, tablename: str, column_name: str):
+        """
+        Drops a column from an existing table.
+
+        Args:
+            tablename (str):
+                Name of the table from which the column will be dropped.
+            column_name (str):
+                Name of the column to be dropped.
+
+        Raises:
+            sqlite3.Error:
+                If the column cannot be dropped, e.g. when it is part of an index.
+        """
+
+        connection, cursor = self.__connect
+
+        try:
+            cursor.execute(f"ALTER TABLE {tablename} DROP COLUMN {column_name}")
+
+            connection.commit()
+
+        finally:
+            connection.close()
+    
+    def drop_table(self, tablename: str):
+        """
+        Drops a table from the database.
+
+        Args:
+            tablename (str):
+                Name of the table to be dropped.
+        """
+
+        connection, cursor = self.__connect
+
+        try:
+            cursor.execute(f"DROP TABLE IF EXISTS {tablename}")
+
+            connection.commit()
+
+        finally:
+            connection.close()
+    
+    def execute_query(self, query: str, params: tuple | dict | list = None, many: bool = False):
+        """
+        Executes a raw SQL query on the SQLite database.
+
+        Args:
+            query (str):
+                The raw SQL query string to be executed, with `?` (or `:name`) placeholders.
+            params (tuple | dict | list, optional):
+                Values bound to the placeholders. With `many=True`, a list (or any iterable)
+                of them, one per execution.
+            many (bool, optional):
+                Runs the query once per item of `params` with `executemany`, in one transaction.
+                Defaults to False.
+
+        Returns:
+            list | int:
+            A list of tuples with the fetched results for a query that returns rows (e.g. SELECT),
+            otherwise the number of rows changed (e.g. INSERT, UPDATE).
+
+        Example:
+        ----------
+        >>> db.execute_query('SELECT * FROM users WHERE age > ?', (30,))
+        [(1, 'John', 35), (2, 'Jane', 40)]
+        >>> db.execute_query('UPDATE users SET age = ? WHERE id = ?', [(36, 1), (41, 2)], many=True)
+        2
+
+        Raises:
+            sqlite3.Error:
+                If there is an error in executing the SQL query.
+        """
+
+        return self.__sql_threading(
+            target=self.__sql_multiprocess.execute_query_multi,
+            args=(query, params, many)
+        )
+
+    def execute_script(self, script: str) -> None:
+        """
+        Executes several SQL statements separated by `;` in a single call.
+
+        Args:
+            script (str):
+                The SQL statements. Values cannot be bound, use `execute_query` for that.
+
+        Example:
+        ----------
+        >>> db.execute_script('''
+        ...     CREATE INDEX IF NOT EXISTS users_age ON users (age);
+        ...     DELETE FROM sessions WHERE expired = 1;
+        ... ''')
+
+        Raises:
+            sqlite3.Error:
+                If one of the statements fails. The statements before it stay applied.
+        """
+
+        self.__sql_threading(
+            target=self.__sql_multiprocess.execute_script_multi,
+            args=(script,)
+        )
+
+    def export(self, source: str, path: str, format: str = 'csv', compression: str = None, batch_size: int = 10000) -> dict:
+        """
+        Streams a table or a query to a file without loading it in memory.
+
+        Args:
+            source (str):
+                Name of the table, or a full SELECT query.
+            path (str):
+                Destination file.
+            format (str, optional):
+                'csv' (with header), 'jsonl' (one JSON object per row) or 'parquet' (requires pyarrow). Defaults to 'csv'.
+            compression (str, optional):
+                None, 'gzip' or 'zstd' (requires zstandard). For parquet it selects the column codec.
+            batch_size (int, optional):
+                Number of rows held in memory at a time. Defaults to 10000.
+
+        Returns:
+            dict: rows, bytes, seconds, rows_per_second and bytes_per_second of the export.
+
+        Example:
+        ----------
+        >>> db.export('users', 'users.csv.gz', compression='gzip')
+        {'rows': 1000, 'bytes': 18231, ...}
+        """
+
+        check_format(format=format, compression=compression)
+
+        connection, cursor = self.__connect
+
+        try:
+            cursor.execute(as_query(source))
+
+            return export_cursor(cursor, path, format, compression, batch_size)
+
+        finally:
+            connection.close()
+
+    def import_file(
+        self,
+        tablename: str,
+        path: str,
+        format: str = 'csv',
+        mapping: dict[str, str] = None,
+        batch_size: int = 10000,
+        reject_path: str = None,
+        progress: object = None,
+        compression: str = None
+    ) -> dict:
+        """
+        Loads a CSV or JSON Lines file into a table, parsing it incrementally.
+
+        Values are coerced to the column types reported by `tables` and inserted with one
+        `executemany` per batch. Batches that fail are retried row by row, and the rows that
+        still fail are written to `reject_path`.
+
+        Args:
+            tablename (str):
+                Name of the table where data will be inserted.
+            path (str):
+                Source file. CSV files must have a header row.
+            format (str, optional):
+                'csv' or 'jsonl'. Defaults to 'csv'.
+            mapping (dict[str, str], optional):
+                File field to table column. Defaults to the fields named like a table column.
+            batch_size (int, optional):
+                Number of rows per insert batch. Defaults to 10000.
+            reject_path (str, optional):
+                JSON Lines file receiving the bad rows with their line number and error.
+            progress (callable, optional):
+                Called as `progress(rows, rejected)` after every batch.
+            compression (str, optional):
+                None, 'gzip' or 'zstd'.
+
+        Returns:
+            dict: rows, rejected, bytes, seconds, rows_per_second and bytes_per_second of the import.
+
+        Example:
+        ----------
+        >>> db.import_file('users', 'users.csv', reject_path='users.rejects.jsonl')
+        {'rows': 999, 'rejected': 1, ...}
+        """
+
+        check_import_format(format=format, compression=compression)
+
+        # Runs on the calling thread so a failing batch raises here and can be retried row by row.
+        return import_records(
+            path=path,
+            format=format,
+            types=column_types(self.tables, tablename),
+            write=lambda columns, rows: self.__sql_multiprocess.insert_rows_multi(tablename, columns, rows),
+            mapping=mapping,
+            batch_size=batch_size,
+            reject_path=reject_path,
+            progress=progress,
+            compression=compression
+        )
+
+    def attach(self, alias: str, database: str) -> None:
+        """
+        Attaches another SQLite file under `alias`, so its tables can be used as `alias.table`
+        in `select_data`, the other CRUD methods and `execute_query`, and combined with the
+        tables of this database in a single statement.
+
+        SQLite attaches per connection, so the database is attached again on every connection
+        this object opens until `detach` is called.
+
+        Args:
+            alias (str):
+                Schema name of the attached database. 'main' and 'temp' are reserved.
+            database (str):
+                Path of a `.db` file, or the name of a database in the same folder as this one.
+                The file is created when it does not exist.
+
+        Example:
+        ----------
+        >>> db.attach('jan', 'vendas_2024_01')
+        >>> db.attach('fev', 'vendas_2024_02')
+        >>> db.select_data('fev.vendas', condition=db.filter_by('total').GATHER_THAN(100))
+        >>> db.execute_query('SELECT SUM(total) FROM (SELECT total FROM jan.vendas UNION ALL SELECT total FROM fev.vendas)')
+        """
+
+        if not ALIAS.match(alias) or alias.lower() in ('main', 'temp'):
+            raise ValueError(f'O `alias` deve ser um identificador SQL diferente de main e temp, e não {alias!r}.')
+
+        if alias in self.__sql_multiprocess.attached:
+            raise ValueError(f'Já existe uma base de dados anexada como `{alias}`.')
+
+        if not database.endswith('.db') and os.sep not in database and '/' not in database:
+            folder = os.path.dirname(self.__path) if self.__path.endswith('.db') else self.__path
+
+            if self.in_memory:
+                raise ValueError('Num banco de dados em memória, o `database` deve ser o caminho de um ficheiro .db.')
+
+            database = os.path.join(folder, f'{database}.db')
+
+        self.__sql_multiprocess.attach(alias, database)
+
+    def detach(self, alias: str) -> None:
+        """
+        Detaches a database attached with `attach`.
+
+        Args:
+            alias (str):
+                Schema name given to `attach`.
+        """
+
+        if alias not in self.__sql_multiprocess.attached:
+            raise ValueError(f'Não existe nenhuma base de dados anexada como `{alias}`.')
+
+        self.__sql_multiprocess.detach(alias)
+
+    def load_from_disk(self, path: str) -> None:
+        """
+        Replaces the content of this database with a copy of a database file, using the
+        sqlite3 backup API. Meant to fill an in-memory database with a hot working set.
+
+        Args:
+            path (str):
+                The SQLite file to copy from.
+
+        Raises:
+            FileNotFoundError:
+                If `path` does not exist.
+        """
+
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f'O ficheiro `{path}` não existe.')
+
+        source = sq.connect(path)
+
+        try:
+            target, _ = self.__connect
+
+            try:
+                # The backup API takes the sqlite3 connection itself, not the in-memory wrapper.
+                source.backup(target.connection if isinstance(target, MemoryConnection) else target)
+
+            finally:
+                target.close()
+
+        finally:
+            source.close()
+
+    def save_to_disk(self, path: str) -> None:
+        """
+        Writes a consistent copy of this database to a file, using the sqlite3 backup API.
+        Meant to persist an in-memory database periodically; an existing file is replaced.
+
+        Args:
+            path (str):
+                The SQLite file to write.
+        """
+
+        folder = os.path.dirname(path)
+
+        if folder:
+            os.makedirs(name=folder, exist_ok=True)
+
+        source, _ = self.__connect
+
+        try:
+            target = sq.connect(path)
+
+            try:
+                source.backup(target)
+
+            finally:
+                target.close()
+
+        finally:
+            source.close()
+
+    def backup(
+        self,
+        dest_path: str,
+        pages_per_step: int = 256,
+        sleep: float = 0.005,
+        progress: object = None,
+        compression: str = None,
+        vacuum: bool = False
+    ) -> dict:
+        """
+        Takes a consistent copy of the database while it stays in use.
+
+        The online backup API copies `pages_per_step` pages at a time and pauses `sleep`
+        seconds between steps, so writers of other connections are only blocked for one
+        step; a write made meanwhile restarts the copy from the first page, so prefer a
+        small step on busy databases. The copy is written next to `dest_path` and renamed
+        (or compressed) into place at the end, so `dest_path` is never left half written.
+
+        Args:
+            dest_path (str):
+                File of the backup.
+            pages_per_step (int, optional):
+                Pages copied per step. Defaults to 256 (1 MiB with 4 KiB pages).
+            sleep (float, optional):
+                Seconds to pause between steps. Defaults to 0.005.
+            progress (callable, optional):
+                Called as `progress(copied_pages, total_pages)` after every step.
+            compression (str, optional):
+                None, 'gzip' or 'zstd' (requires zstandard) to compress the backup file.
+            vacuum (bool, optional):
+                Uses `VACUUM INTO` instead, which writes a compacted, defragmented copy in one
+                statement. It holds a read transaction for the whole copy: writers are only
+                unaffected in WAL mode. Defaults to False.
+
+        Returns:
+            dict: pages, bytes, seconds and bytes_per_second of the backup.
+
+        Example:
+        ----------
+        >>> db.backup('backups/app.db.gz', compression='gzip', progress=lambda done, total: print(f'{done}/{total}'))
+        {'pages': 2048, 'bytes': 1843200, 'seconds': 0.42, 'bytes_per_second': ...}
+        """
+
+        if compression not in COMPRESSIONS:
+            raise ValueError(f'O `compression` deve ser um de {COMPRESSIONS}, e não {compression!r}.')
+
+        if compression == 'zstd':
+            require_zstd()
+
+        if vacuum and sq.sqlite_version_info < (3, 27, 0):
+            raise ValueError(f'O `VACUUM INTO` requer SQLite 3.27 ou superior, e não {sq.sqlite_version}.')
+
+        folder = os.path.dirname(dest_path)
+
+        if folder:
+            os.makedirs(name=folder, exist_ok=True)
+
+        temporary = f'{dest_path}.partial'
+        start = time.perf_counter()
+
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+        source, cursor = self.__connect
+
+        try:
+            if vacuum:
+                cursor.execute('VACUUM INTO ?', (temporary,))
+
+            else:
+                target = sq.connect(temporary)
+
+                try:
+                    source.backup(
+                        target,
+                        pages=pages_per_step,
+                        progress=(lambda status, remaining, total: progress(total - remaining, total)) if progress else None,
+                        sleep=sleep
+                    )
+
+                finally:
+                    target.close()
+
+            pages = sq.connect(temporary)
+
+            try:
+                total_pages = pages.execute('PRAGMA page_count').fetchone()[0]
+
+            finally:
+                pages.close()
+
+            if compression:
+                compress_file(temporary, dest_path, compression)
+                os.remove(temporary)
+
+            else:
+                os.replace(temporary, dest_path)
+
+        except BaseException:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+
+            raise
+
+        finally:
+            source.close()
+
+        seconds = time.perf_counter() - start
+        size = os.path.getsize(dest_path)
+
+        return {
+            'pages': total_pages,
+            'bytes': size,
+            'seconds': round(seconds, 6),
+            'bytes_per_second': round(size / seconds, 3) if seconds else 0.0
+        }
+
+    def encrypt_value(self, value, algorithm: str = 'sha512', **options) -> str:
+        """
+        Encrypts a given value using a predefined encryption method.
+
+        Args:
+            value (str):
+                The value to be encrypted (usually a sensitive value like a password).
+            algorithm (str, optional):
+                'sha512' (default, unsalted), or the salted and iterated 'pbkdf2_hmac' or 'scrypt'.
+            **options:
+                Cost of the iterated algorithms: `iterations` and `hash_name` for pbkdf2_hmac,
+                `n`, `r` and `p` for scrypt.
+
+        Returns:
+            str:
+                The encrypted (hashed) version of the input value.
+
+        Example:
+        ----------
+        >>> db.encrypt_value('mypassword')
+        '5f4dcc3b5aa765d61d8327deb882cf99'
+
+        Notes:
+        ----------
+        The encryption algorithm used is defined in the EncryptValue class, which must be
+        implemented to handle the encryption logic, such as hashing with salt.
+
+        Raises:
+            Exception:
+                If there is an error during encryption, the exception is logged or raised.
+        """
+        if algorithm == 'sha512' and not options:
+            return EncryptValue(value).value_hashed
+
+        return hash_value(value, algorithm=algorithm, **options)
+
+    def encrypt_values(self, values, workers: int = None, executor: str = 'thread', algorithm: str = 'sha512', **options) -> list[str]:
+        """
+        Encrypts many values in parallel, keeping their order.
+
+        Args:
+            values (Iterable[str]):
+                The values to be encrypted.
+            workers (int, optional):
+                Pool size. Defaults to the number of CPUs; 1 hashes serially.
+            executor (str, optional):
+                'thread' (default) or 'process'. Threads scale for pbkdf2_hmac and scrypt, which
+                release the GIL; short sha512 inputs only scale with 'process'.
+            algorithm (str, optional):
+                'sha512', 'pbkdf2_hmac' or 'scrypt', see `encrypt_value`.
+            **options:
+                Cost of the iterated algorithms, see `encrypt_value`.
+
+        Returns:
+            list[str]: One hash per value.
+
+        Example:
+        ----------
+        >>> db.encrypt_values(passwords, workers=8, algorithm='pbkdf2_hmac', iterations=210000)
+        """
+
+        return hash_values(values, workers=workers, executor=executor, algorithm=algorithm, **options)
+
+    def verify_value(self, value, hashed: str) -> bool:
+        """
+        Checks a value against a hash returned by `encrypt_value` or `encrypt_values`.
+
+        Args:
+            value (str):
+                The value to check (e.g. the password typed at login).
+            hashed (str):
+                The stored hash. The algorithm, cost and salt are read from it.
+
+        Returns:
+            bool: True when the value matches.
+        """
+
+        return verify_hash(value, hashed)
+
+    def __select_columns(self, tablename: str, columns: list[str], condition: Filter, chunk_size: int) -> dict:
+        types = column_types(self.tables, tablename)
+        condition_query: str = condition.sql if condition else ''
+        condition_params: tuple = condition.params if condition else ()
+
+        connection, cursor = self.__connect
+
+        try:
+            total = cursor.execute(f"SELECT COUNT(*) FROM {tablename} {condition_query}", condition_params).fetchone()[0]
+            cursor.execute(f"SELECT {', '.join(columns)} FROM {tablename} {condition_query}", condition_params)
+
+            return fill_columns(cursor, types, total, chunk_size)
+
+        finally:
+            connection.close()
+
+    def __exception_error(self, message_error: str):
+        print(f"Error: {message_error}")
+        exit()
+    
+    def __sql_threading(self, target: object, args: tuple):
+        """Runs `target(*args)` on a thread and returns its result, or raises its exception here."""
+
+        outcome: dict = {}
+
+        def run() -> None:
+            try:
+                outcome['result'] = target(*args)
+
+            except BaseException as e:
+                outcome['error'] = e
+
+        try:
             process = threading.Thread(
-                target=target,
-                args=args
+                target=run
             )
             process.start()
             process.join()
@@ -418,14 +1270,96 @@ class SQLITE:
                 message_error=e
             )
 
+        if 'error' in outcome:
+            raise outcome['error']
+
+        return outcome.get('result')
+
+class MemoryDatabase:
+    """
+    An in-memory database and its only connection.
+
+    The calls of every thread (and of every `shared` SQLITE) take turns on this connection.
+    Giving each call its own connection would need SQLite's shared cache, which locks whole
+    tables and fails concurrent callers with "database table is locked".
+    """
+    __slots__ = ('connection', 'lock', 'depth', '__weakref__')
+
+    def __init__(self):
+        self.connection = sq.connect(MEMORY, check_same_thread=False)
+        self.lock = threading.RLock()
+        self.depth = 0
+
+    def acquire(self) -> 'MemoryConnection':
+        return MemoryConnection(self)
+
+    def release(self) -> None:
+        """Frees the data by replacing the connection with a new, empty database."""
+
+        with self.lock:
+            self.connection.close()
+            self.connection = sq.connect(MEMORY, check_same_thread=False)
+
+class MemoryConnection:
+    """
+    The connection of a `MemoryDatabase`, held by one call until `close`. As when closing a
+    connection of its own, what was not committed is rolled back.
+    """
+    __slots__ = ('__database', '__closed')
+
+    def __init__(self, database: MemoryDatabase):
+        database.lock.acquire()
+        database.depth += 1
+        self.__database = database
+        self.__closed = False
+
+    def __getattr__(self, name: str):
+        return getattr(self.__database.connection, name)
+
+    @property
+    def connection(self) -> sq.Connection:
+        return self.__database.connection
+
+    def close(self) -> None:
+        if self.__closed:
+            return
+
+        self.__closed = True
+        database = self.__database
+        database.depth -= 1
+
+        try:
+            if database.depth == 0 and database.connection.in_transaction:
+                database.connection.rollback()
+
+        finally:
+            database.lock.release()
+
 class SQLITE_MULTI:
+    # The in-memory databases of `shared=True`, by name, while an SQLITE uses them.
+    __shared_memory = weakref.WeakValueDictionary()
+    __shared_lock = threading.Lock()
+
     def __init__(
         self,
         database: str,
-        path: str
+        path: str,
+        shared: bool = False
     ):
         self.__database = database
         self.__path = path
+        self.__memory: MemoryDatabase = None
+        self.__attached: dict[str, str] = {}
+
+        if path == MEMORY and shared:
+            with SQLITE_MULTI.__shared_lock:
+                self.__memory = SQLITE_MULTI.__shared_memory.get(database)
+
+                if self.__memory is None:
+                    self.__memory = SQLITE_MULTI.__shared_memory[database] = MemoryDatabase()
+
+        elif path == MEMORY:
+            self.__memory = MemoryDatabase()
     
     @property
     def __connect(self) -> tuple[sq.Connection, sq.Cursor]:
@@ -441,79 +1375,178 @@ class SQLITE_MULTI:
         """
         def create_connection() -> tuple[sq.Connection, sq.Cursor]:
 
+            if self.__memory is not None:
+                # Attached once on the shared connection, see `attach`.
+                connection = self.__memory.acquire()
+
+                return connection, connection.cursor()
+
             if not self.__path.endswith('.db'):
                 self.__path = os.path.join(self.__path, f"{self.__database}.db")
 
             connection = sq.connect(self.__path)
             cursor = connection.cursor()
 
+            for alias, path in self.__attached.items():
+                cursor.execute(f"ATTACH DATABASE ? AS {alias}", (path,))
+
             return connection, cursor
         
         try:
-            os.mkdir(path=self.__path)
+            if self.__memory is None and not self.__path.endswith('.db'):
+                os.makedirs(name=self.__path, exist_ok=True)
 
             return create_connection()
-        
+
         except Exception as e:
-            if 'WinError 183' in str(e):
-                return create_connection()
-            
-            else:
-                self.__exception_error(message_error=e)
+            self.__exception_error(message_error=e)
     
     @property
     def public_connect(self):
         return self.__connect
+
+    @property
+    def attached(self) -> dict[str, str]:
+        return self.__attached
+
+    def attach(self, alias: str, path: str) -> None:
+        folder = os.path.dirname(path)
+
+        if folder:
+            os.makedirs(name=folder, exist_ok=True)
+
+        # Attached on a throwaway connection first, so a bad file fails here and not on the next query.
+        connection = sq.connect(':memory:')
+
+        try:
+            connection.execute(f"ATTACH DATABASE ? AS {alias}", (path,))
+            connection.execute(f"SELECT COUNT(*) FROM {alias}.sqlite_master")
+
+        finally:
+            connection.close()
+
+        if self.__memory is not None:
+            self.__run_memory(f"ATTACH DATABASE ? AS {alias}", (path,))
+
+        self.__attached[alias] = path
+
+    def detach(self, alias: str) -> None:
+        if self.__memory is not None:
+            self.__run_memory(f"DETACH DATABASE {alias}")
+
+        del self.__attached[alias]
+
+    def __run_memory(self, query: str, params: tuple = ()) -> None:
+        connection = self.__memory.acquire()
+
+        try:
+            connection.execute(query, params)
+
+        finally:
+            connection.close()
+
+    def release_memory(self) -> None:
+        """Frees an in-memory database, leaving an empty one in its place."""
+
+        if self.__memory is not None:
+            self.__memory.release()
+
+            for alias, path in self.__attached.items():
+                self.__run_memory(f"ATTACH DATABASE ? AS {alias}", (path,))
     
     def create_table_multi(self, table_name: str, columns: str):
             connection, cursor = self.__connect
+
+            try:
+                cursor.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table_name} ({columns})"
+                )
+
+            finally:
+                connection.close()
+    
+    def insert_data_multi(self, table_name: str, columns: str, key: str, params: list[None]):
+        connection, cursor = self.__connect
+
+        try:
             cursor.execute(
-                f"CREATE TABLE IF NOT EXISTS {table_name} ({columns})"
+                f"INSERT INTO {table_name} ({columns}) VALUES ({key})", tuple(params)
             )
-            
+
+            connection.commit()
+
+        finally:
             connection.close()
     
-    def insert_data_multi(self, table_name: str, columns: str, key: str, params: list[None]):
+    def insert_rows_multi(self, table_name: str, columns: tuple[str], rows: list[tuple]):
         connection, cursor = self.__connect
 
-        cursor.execute(
-            f"INSERT INTO {table_name} ({columns}) VALUES ({key})", tuple(params)
-        )
+        try:
+            cursor.executemany(insert_query(table_name, tuple(columns)), rows)
 
-        connection.commit()
-        connection.close()
+            connection.commit()
+
+        finally:
+            connection.close()
     
     def delete_data_multi(self, tablename: str, condition_params: list = None, condition_query: str = None):
         connection, cursor = self.__connect
 
-        if not condition_query:
-            cursor.execute(f"DELETE FROM {tablename}")
-        
-        else:
-            cursor.execute(f"DELETE FROM {tablename} {condition_query}", tuple(condition_params))
-        
-        connection.commit()
-        connection.close()
+        try:
+            if not condition_query:
+                cursor.execute(f"DELETE FROM {tablename}")
+            
+            else:
+                cursor.execute(f"DELETE FROM {tablename} {condition_query}", tuple(condition_params))
+            
+            connection.commit()
+
+        finally:
+            connection.close()
     
     def update_data_multi(self, tablename: str, columns: str, params: list, condition_query: str = None):
             connection, cursor = self.__connect
 
-            if not condition_query:
-                cursor.execute(f"UPDATE {tablename} SET {columns}", tuple(params))
-            
+            try:
+                if not condition_query:
+                    cursor.execute(f"UPDATE {tablename} SET {columns}", tuple(params))
+                
+                else:
+                    cursor.execute(f"UPDATE {tablename} SET {columns} {condition_query}", tuple(params))
+
+                connection.commit()
+
+            finally:
+                connection.close()
+    
+    def execute_query_multi(self, query: str, params: tuple | dict | list = None, many: bool = False):
+        connection, cursor = self.__connect
+
+        try:
+            if many:
+                cursor.executemany(query, params)
+
             else:
-                cursor.execute(f"UPDATE {tablename} SET {columns} {condition_query}", tuple(params))
+                cursor.execute(query, () if params is None else params)
 
+            result = cursor.fetchall() if cursor.description is not None else cursor.rowcount
             connection.commit()
+
+            return result
+
+        finally:
             connection.close()
-    
-    def execute_query_multi(self, query: str):
-        try:
-            connection, cursor = self.__connect
 
-            cursor.execute(query)
+    def execute_script_multi(self, script: str):
+        connection, cursor = self.__connect
+
+        try:
+            cursor.executescript(script)
+            connection.commit()
 
-            return cursor.fetchall()
-        
         finally:
-            connection.close()
\ No newline at end of file
+            connection.close()
+
+    def __exception_error(self, message_error: str):
+        print(f"Error: {message_error}")
+        exit()
@@ -0,0 +1,313 @@
+import contextlib
+import functools
+import importlib
+import io
+import itertools
+import re
+import sys
+
+try:
+    from ..Utils.utils_pool import PooledConnection, PreparedStatements, PreparedStats
+
+except:
+    from .utils_pool import PooledConnection, PreparedStatements, PreparedStats
+
+POSTGRES_DRIVERS = ('psycopg2', 'psycopg')
+MYSQL_DRIVERS = ('connector', 'connector_pure', 'mysqlclient')
+
+# Driver to (module, extra of setup.py that installs it).
+POSTGRES_MODULES = {
+    'psycopg2': ('psycopg2', 'postgresql'),
+    'psycopg': ('psycopg', 'psycopg')
+}
+MYSQL_MODULES = {
+    'connector': ('mysql.connector', 'mysql'),
+    'connector_pure': ('mysql.connector', 'mysql'),
+    'mysqlclient': ('MySQLdb', 'mysqlclient')
+}
+# The psycopg2 placeholder, numbered `$n` in a PREPARE, and its escaped `%`.
+PLACEHOLDER = re.compile(r'%[s%]')
+
+def load_module(driver: str, modules: dict, drivers: tuple):
+    if driver not in drivers:
+        raise ValueError(f'O `driver` deve ser um de {drivers}, e não {driver!r}.')
+
+    name, extra = modules[driver]
+
+    try:
+        return importlib.import_module(name)
+
+    except ImportError as e:
+        raise ImportError(f'O {name} não está instalado. Instale com `pip install manage-sql[{extra}]`.') from e
+
+class PostgresDriver:
+    """
+    The calls of `POSTGRESQL` that differ between psycopg2 and psycopg 3.
+
+    With psycopg 3, results are transferred in binary format when `binary` is True and
+    `pipeline` batches the statements sent inside it into as few roundtrips as possible.
+
+    Attributes:
+        name (str): 'psycopg2' or 'psycopg'.
+        binary (bool): Binary result transfer, psycopg 3 only.
+        errors (tuple): Exception classes of a lost or refused connection.
+    """
+
+    __slots__ = ('name', 'binary', 'module', 'errors')
+
+    def __init__(
+        self,
+        name: str = 'psycopg2',
+        binary: bool = True
+    ):
+        self.name = name
+        self.binary = binary and name == 'psycopg'
+        self.module = load_module(name, POSTGRES_MODULES, POSTGRES_DRIVERS)
+        self.errors = (self.module.OperationalError, self.module.InterfaceError)
+
+    def connect(self, dsn: str = None, **params):
+        """Opens an autocommit connection from a DSN/URL or from keyword parameters (host, port, dbname, user, password)."""
+
+        if self.name == 'psycopg':
+            connection = self.module.connect(dsn or '', **params)
+
+        else:
+            connection = self.module.connect(dsn, **params)
+
+        connection.autocommit = True
+
+        return connection
+
+    def cursor(self, connection, name: str = None, itersize: int = None):
+        """A cursor, or a server-side cursor that outlives transactions when `name` is given."""
+
+        options = {'name': name, 'withhold': True} if name else {}
+
+        if self.binary:
+            options['binary'] = True
+
+        cursor = connection.cursor(**options)
+
+        if itersize:
+            cursor.itersize = itersize
+
+        return cursor
+
+    def copy_from(self, cursor, query: str, text: str) -> None:
+        """Runs `COPY ... FROM STDIN` with `text` as the data."""
+
+        if self.name == 'psycopg':
+            with cursor.copy(query) as copy:
+                copy.write(text)
+
+        else:
+            cursor.copy_expert(query, io.StringIO(text))
+
+    def copy_to(self, cursor, query: str, file) -> None:
+        """Runs `COPY ... TO STDOUT` into the binary `file`."""
+
+        if self.name == 'psycopg':
+            with cursor.copy(query) as copy:
+                for data in copy:
+                    file.write(data)
+
+        else:
+            cursor.copy_expert(query, file)
+
+    def pipeline(self, connection):
+        """A context in which psycopg 3 sends statements without waiting for each result; a no-op otherwise."""
+
+        if self.name == 'psycopg' and self.module.Pipeline.is_supported():
+            return connection.pipeline()
+
+        return contextlib.nullcontext()
+
+    def reset(self, connection) -> bool:
+        """Rolls back what a pooled connection left open and restores autocommit. False when the connection is lost."""
+
+        if connection.closed:
+            return False
+
+        if not connection.autocommit:
+            connection.rollback()
+            connection.autocommit = True
+
+        return True
+
+    def statements(self, connection, threshold: int, capacity: int, stats: PreparedStats) -> PreparedStatements:
+        """
+        The prepared statements of a pooled connection. psycopg 3 keeps the handles itself, so its
+        automatic preparation is given a threshold it never reaches and `execute` asks for it
+        explicitly. A threshold of None would turn off `prepare=True` as well.
+        """
+
+        if self.name == 'psycopg':
+            connection.prepare_threshold = sys.maxsize
+            connection.prepared_max = capacity
+
+            return PreparedStatements(threshold, capacity, stats)
+
+        return PreparedStatements(threshold, capacity, stats, deallocate=functools.partial(self.__deallocate, connection))
+
+    def execute(self, connection, cursor, query: str, params: tuple = None):
+        """
+        Runs `query` on `cursor`, through a server-side prepared statement once it is hot on a
+        pooled connection: `PREPARE`/`EXECUTE` with psycopg2, `prepare=True` with psycopg 3.
+
+        Returns:
+            The cursor that holds the result.
+        """
+
+        statements = connection.statements if isinstance(connection, PooledConnection) else None
+
+        if statements is None:
+            cursor.execute(query, params)
+            return cursor
+
+        if self.name == 'psycopg':
+            cursor.execute(query, params, prepare=statements.use(query, lambda name: True) is not None)
+            return cursor
+
+        name = statements.use(query, lambda name: self.__prepare(cursor, name, query))
+
+        if name is None:
+            cursor.execute(query, params)
+
+        elif params:
+            cursor.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+
+        else:
+            cursor.execute(f'EXECUTE {name}')
+
+        return cursor
+
+    @staticmethod
+    def __prepare(cursor, name: str, query: str) -> str:
+        numbers = itertools.count(1)
+        cursor.execute(f"PREPARE {name} AS {PLACEHOLDER.sub(lambda match: '%' if match[0] == '%%' else f'${next(numbers)}', query)}")
+
+        return name
+
+    @staticmethod
+    def __deallocate(connection, name: str) -> None:
+        connection.cursor().execute(f'DEALLOCATE {name}')
+
+class MySQLDriver:
+    """
+    The calls of `MYSQL` that differ between mysql-connector-python and mysqlclient.
+
+    'connector' uses the C extension of mysql-connector-python when it is installed,
+    'connector_pure' forces its pure Python implementation and 'mysqlclient' uses the
+    `MySQLdb` module, a thin wrapper around libmysqlclient.
+
+    Attributes:
+        name (str): 'connector', 'connector_pure' or 'mysqlclient'.
+        errors (tuple): Exception classes of a lost or refused connection.
+    """
+
+    __slots__ = ('name', 'module', 'errors')
+
+    def __init__(
+        self,
+        name: str = 'connector'
+    ):
+        self.name = name
+        self.module = load_module(name, MYSQL_MODULES, MYSQL_DRIVERS)
+        self.errors = (self.module.OperationalError, self.module.InterfaceError)
+
+    @property
+    def c_extension(self) -> bool:
+        """Whether the driver runs in C: mysqlclient, or 'connector' with its C extension installed."""
+
+        return self.name == 'mysqlclient' or (self.name == 'connector' and getattr(self.module, 'HAVE_CEXT', False))
+
+    @property
+    def ProgrammingError(self) -> type:
+        return self.module.ProgrammingError
+
+    def connect(self, host: str, port: int, user: str, password: str, database: str = None):
+        if self.name == 'mysqlclient':
+            params = {'db': database} if database else {}
+
+            return self.module.connect(host=host, port=port, user=user, passwd=password, **params)
+
+        params = {'database': database} if database else {}
+
+        return self.module.connect(host=host, port=port, user=user, password=password, use_pure=self.name == 'connector_pure', **params)
+
+    def reset(self, connection) -> bool:
+        """Ends the transaction a pooled connection left open, so its next reads see fresh data."""
+
+        if self.name == 'mysqlclient' or connection.in_transaction:
+            connection.rollback()
+
+        return True
+
+    def statements(self, connection, threshold: int, capacity: int, stats: PreparedStats) -> PreparedStatements | None:
+        """The prepared statements of a pooled connection, one prepared cursor each. mysqlclient has no prepared statements."""
+
+        if self.name == 'mysqlclient':
+            return None
+
+        return PreparedStatements(threshold, capacity, stats, deallocate=lambda handle: handle[0].close())
+
+    def execute(self, connection, cursor, query: str, params: tuple = None):
+        """
+        Runs `query` on `cursor` or, once it is hot on a pooled connection, on a cached
+        `cursor(prepared=True)` that keeps the server-side statement between executions.
+
+        Returns:
+            The cursor that holds the result.
+        """
+
+        statements = connection.statements if isinstance(connection, PooledConnection) else None
+        handle = statements.use(query, lambda name: (connection.cursor(prepared=True), query)) if statements is not None else None
+
+        if handle is None:
+            cursor.execute(query, params)
+            return cursor
+
+        # The prepared cursor re-prepares unless it gets the very string it prepared.
+        prepared, text = handle
+        prepared.execute(text, params or ())
+
+        return prepared
+
+    def stream_cursor(self, connection):
+        """A cursor that fetches rows from the server as they are read instead of all at once."""
+
+        if self.name == 'mysqlclient':
+            return connection.cursor(importlib.import_module('MySQLdb.cursors').SSCursor)
+
+        return connection.cursor(buffered=False)
+
+    def execute_script(self, cursor, script: str) -> None:
+        """Sends several statements in one roundtrip and drains every result."""
+
+        if self.name == 'mysqlclient':
+            # mysqlclient enables multi statements by default; every result set must be consumed.
+            cursor.execute(script)
+
+            while cursor.nextset():
+                pass
+
+            return
+
+        try:
+            results = cursor.execute(script, multi=True)
+
+        except TypeError:
+            # mysql-connector 9.2 dropped `multi`: statements run as one batch and each result is a set.
+            cursor.execute(script)
+
+            while True:
+                if cursor.with_rows:
+                    cursor.fetchall()
+
+                if not cursor.nextset():
+                    break
+
+        else:
+            for result in results:
+                if result.with_rows:
+                    result.fetchall()
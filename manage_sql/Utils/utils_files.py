@@ -0,0 +1,483 @@
+import csv
+import gzip
+import io
+import itertools
+import json
+import os
+import time
+from datetime import date, datetime, time as day_time
+from decimal import Decimal
+
+try:
+    from ..Utils.utils_rows import column_names, type_kind
+
+except:
+    from .utils_rows import column_names, type_kind
+
+# zstandard and pyarrow are imported on first use, see `require_zstd` and `require_pyarrow`.
+zstandard = None
+pa = None
+pq = None
+
+FILE_FORMATS = ('csv', 'jsonl', 'parquet')
+IMPORT_FORMATS = ('csv', 'jsonl')
+COMPRESSIONS = (None, 'gzip', 'zstd')
+TRUE_VALUES = ('1', 'true', 't', 'yes', 'y', 'sim', 's')
+FALSE_VALUES = ('0', 'false', 'f', 'no', 'n', 'nao', 'não')
+# DB-API exception classes raised for the values of a row; every driver defines them.
+ROW_ERRORS = ('DataError', 'IntegrityError')
+
+def as_query(source: str) -> str:
+    """Accepts a table name or a full query; table names never contain whitespace."""
+
+    source = source.strip()
+
+    return source if len(source.split()) > 1 else f'SELECT * FROM {source}'
+
+def require_zstd() -> None:
+    global zstandard
+
+    if zstandard is None:
+        try:
+            import zstandard
+
+        except ImportError:
+            raise ImportError('O zstandard não está instalado. Instale com `pip install manage-sql[zstd]`.') from None
+
+def require_pyarrow() -> None:
+    global pa, pq
+
+    if pq is None:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+        except ImportError:
+            raise ImportError('O pyarrow não está instalado. Instale com `pip install manage-sql[parquet]`.') from None
+
+def check_format(format: str, compression: str = None) -> None:
+    if format not in FILE_FORMATS:
+        raise ValueError(f'O `format` deve ser um de {FILE_FORMATS}, e não {format!r}.')
+
+    if compression not in COMPRESSIONS:
+        raise ValueError(f'O `compression` deve ser um de {COMPRESSIONS}, e não {compression!r}.')
+
+    if compression == 'zstd' and format != 'parquet':
+        require_zstd()
+
+    if format == 'parquet':
+        require_pyarrow()
+
+def check_import_format(format: str, compression: str = None) -> None:
+    if format not in IMPORT_FORMATS:
+        raise ValueError(f'O `format` deve ser um de {IMPORT_FORMATS}, e não {format!r}.')
+
+    check_format(format=format, compression=compression)
+
+def open_output(path: str, compression: str = None):
+    """Opens `path` for binary writing, optionally through a gzip or zstd compressor."""
+
+    if compression == 'gzip':
+        return gzip.open(path, 'wb')
+
+    if compression == 'zstd':
+        return zstandard.ZstdCompressor().stream_writer(open(path, 'wb'), closefd=True)
+
+    return open(path, 'wb')
+
+def compress_file(source: str, path: str, compression: str, chunk_size: int = 1024 * 1024) -> None:
+    """Streams the file `source` into `path` through a gzip or zstd compressor."""
+
+    with open(source, 'rb') as file, open_output(path, compression) as output:
+        while chunk := file.read(chunk_size):
+            output.write(chunk)
+
+class CsvWriter:
+    def __init__(
+        self,
+        file,
+        columns: tuple[str]
+    ):
+        self.__text = io.TextIOWrapper(file, encoding='UTF-8', newline='')
+        self.__writer = csv.writer(self.__text)
+        self.__writer.writerow(columns)
+
+    def write(self, rows: list[tuple]) -> None:
+        self.__writer.writerows(rows)
+
+    def close(self) -> None:
+        self.__text.close()
+
+class JsonlWriter:
+    def __init__(
+        self,
+        file,
+        columns: tuple[str]
+    ):
+        self.__text = io.TextIOWrapper(file, encoding='UTF-8', newline='\n')
+        self.__columns = columns
+
+    def write(self, rows: list[tuple]) -> None:
+        columns = self.__columns
+        self.__text.write(''.join(json.dumps(dict(zip(columns, row)), default=str) + '\n' for row in rows))
+
+    def close(self) -> None:
+        self.__text.close()
+
+class ParquetWriter:
+    """
+    Writes each batch as a row group. The schema is inferred from the first batches.
+
+    A column that only has NULLs is typed `null` by pyarrow, so the batches are held until
+    every column has a type (at most `PENDING_BATCHES`). Columns still without one are
+    written as strings.
+    """
+
+    PENDING_BATCHES = 8
+
+    def __init__(
+        self,
+        path: str,
+        columns: tuple[str],
+        compression: str = None
+    ):
+        self.__path = path
+        self.__columns = columns
+        self.__compression = compression or 'snappy'
+        self.__writer = None
+        self.__pending: list = []
+
+    def write(self, rows: list[tuple]) -> None:
+        values = zip(*rows)
+        table = pa.table({name: list(column) for name, column in zip(self.__columns, values)})
+
+        if self.__writer is not None:
+            self.__writer.write_table(table.cast(self.__writer.schema))
+            return
+
+        self.__pending.append(table)
+        schema = pa.unify_schemas([pending.schema for pending in self.__pending])
+
+        if len(self.__pending) >= self.PENDING_BATCHES or not any(pa.types.is_null(field.type) for field in schema):
+            self.__open(schema)
+
+    def __open(self, schema) -> None:
+        schema = pa.schema([
+            field.with_type(pa.string()) if pa.types.is_null(field.type) else field
+            for field in schema
+        ])
+        self.__writer = pq.ParquetWriter(self.__path, schema, compression=self.__compression)
+
+        for table in self.__pending:
+            self.__writer.write_table(table.cast(schema))
+
+        self.__pending.clear()
+
+    def close(self) -> None:
+        if self.__writer is None:
+            self.__open(
+                pa.unify_schemas([pending.schema for pending in self.__pending]) if self.__pending
+                else pa.schema([(name, pa.null()) for name in self.__columns])
+            )
+
+        self.__writer.close()
+
+def report(rows: int, path: str, start: float) -> dict:
+    """Builds the summary returned by `export`/`import_file`."""
+
+    seconds = time.perf_counter() - start
+    size = os.path.getsize(path)
+
+    return {
+        'rows': rows,
+        'bytes': size,
+        'seconds': round(seconds, 6),
+        'rows_per_second': round(rows / seconds, 3) if seconds else 0.0,
+        'bytes_per_second': round(size / seconds, 3) if seconds else 0.0
+    }
+
+def export_cursor(cursor, path: str, format: str = 'csv', compression: str = None, batch_size: int = 10000) -> dict:
+    """
+    Streams the result of an executed cursor to a file with bounded memory.
+
+    Args:
+        cursor:
+            A cursor on which the SELECT has already been executed.
+        path (str):
+            Destination file.
+        format (str):
+            'csv', 'jsonl' or 'parquet'.
+        compression (str, optional):
+            None, 'gzip' or 'zstd'. For parquet it selects the column compression codec.
+        batch_size (int):
+            Number of rows held in memory at a time.
+
+    Returns:
+        dict: rows, bytes, seconds, rows_per_second and bytes_per_second.
+    """
+
+    start = time.perf_counter()
+
+    # Server-side cursors only expose `description` after the first fetch.
+    rows = cursor.fetchmany(batch_size)
+    columns = column_names(cursor.description)
+    total = 0
+
+    if format == 'parquet':
+        writer = ParquetWriter(path=path, columns=columns, compression=compression)
+
+    else:
+        file = open_output(path=path, compression=compression)
+        writer = (CsvWriter if format == 'csv' else JsonlWriter)(file, columns)
+
+    try:
+        while rows:
+            writer.write(rows)
+            total += len(rows)
+            rows = cursor.fetchmany(batch_size)
+
+    finally:
+        writer.close()
+
+    return report(rows=total, path=path, start=start)
+
+def open_input(path: str, compression: str = None):
+    """Opens `path` for binary reading, optionally through a gzip or zstd decompressor."""
+
+    if compression == 'gzip':
+        return gzip.open(path, 'rb')
+
+    if compression == 'zstd':
+        return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True))
+
+    return open(path, 'rb')
+
+def iter_records(file, format: str):
+    """
+    Parses a CSV (with header) or JSON Lines file incrementally.
+
+    Yields:
+        tuple[int, dict | Exception]: The line number and the record, or the parse error of that line.
+    """
+
+    if format == 'csv':
+        reader = csv.DictReader(io.TextIOWrapper(file, encoding='UTF-8', newline=''))
+
+        for record in reader:
+            yield reader.line_num, record
+
+        return
+
+    for number, line in enumerate(io.TextIOWrapper(file, encoding='UTF-8'), start=1):
+        if not line.strip():
+            continue
+
+        try:
+            record = json.loads(line)
+
+            if not isinstance(record, dict):
+                raise ValueError('cada linha deve ser um objecto JSON')
+
+            yield number, record
+
+        except ValueError as e:
+            yield number, e
+
+def to_bool(value) -> bool:
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+
+        if lowered in TRUE_VALUES:
+            return True
+
+        if lowered in FALSE_VALUES:
+            return False
+
+        raise ValueError(f'valor booleano inválido: {value!r}')
+
+    return bool(value)
+
+def from_iso(parser: object):
+    return lambda value: parser(value) if isinstance(value, str) else value
+
+CONVERTERS = {
+    'integer': int,
+    'float': float,
+    'decimal': lambda value: Decimal(str(value)),
+    'bool': to_bool,
+    'date': from_iso(date.fromisoformat),
+    'datetime': from_iso(datetime.fromisoformat),
+    'timestamptz': from_iso(datetime.fromisoformat),
+    'time': from_iso(day_time.fromisoformat),
+    'json': lambda value: value if isinstance(value, str) else json.dumps(value),
+    'array': lambda value: value
+}
+
+def coercer_for(type_name: str):
+    """
+    Returns a function converting a raw file value to the column's declared type.
+
+    Missing values become NULL, and so do empty strings except on text columns.
+    """
+
+    kind = type_kind(type_name)
+
+    if kind == 'text':
+        return lambda value: value if value is None or isinstance(value, (str, bytes)) else str(value)
+
+    converter = CONVERTERS[kind]
+
+    return lambda value: None if value is None or value == '' else converter(value)
+
+class Rejects:
+    """
+    Writes rows that could not be parsed, coerced or inserted to a JSON Lines file,
+    one `{"line", "error", "record"}` object per row. The file is only created on the first reject.
+    """
+
+    def __init__(
+        self,
+        path: str = None
+    ):
+        self.__path = path
+        self.__file = None
+        self.count = 0
+
+    def add(self, number: int, record, error: Exception) -> None:
+        self.count += 1
+
+        if self.__path is None:
+            return
+
+        if self.__file is None:
+            self.__file = open(self.__path, 'w', encoding='UTF-8')
+
+        self.__file.write(json.dumps({'line': number, 'error': str(error), 'record': record}, default=str) + '\n')
+
+    def close(self) -> None:
+        if self.__file is not None:
+            self.__file.close()
+
+def row_error(error: Exception) -> bool:
+    """Whether `error` is a data or integrity error of any driver, i.e. caused by the values of a row."""
+
+    return any(cls.__name__ in ROW_ERRORS for cls in type(error).__mro__)
+
+def import_records(
+    path: str,
+    format: str,
+    types: dict[str, str],
+    write: object,
+    mapping: dict[str, str] = None,
+    batch_size: int = 10000,
+    reject_path: str = None,
+    progress: object = None,
+    compression: str = None
+) -> dict:
+    """
+    Streams a CSV or JSON Lines file into a table through a backend bulk writer.
+
+    Args:
+        path (str):
+            Source file.
+        format (str):
+            'csv' (with header) or 'jsonl'.
+        types (dict[str, str]):
+            Declared type of each table column, see `column_types`.
+        write (callable):
+            `write(columns, rows)` inserts a batch of tuples, raising on failure.
+        mapping (dict[str, str], optional):
+            File field to table column. Defaults to every field of the first record that is a table column.
+        batch_size (int):
+            Number of rows per bulk insert.
+        reject_path (str, optional):
+            JSON Lines file receiving the rows that failed, see `Rejects`.
+        progress (callable, optional):
+            `progress(rows, rejected)` called after every batch.
+        compression (str, optional):
+            None, 'gzip' or 'zstd'.
+
+    Returns:
+        dict: rows, rejected, bytes, seconds, rows_per_second and bytes_per_second.
+    """
+
+    start = time.perf_counter()
+    rejects = Rejects(path=reject_path)
+    total = 0
+
+    def flush(batch: list) -> int:
+        try:
+            write(columns, [row for _, _, row in batch])
+            return len(batch)
+
+        # A lost connection, a missing table, ... is not about the rows and would fail every one.
+        except Exception as e:
+            if len(batch) == 1 or not row_error(e):
+                raise
+
+        # The batch failed as a whole: retry row by row to isolate the bad ones.
+        inserted = 0
+
+        for item in batch:
+            try:
+                inserted += flush([item])
+
+            except Exception as e:
+                if not row_error(e):
+                    raise
+
+                rejects.add(item[0], item[1], e)
+
+        return inserted
+
+    with open_input(path=path, compression=compression) as file:
+        records = iter_records(file, format)
+        first = next(records, None)
+
+        if first is None:
+            return dict(report(rows=0, path=path, start=start), rejected=0)
+
+        records = itertools.chain([first], records)
+
+        if mapping is None:
+            fields = [field for field in (first[1] if isinstance(first[1], dict) else {}) if field in types]
+            mapping = {field: field for field in fields}
+
+        fields = list(mapping)
+        columns = tuple(mapping[field] for field in fields)
+
+        if not columns:
+            raise ValueError('Nenhum campo do ficheiro corresponde a uma coluna da tabela.')
+
+        coercers = [coercer_for(types.get(column)) for column in columns]
+        batch: list = []
+
+        try:
+            for number, record in records:
+                try:
+                    if isinstance(record, Exception):
+                        raise record
+
+                    batch.append((number, record, tuple(coerce(record.get(field)) for coerce, field in zip(coercers, fields))))
+
+                except (ValueError, TypeError, ArithmeticError) as e:
+                    rejects.add(number, record if isinstance(record, dict) else None, e)
+                    continue
+
+                if len(batch) >= batch_size:
+                    total += flush(batch)
+                    batch = []
+
+                    if progress:
+                        progress(total, rejects.count)
+
+            if batch:
+                total += flush(batch)
+
+                if progress:
+                    progress(total, rejects.count)
+
+        finally:
+            rejects.close()
+
+    return dict(report(rows=total, path=path, start=start), rejected=rejects.count)
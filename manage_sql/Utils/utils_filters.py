@@ -0,0 +1,134 @@
+class Param:
+    """
+    A named placeholder of a `Filter`, bound to a value when the compiled filter is used.
+
+    Attributes:
+        name (str): Name given to `FilterTemplate.bind`.
+        like (bool): Wraps the bound value as `%value%`, for CONTAIN and NOT_CONTAIN.
+    """
+
+    __slots__ = ('name', 'like')
+
+    def __init__(
+        self,
+        name: str,
+        like: bool = False
+    ):
+        self.name = name
+        self.like = like
+
+    def __repr__(self) -> str:
+        return f'param({self.name!r})'
+
+def param(name: str) -> Param:
+    """
+    A placeholder to build a reusable filter.
+
+    Example:
+    ----------
+    >>> adults = db.filter_by('status').EQUAL(param('status')).AND.filterby('age').GATHER_THAN(param('age')).compile()
+    >>> db.select_data('users', condition=adults.bind(status='active', age=18))
+    """
+
+    return Param(name)
+
+def like_value(value):
+    """The value of a CONTAIN/NOT_CONTAIN filter: `%value%`, applied at bind time for a `Param`."""
+
+    if isinstance(value, Param):
+        return Param(value.name, like=True)
+
+    return f'%{value}%'
+
+def split_column(condition: str) -> tuple[str, str]:
+    """Splits a `Filter` condition into its text before the last column and that column."""
+
+    head, _, column = condition.rstrip().rpartition(' ')
+
+    return head, column
+
+def fixed_params(params: list) -> tuple:
+    """The parameters of a filter used directly, which must not contain placeholders."""
+
+    for value in params:
+        if isinstance(value, Param):
+            raise ValueError(f'O filtro tem o parâmetro {value.name!r} por ligar, use `compile().bind(...)`.')
+
+    return tuple(params)
+
+class BoundFilter:
+    """
+    A compiled filter with its values, accepted as `condition` wherever a `Filter` is.
+
+    Attributes:
+        sql (str): The `WHERE ...` clause.
+        params (tuple): The values of its placeholders, in order.
+    """
+
+    __slots__ = ('sql', 'params')
+
+    def __init__(
+        self,
+        sql: str,
+        params: tuple
+    ):
+        self.sql = sql
+        self.params = params
+
+class FilterTemplate:
+    """
+    An immutable, compiled `Filter`: the SQL is built once and every `bind` only
+    collects the values, so a filter reused in a loop costs no string work and
+    always produces the same statement text.
+
+    Attributes:
+        sql (str): The `WHERE ...` clause, with the placeholders of the backend.
+        names (tuple[str]): The names of the `param` placeholders, in order of first use.
+    """
+
+    __slots__ = ('__sql', '__values', '__slots', '__names')
+
+    def __init__(
+        self,
+        sql: str,
+        params: list
+    ):
+        self.__sql = sql
+        # The literal values, with the placeholders filled in by `bind` at (position, name, like).
+        self.__values = [None if isinstance(value, Param) else value for value in params]
+        self.__slots = tuple(
+            (index, value.name, value.like)
+            for index, value in enumerate(params) if isinstance(value, Param)
+        )
+        self.__names = tuple(dict.fromkeys(name for _, name, _ in self.__slots))
+
+    @property
+    def sql(self) -> str:
+        return self.__sql
+
+    @property
+    def names(self) -> tuple[str]:
+        return self.__names
+
+    def bind(self, values: dict = None, **named) -> BoundFilter:
+        """
+        Returns the filter with its placeholders replaced by `values` (or keyword arguments).
+
+        Raises:
+            ValueError: If a placeholder has no value.
+        """
+
+        if values:
+            named = {**values, **named}
+
+        params = self.__values.copy()
+
+        try:
+            for index, name, like in self.__slots:
+                params[index] = f'%{named[name]}%' if like else named[name]
+
+        except KeyError:
+            missing = [name for name in self.__names if name not in named]
+            raise ValueError(f'Faltam valores para os parâmetros {missing}.') from None
+
+        return BoundFilter(self.__sql, tuple(params))
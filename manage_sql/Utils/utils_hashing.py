@@ -0,0 +1,163 @@
+import hashlib as sh
+import hmac
+import itertools
+import os
+
+ALGORITHMS = ('sha512', 'pbkdf2_hmac', 'scrypt')
+EXECUTORS = ('thread', 'process')
+
+# Defaults follow the OWASP password storage recommendations for each algorithm.
+PBKDF2_ITERATIONS = 210000
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+SALT_BYTES = 16
+
+def check_algorithm(algorithm: str, executor: str = 'thread') -> None:
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f'O `algorithm` deve ser um de {ALGORITHMS}, e não {algorithm!r}.')
+
+    if executor not in EXECUTORS:
+        raise ValueError(f'O `executor` deve ser um de {EXECUTORS}, e não {executor!r}.')
+
+def hash_value(
+    value,
+    algorithm: str = 'sha512',
+    salt: bytes = None,
+    iterations: int = None,
+    hash_name: str = None,
+    n: int = None,
+    r: int = None,
+    p: int = None
+) -> str:
+    """
+    Hashes a value with SHA-512 or with a salted, iterated key derivation function.
+
+    Args:
+        value (str | bytes):
+            The value to hash.
+        algorithm (str):
+            'sha512' (plain digest, same result as `EncryptValue`), 'pbkdf2_hmac' or 'scrypt'.
+        salt (bytes, optional):
+            Salt of the key derivation functions. A random one is generated when omitted.
+        iterations (int, optional):
+            pbkdf2_hmac cost. Defaults to `PBKDF2_ITERATIONS`.
+        hash_name (str, optional):
+            Digest used by pbkdf2_hmac. Defaults to 'sha512'.
+        n, r, p (int, optional):
+            scrypt CPU/memory cost, block size and parallelization. Default to `SCRYPT_N`,
+            `SCRYPT_R` and `SCRYPT_P`.
+
+    Returns:
+        str: The hex digest for 'sha512'. For the key derivation functions a self describing
+        string with the parameters and the salt, e.g. `pbkdf2_sha512$210000$<salt>$<hash>`,
+        that `verify_hash` can check.
+
+    Raises:
+        ValueError: If `salt` or a cost option is given with 'sha512', which would ignore it.
+    """
+
+    check_algorithm(algorithm)
+
+    data = value if isinstance(value, bytes) else str(value).encode('UTF-8')
+
+    if algorithm == 'sha512':
+        options = {'salt': salt, 'iterations': iterations, 'hash_name': hash_name, 'n': n, 'r': r, 'p': p}
+        ignored = [name for name, option in options.items() if option is not None]
+
+        if ignored:
+            raise ValueError(f"O algoritmo 'sha512' não aceita {', '.join(ignored)}; use 'pbkdf2_hmac' ou 'scrypt'.")
+
+        return sh.sha512(data).hexdigest()
+
+    salt = os.urandom(SALT_BYTES) if salt is None else salt
+
+    if algorithm == 'pbkdf2_hmac':
+        iterations = PBKDF2_ITERATIONS if iterations is None else iterations
+        hash_name = 'sha512' if hash_name is None else hash_name
+        digest = sh.pbkdf2_hmac(hash_name, data, salt, iterations)
+
+        return f'pbkdf2_{hash_name}${iterations}${salt.hex()}${digest.hex()}'
+
+    n = SCRYPT_N if n is None else n
+    r = SCRYPT_R if r is None else r
+    p = SCRYPT_P if p is None else p
+
+    # OpenSSL rejects the default 32 MiB limit for n * r > 2**16, so the bound follows the cost.
+    digest = sh.scrypt(data, salt=salt, n=n, r=r, p=p, maxmem=256 * n * r + 2 ** 20, dklen=64)
+
+    return f'scrypt${n}${r}${p}${salt.hex()}${digest.hex()}'
+
+def verify_hash(value, hashed: str) -> bool:
+    """Checks `value` against a hash produced by `hash_value`, in constant time."""
+
+    if '$' not in hashed:
+        return hmac.compare_digest(hash_value(value), hashed)
+
+    algorithm, *parameters, salt, _ = hashed.split('$')
+
+    if algorithm == 'scrypt':
+        n, r, p = map(int, parameters)
+        expected = hash_value(value, algorithm='scrypt', salt=bytes.fromhex(salt), n=n, r=r, p=p)
+
+    elif algorithm.startswith('pbkdf2_'):
+        expected = hash_value(
+            value,
+            algorithm='pbkdf2_hmac',
+            salt=bytes.fromhex(salt),
+            iterations=int(parameters[0]),
+            hash_name=algorithm[len('pbkdf2_'):]
+        )
+
+    else:
+        raise ValueError(f'Formato de hash desconhecido: {algorithm!r}.')
+
+    return hmac.compare_digest(expected, hashed)
+
+def hash_chunk(values: list, options: dict) -> list[str]:
+    return [hash_value(value, **options) for value in values]
+
+def hash_values(values, workers: int = None, executor: str = 'thread', algorithm: str = 'sha512', **options) -> list[str]:
+    """
+    Hashes many values, keeping their order.
+
+    hashlib releases the GIL inside pbkdf2_hmac and scrypt (and for SHA-512 inputs over
+    2 KiB), so a thread pool scales with the cores for the key derivation functions. Short
+    SHA-512 inputs are GIL bound and only scale with `executor='process'`.
+
+    Args:
+        values (Iterable):
+            The values to hash.
+        workers (int, optional):
+            Pool size. Defaults to `os.cpu_count()`; 1 hashes serially without a pool.
+        executor (str):
+            'thread' or 'process'.
+        algorithm (str):
+            See `hash_value`.
+        **options:
+            Cost parameters forwarded to `hash_value` (`iterations`, `hash_name`, `n`, `r`, `p`).
+            A `salt` given here is shared by every value, leave it out to salt each one randomly.
+
+    Returns:
+        list[str]: One hash per value.
+    """
+
+    check_algorithm(algorithm, executor)
+
+    values = list(values)
+    options = dict(options, algorithm=algorithm)
+    workers = min(workers or os.cpu_count() or 1, len(values))
+
+    if workers <= 1:
+        return hash_chunk(values, options)
+
+    # Imported here, only batches need it and it would otherwise add to `import manage_sql`.
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    # A few chunks per worker: one task per value would cost more than a SHA-512 digest.
+    size = -(-len(values) // (workers * 4))
+    chunks = [values[start:start + size] for start in range(0, len(values), size)]
+    pool = ThreadPoolExecutor if executor == 'thread' else ProcessPoolExecutor
+
+    with pool(max_workers=workers) as executor_pool:
+        return [hashed for chunk in executor_pool.map(hash_chunk, chunks, itertools.repeat(options)) for hashed in chunk]
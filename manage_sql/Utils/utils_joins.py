@@ -0,0 +1,84 @@
+class Join:
+    """
+    The FROM clause of a query over several tables, accepted as `tablename` by `select_data`,
+    `aggregate`, `count` and `exists`, so the database does the join in one roundtrip.
+
+    Each join matches column pairs: an unqualified left column belongs to the base table and an
+    unqualified right column to the joined one. Columns of the selection, `Filter` and `order_by`
+    are written as `table.column` (or `alias.column`).
+
+    Attributes:
+        table (str): The base table.
+        name (str): The name that qualifies the base table's columns, its alias or the table itself.
+
+    Example:
+    ----------
+    >>> orders = db.join('orders').INNER('customers', on=('customer_id', 'id')).LEFT('addresses', on=('customers.address_id', 'id'))
+    >>> db.select_data(orders, columns=['orders.id', 'customers.id', 'customers.name', 'addresses.city'], condition=db.filter_by('orders.total').GATHER_THAN(100))
+    """
+
+    __slots__ = ('table', 'name', '__clause')
+
+    def __init__(
+        self,
+        table: str,
+        alias: str = None
+    ):
+        self.table = table
+        self.name = alias or table
+        self.__clause = f'{table} AS {alias}' if alias else table
+
+    def INNER(self, table: str, on: tuple[str, str] | list[tuple[str, str]], alias: str = None):
+        """Adds an `INNER JOIN`: only the rows with a match in `table`."""
+
+        return self.__join('INNER JOIN', table, on, alias)
+
+    def LEFT(self, table: str, on: tuple[str, str] | list[tuple[str, str]], alias: str = None):
+        """Adds a `LEFT JOIN`: every row, with NULLs where `table` has no match."""
+
+        return self.__join('LEFT JOIN', table, on, alias)
+
+    @property
+    def sql(self) -> str:
+        return self.__clause
+
+    def __str__(self) -> str:
+        return self.__clause
+
+    def __join(self, kind: str, table: str, on: tuple[str, str] | list[tuple[str, str]], alias: str):
+        name = alias or table
+        pairs = [on] if isinstance(on[0], str) else on
+
+        if not pairs or any(len(pair) != 2 for pair in pairs):
+            raise ValueError(f'O `on` do join com `{table}` deve ser um par (coluna, coluna) ou uma lista de pares.')
+
+        conditions = ' AND '.join(f'{qualify(left, self.name)} = {qualify(right, name)}' for left, right in pairs)
+        self.__clause += f" {kind} {table}{f' AS {alias}' if alias else ''} ON {conditions}"
+
+        return self
+
+def qualify(column: str, table: str) -> str:
+    return column if '.' in column else f'{table}.{column}'
+
+def output_name(column: str) -> str:
+    """The name a selected column gets in the result: its alias, or the column without the table."""
+
+    return column.rpartition(' AS ')[2].rpartition('.')[2]
+
+def selection(tablename, columns: list[str]) -> list[str]:
+    """
+    The columns of a SELECT. Over a `Join`, a qualified column whose name is selected more than
+    once (e.g. `orders.id` and `customers.id`) is renamed `orders_id` and `customers_id`, so
+    the names of a 'dict' or 'namedtuple' row do not collide.
+    """
+
+    if not isinstance(tablename, Join):
+        return columns
+
+    names = [output_name(column) for column in columns]
+    repeated = {name for name in names if names.count(name) > 1}
+
+    return [
+        f"{column} AS {column.replace('.', '_')}" if name in repeated and '.' in column and ' ' not in column else column
+        for column, name in zip(columns, names)
+    ]
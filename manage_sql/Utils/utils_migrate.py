@@ -0,0 +1,480 @@
+import json
+import os
+import queue
+import re
+import threading
+import time
+from datetime import date, datetime, time as day_time, timedelta, timezone
+from decimal import Decimal
+
+try:
+    from ..Utils.utils_rows import type_kind
+    from ..Utils import utils_mysql, utils_postgres, utils_sqlite
+
+except:
+    from .utils_rows import type_kind
+    from . import utils_mysql, utils_postgres, utils_sqlite
+
+BLOB_TYPES = ('blob', 'bytea', 'binary', 'varbinary', 'tinyblob', 'mediumblob', 'longblob')
+VARCHAR_TYPE = re.compile(r'^(var)?char(acter)?( varying)?\s*\((\d+)\)')
+DECIMAL_TYPE = re.compile(r'^(decimal|numeric)\s*\((\d+)\s*,\s*(\d+)\)')
+# The precision given to MySQL for a DECIMAL/NUMERIC declared without one.
+DEFAULT_DECIMAL = (38, 10)
+# The largest value of the 4-byte `id` that `create_table` adds on PostgreSQL and MySQL.
+MAX_SERIAL = 2 ** 31 - 1
+# Widens that `id` for larger ids, which a SQLite table can have.
+BIGINT_ID = {
+    'postgresql': 'ALTER TABLE {} ALTER COLUMN id TYPE bigint',
+    'mysql': 'ALTER TABLE {} MODIFY id BIGINT AUTO_INCREMENT'
+}
+NATIVE_TYPES = (type(None), int, float, str, bytes)
+
+def dialect(db) -> str:
+    """Returns 'sqlite', 'postgresql' or 'mysql' from the `Column_types` of a backend."""
+
+    types = getattr(db, 'Column_types', None)
+
+    if types is utils_sqlite.Types:
+        return 'sqlite'
+
+    if isinstance(types, utils_postgres.Types):
+        return 'postgresql'
+
+    if isinstance(types, utils_mysql.Types):
+        return 'mysql'
+
+    raise ValueError(f'O banco deve ser um SQLITE, ShardedSQLITE, POSTGRESQL ou MYSQL, e não {type(db).__name__}.')
+
+def column_kind(type_name: str, source: str = None) -> tuple:
+    """
+    Classifies a declared column type for the migration.
+
+    Returns:
+        tuple: The kind of `type_kind` (with 'bigint', 'blob' and 'varchar' added), followed by
+        the length of a varchar or the precision and scale of a decimal when they are declared.
+    """
+
+    name = str(type_name or '').strip().lower()
+
+    # SQLite stores every INTEGER in up to 8 bytes, e.g. epoch milliseconds.
+    if source == 'sqlite' and type_kind(name) == 'integer':
+        return ('bigint',)
+
+    if name == 'array':
+        return ('array',)
+
+    if name.startswith(BLOB_TYPES):
+        return ('blob',)
+
+    kind = type_kind(name)
+
+    if kind == 'integer' and (name.startswith(('bigint', 'bigserial')) or 'unsigned' in name):
+        return ('bigint',)
+
+    if kind == 'decimal':
+        match = DECIMAL_TYPE.match(name)
+
+        return ('decimal', int(match.group(2)), int(match.group(3))) if match else ('decimal',)
+
+    if kind == 'text':
+        match = VARCHAR_TYPE.match(name)
+
+        return ('varchar', int(match.group(4))) if match else ('text',)
+
+    return (kind,)
+
+def sqlite_type(kind: tuple, types) -> utils_sqlite.Types:
+    if kind[0] in ('integer', 'bigint', 'bool'):
+        return types.integer
+
+    if kind[0] in ('float', 'decimal'):
+        return types.real
+
+    if kind[0] == 'blob':
+        return types.blob
+
+    return types.text
+
+def postgres_type(kind: tuple, types: utils_postgres.Types) -> str:
+    if kind[0] == 'varchar':
+        return types.Char(kind[1]).varchar
+
+    if kind[0] == 'decimal':
+        return types.Decimal(*kind[1:]).numeric if len(kind) == 3 else 'numeric'
+
+    return {
+        'integer': types.Integer.integer,
+        'bigint': types.Integer.bigint,
+        'bool': types.Boolean,
+        'float': types.Float().double_precision,
+        'date': types.DateTime.date,
+        'datetime': types.DateTime.timestamp,
+        'timestamptz': types.DateTime.timestamp_with_time_zone,
+        'time': types.DateTime.time,
+        'json': types.Json().jsonb,
+        'array': types.Json().jsonb,
+        'blob': 'bytea'
+    }.get(kind[0], types.Text)
+
+def mysql_type(kind: tuple, types: utils_mysql.Types) -> str:
+    if kind[0] == 'varchar':
+        return types.Char(kind[1]).varchar
+
+    if kind[0] == 'decimal':
+        return types.Decimal(*(kind[1:] if len(kind) == 3 else DEFAULT_DECIMAL)).decimal
+
+    # FLOAT, DOUBLE, TIME and JSON are not in `Types`.
+    return {
+        'integer': types.Integer.integer,
+        'bigint': types.Integer.bigint,
+        'bool': 'BOOLEAN',
+        'float': 'DOUBLE',
+        'date': types.DateTime.date,
+        'datetime': types.DateTime.datetime,
+        'timestamptz': types.DateTime.datetime,
+        'time': 'TIME',
+        'json': 'JSON',
+        'array': 'JSON',
+        'blob': types.Blob.longblob
+    }.get(kind[0], types.Text.longtext)
+
+TARGET_TYPES = {
+    'sqlite': sqlite_type,
+    'postgresql': postgres_type,
+    'mysql': mysql_type
+}
+
+def target_type(type_name: str, source: str, target: str, types):
+    """Maps a column type declared in the `source` dialect to the `Types` of the `target` dialect."""
+
+    return TARGET_TYPES[target](column_kind(type_name, source), types)
+
+def sqlite_value(value):
+    """Converts a value read from PostgreSQL or MySQL to one that sqlite3 binds."""
+
+    if isinstance(value, NATIVE_TYPES) and not isinstance(value, bool):
+        return value
+
+    if isinstance(value, bool):
+        return int(value)
+
+    if isinstance(value, Decimal):
+        return float(value)
+
+    if isinstance(value, (date, day_time)):
+        return value.isoformat()
+
+    if isinstance(value, (bytearray, memoryview)):
+        return bytes(value)
+
+    if isinstance(value, (dict, list, tuple)):
+        return json.dumps(value, default=str)
+
+    return str(value)
+
+def server_value(value):
+    """Converts the values that psycopg and mysql.connector do not bind on their own."""
+
+    if isinstance(value, NATIVE_TYPES + (bool, Decimal, date, day_time, timedelta)):
+        return value
+
+    if isinstance(value, (bytearray, memoryview)):
+        return bytes(value)
+
+    if isinstance(value, (dict, list, tuple)):
+        return json.dumps(value, default=str)
+
+    return str(value)
+
+def mysql_value(value):
+    # DATETIME has no time zone, so aware timestamps are stored in UTC.
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+    return server_value(value)
+
+def postgres_bool(value):
+    # MySQL booleans are read back as TINYINT(1) integers.
+    return value if value is None else bool(value)
+
+VALUE_CONVERTERS = {
+    'sqlite': sqlite_value,
+    'postgresql': server_value,
+    'mysql': mysql_value
+}
+
+def row_converter(kinds: list[tuple], target: str):
+    """Returns the function that converts a source row to the values bound by the `target` dialect."""
+
+    converters = [
+        postgres_bool if target == 'postgresql' and kind[0] == 'bool' else VALUE_CONVERTERS[target]
+        for kind in kinds
+    ]
+
+    def convert(row: tuple) -> tuple:
+        return tuple(converter(value) for converter, value in zip(converters, row))
+
+    return convert
+
+def source_columns(db, tablename: str, source: str) -> dict[str, str]:
+    """Returns the declared type of each column of `tablename`, without the generated search columns."""
+
+    generated = {
+        'postgresql': utils_postgres.SEARCH_COLUMN,
+        'mysql': utils_mysql.SEARCH_COLUMN
+    }.get(source)
+
+    for table in db.tables:
+        if table.name == tablename:
+            columns: dict[str, str] = {}
+
+            for column in table.columns:
+                # The columns of PostgreSQL are listed once per constraint of the table.
+                if column.name != generated and column.name not in columns:
+                    columns[column.name] = getattr(column.type, 'value', column.type)
+
+            return columns
+
+    raise ValueError(f'A tabela {tablename!r} não existe no banco de origem.')
+
+def read_checkpoint(path: str, tablename: str) -> dict:
+    if not path or not os.path.exists(path):
+        return {}
+
+    with open(path, 'r', encoding='UTF-8') as file:
+        state = json.load(file)
+
+    if state.get('tablename') != tablename:
+        raise ValueError(f'O checkpoint {path!r} é da tabela {state.get("tablename")!r}, e não {tablename!r}.')
+
+    return state
+
+def write_checkpoint(path: str, state: dict) -> None:
+    """Replaces the checkpoint file atomically, so an interrupted write never leaves it truncated."""
+
+    temporary = f'{path}.tmp'
+
+    with open(temporary, 'w', encoding='UTF-8') as file:
+        json.dump(state, file)
+
+    os.replace(temporary, path)
+
+class Progress:
+    """
+    Tracks the batches written by the workers, which may finish out of order.
+
+    The checkpoint only moves past a batch once every batch before it is written, so
+    every row up to `last_id` is in the target.
+    """
+
+    def __init__(self, tablename: str, last_id, rows: int, checkpoint: str = None):
+        self.tablename = tablename
+        self.last_id = last_id
+        self.rows = rows
+        self.batches = 0
+        self.__checkpoint = checkpoint
+        self.__next = 0
+        self.__written: dict[int, tuple] = {}
+        self.__lock = threading.Lock()
+
+    def written(self, number: int, last_id, rows: int) -> None:
+        with self.__lock:
+            self.__written[number] = (last_id, rows)
+
+            if self.__next not in self.__written:
+                return
+
+            while self.__next in self.__written:
+                self.last_id, count = self.__written.pop(self.__next)
+                self.rows += count
+                self.batches += 1
+                self.__next += 1
+
+            self.save()
+
+    def save(self, done: bool = False) -> None:
+        if self.__checkpoint:
+            write_checkpoint(self.__checkpoint, {
+                'tablename': self.tablename,
+                'last_id': self.last_id,
+                'rows': self.rows,
+                'done': done
+            })
+
+def report(progress: Progress, rows: int, start: float) -> dict:
+    """Builds the summary returned by `migrate_table`."""
+
+    seconds = time.perf_counter() - start
+
+    return {
+        'rows': rows,
+        'batches': progress.batches,
+        'last_id': progress.last_id,
+        'seconds': round(seconds, 6),
+        'rows_per_second': round(rows / seconds, 3) if seconds else 0.0
+    }
+
+def migrate_table(
+    source_db,
+    target_db,
+    tablename: str,
+    batch_size: int = 10000,
+    workers: int = 1,
+    checkpoint: str = None
+) -> dict:
+    """
+    Copies a table to another database, of the same or of another backend.
+
+    The target table is created with the column types mapped between the `Types` of
+    SQLITE, POSTGRESQL and MYSQL, unless it already exists. The rows are read in `id`
+    order, `batch_size` at a time, while `workers` threads insert the previous batches
+    with `insert_rows` (`executemany` on SQLite, multi-row `INSERT ... VALUES` on the servers).
+    The ids are kept, so the rows can be matched between the two databases.
+
+    Args:
+        source_db (SQLITE | POSTGRESQL | MYSQL):
+            The database the table is read from.
+        target_db (SQLITE | ShardedSQLITE | POSTGRESQL | MYSQL):
+            The database the table is copied to.
+        tablename (str):
+            The table to copy. It must have the `id` column created by `create_table`.
+        batch_size (int):
+            Rows read and inserted at a time. Defaults to 10000.
+        workers (int):
+            Threads inserting batches in the target. Defaults to 1.
+        checkpoint (str, optional):
+            JSON file with the last `id` copied, written once the target table is created. When
+            it exists the copy resumes from it, after deleting the target rows past that `id`.
+
+    Returns:
+        dict: rows, batches, last_id, seconds and rows_per_second of this run.
+
+    Raises:
+        ValueError: If the table has no `id` column or the checkpoint is of another table.
+
+    Example:
+    ----------
+    >>> migrate_table(SQLITE('loja'), POSTGRESQL(...), 'clientes', checkpoint='clientes.json')
+    {'rows': 250000, 'batches': 25, 'last_id': 250000, 'seconds': 4.2, 'rows_per_second': ...}
+    """
+
+    if batch_size < 1:
+        raise ValueError(f'O `batch_size` deve ser maior que zero, e não {batch_size}.')
+
+    if workers < 1:
+        raise ValueError(f'O número de `workers` deve ser maior que zero, e não {workers}.')
+
+    # The shards of a ShardedSQLITE each number their own ids.
+    if not hasattr(source_db, 'execute_query'):
+        raise ValueError(f'O `source_db` deve ser um SQLITE, POSTGRESQL ou MYSQL, e não {type(source_db).__name__}.')
+
+    start = time.perf_counter()
+    source = dialect(source_db)
+    target = dialect(target_db)
+    columns = source_columns(source_db, tablename, source)
+
+    if 'id' not in columns:
+        raise ValueError(f'A tabela {tablename!r} deve ter a coluna `id` para ser migrada.')
+
+    state = read_checkpoint(checkpoint, tablename)
+    progress = Progress(tablename, state.get('last_id'), state.get('rows', 0), checkpoint)
+
+    if state.get('done'):
+        return report(progress, 0, start)
+
+    names = ['id', *(name for name in columns if name != 'id')]
+
+    if not any(table.name == tablename for table in target_db.tables):
+        target_db.create_table(tablename, [
+            target_db.Column(name, target_type(columns[name], source, target, target_db.Column_types))
+            for name in names[1:]
+        ])
+
+        if target in BIGINT_ID and (source_db.execute_query(f'SELECT MAX(id) FROM {tablename}')[0][0] or 0) > MAX_SERIAL:
+            target_db.execute_query(BIGINT_ID[target].format(tablename))
+
+        # Recorded before the first batch, so a resume knows the rows in the table are its own.
+        progress.save()
+
+    elif state:
+        # Rows past the checkpoint, or all of them before the first one, may have been written by
+        # batches that were not confirmed.
+        if progress.last_id is None:
+            target_db.detele_data(tablename)
+
+        else:
+            target_db.detele_data(tablename, target_db.delete_by('id').GATHER_THAN(progress.last_id))
+
+    convert = row_converter([column_kind(columns[name], source) for name in names], target)
+    select = f"SELECT {', '.join(names)} FROM {tablename} {{}} ORDER BY id LIMIT {int(batch_size)}"
+    batches: queue.Queue = queue.Queue(maxsize=workers * 2)
+    failures: list[Exception] = []
+    failed = threading.Event()
+    rows_before = progress.rows
+
+    def write() -> None:
+        while True:
+            batch = batches.get()
+
+            if batch is None:
+                return
+
+            # After a failure the queue is still drained, so the reader is never blocked.
+            if failed.is_set():
+                continue
+
+            number, rows = batch
+
+            try:
+                target_db.insert_rows(tablename, names, [convert(row) for row in rows])
+                progress.written(number, rows[-1][0], len(rows))
+
+            except Exception as e:
+                failures.append(e)
+                failed.set()
+
+    threads = [threading.Thread(target=write, daemon=True) for _ in range(workers)]
+
+    for thread in threads:
+        thread.start()
+
+    try:
+        last_id = progress.last_id
+        number = 0
+
+        while not failed.is_set():
+            if last_id is None:
+                rows = source_db.execute_query(select.format(''))
+
+            else:
+                condition = source_db.filter_by('id').GATHER_THAN(last_id)
+                rows = source_db.execute_query(select.format(condition.sql), condition.params)
+
+            if not rows:
+                break
+
+            batches.put((number, rows))
+            last_id = rows[-1][0]
+            number += 1
+
+    except BaseException:
+        failed.set()
+        raise
+
+    finally:
+        for _ in threads:
+            batches.put(None)
+
+        for thread in threads:
+            thread.join()
+
+    if failures:
+        raise failures[0]
+
+    if target == 'postgresql':
+        # The ids were inserted explicitly, so the sequence of `id` is moved past them.
+        target_db.execute_script(f"SELECT setval(pg_get_serial_sequence('{tablename}', 'id'), MAX(id)) FROM {tablename}")
+
+    progress.save(done=True)
+
+    return report(progress, progress.rows - rows_before, start)
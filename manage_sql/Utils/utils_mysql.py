@@ -1,6 +1,14 @@
 import hashlib as sh
 import json
 
+try:
+    from ..Utils.utils_filters import FilterTemplate, like_value, fixed_params, split_column
+    from ..Utils.utils_partitions import INTERVALS
+
+except:
+    from .utils_filters import FilterTemplate, like_value, fixed_params, split_column
+    from .utils_partitions import INTERVALS
+
 class EncryptValue:
     """
     Encrypts a given value using SHA-512 hashing.
@@ -226,12 +234,12 @@ class Types:
     def Enum(self, values: tuple[str]) -> str:
         """Defines an SQL ENUM type with the provided values."""
 
-        return f'ENUM({', '.join(values)})'
+        return f"ENUM({', '.join(values)})"
     
     def Set(self, values: tuple[str]) -> str:
         """Defines an SQL SET type with the provided values."""
 
-        return f'SET({', '.join(values)})'
+        return f"SET({', '.join(values)})"
     
     Integer = __Integer()
     Text = __Text()
@@ -265,6 +273,11 @@ class Column:
             The action to take on update (e.g., `CURRENT_TIMESTAMP`).
     """
 
+    __slots__ = (
+        'name', 'type', 'column_parameters', '__primary_key', '__auto_increment',
+        '__unique', '__not_null', '__default_value', '__unsigned', '__on_update'
+    )
+
     def __init__(
         self,
         name: str,
@@ -340,6 +353,8 @@ class Column:
         return json.dumps(self.__to_dict(), indent=4)
 
 class Table:
+    __slots__ = ('columns', 'name')
+
     def __init__(
         self,
         name: str
@@ -357,7 +372,74 @@ class Table:
     def to_json(self):
         return json.dumps(self.__to_dict(), indent=4)
 
+SEARCH_COLUMN = 'search_text'
+
+ROW_FORMATS = ('DEFAULT', 'DYNAMIC', 'COMPRESSED', 'COMPACT', 'REDUNDANT', 'FIXED')
+KEY_BLOCK_SIZES = (1, 2, 4, 8, 16)
+PARTITION_METHODS = ('range', 'hash')
+# The range partition of the rows after the last interval.
+MAXVALUE_PARTITION = 'pmax'
+
+class Partition:
+    """
+    How `create_table` partitions a table. A `Filter` on `column` then reads only the partitions
+    that can hold the matching rows.
+
+    Attributes:
+        column (str):
+            The partition key.
+        method (str):
+            'range' (default): one partition per `interval` of a DATE or DATETIME column, kept by
+            `maintain_partitions`. 'hash': `modulus` partitions of about the same size, on an
+            integer column.
+        interval (str):
+            'day', 'week', 'month' (default) or 'year', for 'range'.
+        ahead (int):
+            Future intervals created in advance, for 'range'. Defaults to 3.
+        modulus (int):
+            Number of partitions, for 'hash'.
+        default (bool):
+            Also creates a `pmax` partition for the rows after the last interval, for 'range'.
+            Defaults to False, which rejects those rows.
+    """
+
+    __slots__ = ('column', 'method', 'interval', 'ahead', 'modulus', 'default')
+
+    def __init__(
+        self,
+        column: str,
+        method: str = 'range',
+        interval: str = 'month',
+        ahead: int = 3,
+        modulus: int = None,
+        default: bool = False
+    ):
+        """
+        Example:
+        ----------
+        >>> Partition('created_at', interval='month', ahead=3)
+        >>> Partition('user_id', 'hash', modulus=8)
+        """
+
+        if method not in PARTITION_METHODS:
+            raise ValueError(f'O `method` deve ser um de {PARTITION_METHODS}, e não {method!r}.')
+
+        if method == 'range' and interval not in INTERVALS:
+            raise ValueError(f'O `interval` deve ser um de {INTERVALS}, e não {interval!r}.')
+
+        if method == 'hash' and not (isinstance(modulus, int) and modulus > 0):
+            raise ValueError('Uma partição por hash precisa de um `modulus` inteiro positivo.')
+
+        self.column = column
+        self.method = method
+        self.interval = interval
+        self.ahead = ahead
+        self.modulus = modulus
+        self.default = default and method == 'range'
+
 class Filter:
+    __slots__ = ('column_name', '__condition', '__params')
+
     def __init__(
         self,
         column: str
@@ -424,13 +506,24 @@ class Filter:
     def CONTAIN(self, value):
         """Adds a 'LIKE' filter for partial matches."""
 
-        self.__add_filter(condition='LIKE', value=f'%{value}%')
+        self.__add_filter(condition='LIKE', value=like_value(value))
         return self
     
     def NOT_CONTAIN(self, value):
         """Adds a 'NOT LIKE' filter for partial matches."""
 
-        self.__add_filter(condition='NOT LIKE', value=f'%{value}%')
+        self.__add_filter(condition='NOT LIKE', value=like_value(value))
+        return self
+    
+    def MATCH(self, value):
+        """
+        Adds a full-text search on the table of the filter, e.g. `filter_by('posts').MATCH('mysql postgres')`.
+        Looks the words up in the FULLTEXT index of `create_search_index`, in natural language mode.
+        """
+
+        head, table = split_column(self.__condition)
+        self.__params.append(value)
+        self.__condition = f'{head} MATCH ({table}.{SEARCH_COLUMN}) AGAINST (%s IN NATURAL LANGUAGE MODE) '
         return self
     
     def __add_filter(self, condition: str, value):
@@ -439,7 +532,29 @@ class Filter:
         self.__params.append(value)
         self.__condition += f'{condition} %s '
 
+    @property
+    def sql(self) -> str:
+        """The `WHERE ...` clause."""
+
+        return self.__condition.strip()
+
+    @property
+    def params(self) -> tuple:
+        """The values of the clause's placeholders, in order."""
+
+        return fixed_params(self.__params)
+
+    def compile(self) -> FilterTemplate:
+        """
+        Freezes the filter into a reusable template whose `param(...)` placeholders
+        are given values with `bind(...)`.
+        """
+
+        return FilterTemplate(self.sql, self.__params)
+
 class ColumnData:
+    __slots__ = ('column', 'value')
+
     def __init__(
         self,
         column: str,
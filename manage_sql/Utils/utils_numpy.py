@@ -0,0 +1,122 @@
+from .utils_rows import column_names, type_kind
+
+# numpy and pandas are imported on first use, they would otherwise dominate `import manage_sql`.
+np = None
+pd = None
+
+DTYPES = {
+    'integer': 'i8',
+    'float': 'f8',
+    'decimal': 'f8',
+    'bool': '?',
+    'date': 'M8[D]',
+    'datetime': 'M8[us]'
+}
+
+def require_numpy() -> None:
+    global np
+
+    if np is None:
+        try:
+            import numpy as np
+
+        except ImportError:
+            raise ImportError('O numpy não está instalado. Instale com `pip install manage-sql[numpy]`.') from None
+
+def require_pandas() -> None:
+    global pd
+
+    if pd is None:
+        try:
+            import pandas as pd
+
+        except ImportError:
+            raise ImportError('O pandas não está instalado. Instale com `pip install manage-sql[pandas]`.') from None
+
+def dtype_for(type_name: str) -> str:
+    """
+    Maps a declared column type (as reported by `tables`) to a NumPy dtype.
+
+    Integers map to `int64`, floating point and decimal types to `float64`, booleans to `bool`,
+    dates and timestamps without time zone to `datetime64`, and everything else (text, blobs,
+    arrays, json, ...) to `object`.
+    """
+
+    return DTYPES.get(type_kind(type_name), 'O')
+
+def assign(buffer, start: int, end: int, values: tuple):
+    """
+    Copies a chunk of values into a column buffer.
+
+    NULLs cannot be stored in `int64` or `bool` buffers, so the first chunk containing one
+    upcasts the buffer to `float64` (NaN) or `object` respectively.
+    """
+
+    if buffer.dtype.kind in 'ib' and None in values:
+        buffer = buffer.astype('f8' if buffer.dtype.kind == 'i' else 'O')
+
+    buffer[start:end] = values
+
+    return buffer
+
+def fill_columns(cursor, types: dict[str, str], capacity: int, chunk_size: int = 10000) -> dict:
+    """
+    Fills one preallocated typed buffer per column, chunk by chunk from `cursor.fetchmany`.
+
+    Args:
+        cursor:
+            A cursor on which the SELECT has already been executed.
+        types (dict[str, str]):
+            Declared type of each column name, see `column_types`.
+        capacity (int):
+            Expected number of rows (usually a `COUNT(*)` of the same query). The buffers grow
+            if more rows arrive and are trimmed if fewer do.
+        chunk_size (int):
+            Number of rows requested per `fetchmany` call.
+
+    Returns:
+        dict[str, numpy.ndarray]: The column buffers, in select order.
+    """
+
+    require_numpy()
+
+    # Server-side cursors only expose `description` after the first fetch.
+    rows = cursor.fetchmany(chunk_size)
+    names = column_names(cursor.description)
+    buffers = [np.empty(capacity, dtype=dtype_for(types.get(name))) for name in names]
+    size = 0
+
+    while rows:
+        end = size + len(rows)
+
+        if end > capacity:
+            capacity = max(end, capacity * 2)
+            buffers = [np.concatenate([buffer, np.empty(capacity - len(buffer), dtype=buffer.dtype)]) for buffer in buffers]
+
+        for index, values in enumerate(zip(*rows)):
+            buffers[index] = assign(buffers[index], size, end, values)
+
+        size = end
+        rows = cursor.fetchmany(chunk_size)
+
+    return {name: buffer[:size] for name, buffer in zip(names, buffers)}
+
+def to_structured(columns: dict):
+    """Packs the column buffers into a structured NumPy array."""
+
+    require_numpy()
+
+    size = len(next(iter(columns.values()))) if columns else 0
+    result = np.empty(size, dtype=[(name, buffer.dtype) for name, buffer in columns.items()])
+
+    for name, buffer in columns.items():
+        result[name] = buffer
+
+    return result
+
+def to_frame(columns: dict):
+    """Wraps the column buffers in a pandas DataFrame without copying them."""
+
+    require_pandas()
+
+    return pd.DataFrame(columns, copy=False)
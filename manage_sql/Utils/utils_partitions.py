@@ -0,0 +1,54 @@
+import re
+from datetime import date, timedelta
+
+INTERVALS = ('day', 'week', 'month', 'year')
+
+def period_start(day: date, interval: str) -> date:
+    """The first day of the `interval` that contains `day`."""
+
+    if interval == 'day':
+        return day
+
+    if interval == 'week':
+        return day - timedelta(days=day.weekday())
+
+    if interval == 'month':
+        return day.replace(day=1)
+
+    return day.replace(month=1, day=1)
+
+def next_period(start: date, interval: str, count: int = 1) -> date:
+    """The first day of the `count`-th `interval` after (or before, when negative) the one starting at `start`."""
+
+    if interval == 'day':
+        return start + timedelta(days=count)
+
+    if interval == 'week':
+        return start + timedelta(weeks=count)
+
+    if interval == 'month':
+        months = start.year * 12 + start.month - 1 + count
+        return date(months // 12, months % 12 + 1, 1)
+
+    return date(start.year + count, 1, 1)
+
+def partition_name(prefix: str, start: date, interval: str) -> str:
+    """`<prefix>2024_01` for a month, `<prefix>2024_01_15` for a day or week, `<prefix>2024` for a year."""
+
+    if interval == 'year':
+        return f'{prefix}{start:%Y}'
+
+    if interval == 'month':
+        return f'{prefix}{start:%Y_%m}'
+
+    return f'{prefix}{start:%Y_%m_%d}'
+
+def partition_start(prefix: str, name: str) -> date | None:
+    """The first day of a partition named by `partition_name`, None for any other partition."""
+
+    match = re.fullmatch(rf'{re.escape(prefix)}(\d{{4}})(?:_(\d{{2}}))?(?:_(\d{{2}}))?', name)
+
+    if match is None:
+        return None
+
+    return date(int(match[1]), int(match[2] or 1), int(match[3] or 1))
@@ -0,0 +1,245 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+
+SCHEMA_CHANGE = re.compile(r'^\s*(create|alter|drop|truncate|rename)\b', re.IGNORECASE)
+
+def is_schema_change(query: str) -> bool:
+    """Whether a raw query changes the schema, which makes the prepared statements of a table stale."""
+
+    return bool(SCHEMA_CHANGE.match(query))
+
+class PreparedStats:
+    """
+    Counters of the statements run through `PreparedStatements`, shared by every pooled
+    connection of a backend.
+
+    An execution is a `hit` when it reuses a prepared statement, a `prepare` when it is the
+    one that prepares it and a `miss` while the statement is still below the threshold.
+    """
+
+    __slots__ = ('__lock', '__counts')
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__counts = dict.fromkeys(('hits', 'prepares', 'misses', 'evictions'), 0)
+
+    def add(self, counter: str) -> None:
+        with self.__lock:
+            self.__counts[counter] += 1
+
+    def snapshot(self) -> dict:
+        with self.__lock:
+            counts = dict(self.__counts)
+
+        executions = counts['hits'] + counts['prepares'] + counts['misses']
+
+        return {
+            'executions': executions,
+            **counts,
+            'hit_rate': round(counts['hits'] / executions, 4) if executions else 0.0
+        }
+
+class PreparedStatements:
+    """
+    LRU of the statements run on one connection and of their server-side prepared handles.
+
+    A statement is prepared the `threshold`-th time it runs on the connection and its
+    handle is reused afterwards. When more than `capacity` statements are tracked, the least
+    recently used one is dropped and its handle given to `deallocate`.
+    """
+
+    __slots__ = ('threshold', 'capacity', '__stats', '__deallocate', '__entries', '__names')
+
+    def __init__(
+        self,
+        threshold: int,
+        capacity: int,
+        stats: PreparedStats,
+        deallocate: object = None
+    ):
+        self.threshold = threshold
+        self.capacity = capacity
+        self.__stats = stats
+        self.__deallocate = deallocate
+        # Query to [executions, handle].
+        self.__entries: OrderedDict[str, list] = OrderedDict()
+        self.__names = 0
+
+    def use(self, query: str, prepare: object):
+        """
+        Counts an execution of `query` and returns its prepared handle, calling `prepare(name)`
+        on the execution that reaches the threshold. Returns None while the statement is cold.
+        """
+
+        entries = self.__entries
+        entry = entries.get(query)
+
+        if entry is None:
+            if len(entries) >= self.capacity:
+                _, (_, handle) = entries.popitem(last=False)
+
+                if handle is not None:
+                    self.__stats.add('evictions')
+
+                    if self.__deallocate is not None:
+                        self.__deallocate(handle)
+
+            entry = entries[query] = [0, None]
+
+        else:
+            entries.move_to_end(query)
+
+        if entry[1] is not None:
+            self.__stats.add('hits')
+            return entry[1]
+
+        entry[0] += 1
+
+        if entry[0] < self.threshold:
+            self.__stats.add('misses')
+            return None
+
+        self.__names += 1
+        entry[1] = prepare(f'manage_sql_{self.__names}')
+        self.__stats.add('prepares')
+
+        return entry[1]
+
+class PooledConnection:
+    """
+    A connection borrowed from a `ConnectionPool`: `close` gives it back instead of closing it.
+    Every other attribute is the one of the driver connection.
+
+    Attributes:
+        statements (PreparedStatements): The prepared statements of the connection, None when disabled.
+    """
+
+    __slots__ = ('__pool', '__raw', '__generation', 'statements')
+
+    def __init__(
+        self,
+        pool: 'ConnectionPool',
+        raw: object,
+        statements: PreparedStatements,
+        generation: int
+    ):
+        object.__setattr__(self, '_PooledConnection__pool', pool)
+        object.__setattr__(self, '_PooledConnection__raw', raw)
+        object.__setattr__(self, '_PooledConnection__generation', generation)
+        object.__setattr__(self, 'statements', statements)
+
+    def __getattr__(self, name: str):
+        return getattr(self.__raw, name)
+
+    def __setattr__(self, name: str, value) -> None:
+        setattr(self.__raw, name, value)
+
+    def close(self) -> None:
+        if self.__raw is None:
+            return
+
+        self.__pool.release(self.__raw, self.statements, self.__generation)
+        object.__setattr__(self, '_PooledConnection__raw', None)
+
+class ConnectionPool:
+    """
+    Keeps up to `size` idle connections for reuse.
+
+    The most recently released connection is handed out first, so the prepared statements of
+    the busiest connections stay warm. A connection is opened when none is idle, so callers
+    never wait; one released to a full pool, idle for more than `max_idle` seconds, or opened
+    before the last `flush`, is closed instead of reused.
+
+    Attributes:
+        size (int): Maximum number of idle connections.
+        max_idle (float): Seconds after which an idle connection is not reused, before the server drops it.
+    """
+
+    def __init__(
+        self,
+        open: object,
+        size: int,
+        reset: object,
+        statements: object = None,
+        max_idle: float = 300.0
+    ):
+        """
+        Args:
+            open (callable): Opens a driver connection.
+            size (int): Maximum number of idle connections.
+            reset (callable): Ends what a caller left open on a released connection. Returns False when it cannot be reused.
+            statements (callable, optional): Builds the `PreparedStatements` of a new connection.
+            max_idle (float, optional): Defaults to 300 seconds.
+        """
+
+        self.size = size
+        self.max_idle = max_idle
+        self.__open = open
+        self.__reset = reset
+        self.__statements = statements
+        self.__lock = threading.Lock()
+        # (connection, statements, generation, released at), most recently released last.
+        self.__idle: list[tuple] = []
+        self.__generation = 0
+
+    def acquire(self) -> PooledConnection:
+        stale = []
+
+        with self.__lock:
+            generation = self.__generation
+            deadline = time.monotonic() - self.max_idle
+            entry = None
+
+            while self.__idle:
+                candidate = self.__idle.pop()
+
+                if candidate[3] >= deadline:
+                    entry = candidate
+                    break
+
+                stale.append(candidate[0])
+
+        self.__close(stale)
+
+        if entry is not None:
+            return PooledConnection(self, entry[0], entry[1], entry[2])
+
+        raw = self.__open()
+
+        return PooledConnection(self, raw, self.__statements(raw) if self.__statements else None, generation)
+
+    def release(self, raw: object, statements: PreparedStatements, generation: int) -> None:
+        try:
+            reusable = generation == self.__generation and self.__reset(raw)
+
+        except Exception:
+            reusable = False
+
+        if reusable:
+            with self.__lock:
+                if generation == self.__generation and len(self.__idle) < self.size:
+                    self.__idle.append((raw, statements, generation, time.monotonic()))
+                    return
+
+        self.__close([raw])
+
+    def flush(self) -> None:
+        """Closes the idle connections; the ones in use are closed when they are released."""
+
+        with self.__lock:
+            self.__generation += 1
+            stale = [entry[0] for entry in self.__idle]
+            self.__idle.clear()
+
+        self.__close(stale)
+
+    @staticmethod
+    def __close(connections: list) -> None:
+        for connection in connections:
+            try:
+                connection.close()
+
+            except Exception:
+                pass
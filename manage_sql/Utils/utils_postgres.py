@@ -1,5 +1,14 @@
 import hashlib as sh
 import json
+from datetime import date, datetime
+
+try:
+    from ..Utils.utils_filters import FilterTemplate, like_value, fixed_params, split_column
+    from ..Utils.utils_partitions import INTERVALS
+
+except:
+    from .utils_filters import FilterTemplate, like_value, fixed_params, split_column
+    from .utils_partitions import INTERVALS
 
 class EncryptValue:
     def __init__(
@@ -177,6 +186,90 @@ class Types:
     Integer = __Integer()
     DateTime = __DateTime()
 
+PARTITION_METHODS = ('range', 'list', 'hash')
+
+class Partition:
+    """
+    How `create_table` partitions a table. A `Filter` on `column` then reads only the partitions
+    that can hold the matching rows.
+
+    Attributes:
+        column (str):
+            The partition key.
+        method (str):
+            'range' (default): one partition per `interval` of a date/timestamp column, kept by
+            `maintain_partitions`. 'list': one partition per entry of `values`. 'hash': `modulus`
+            partitions of about the same size.
+        interval (str):
+            'day', 'week', 'month' (default) or 'year', for 'range'.
+        ahead (int):
+            Future intervals created in advance, for 'range'. Defaults to 3.
+        values (dict[str, list]):
+            Partition name suffix to the key values it holds, for 'list'.
+        modulus (int):
+            Number of partitions, for 'hash'.
+        default (bool):
+            Also creates a `<tablename>_default` partition for the rows no other partition takes,
+            for 'range' and 'list'. Defaults to False.
+    """
+    __slots__ = ('column', 'method', 'interval', 'ahead', 'values', 'modulus', 'default')
+
+    def __init__(
+        self,
+        column: str,
+        method: str = 'range',
+        interval: str = 'month',
+        ahead: int = 3,
+        values: dict[str, list] = None,
+        modulus: int = None,
+        default: bool = False
+    ):
+        if method not in PARTITION_METHODS:
+            raise ValueError(f'O `method` deve ser um de {PARTITION_METHODS}, e não {method!r}.')
+
+        if method == 'range' and interval not in INTERVALS:
+            raise ValueError(f'O `interval` deve ser um de {INTERVALS}, e não {interval!r}.')
+
+        if method == 'list' and not values:
+            raise ValueError('Uma partição por lista precisa de `values`.')
+
+        if method == 'hash' and not (isinstance(modulus, int) and modulus > 0):
+            raise ValueError('Uma partição por hash precisa de um `modulus` inteiro positivo.')
+
+        self.column = column
+        self.method = method
+        self.interval = interval
+        self.ahead = ahead
+        self.values = values
+        self.modulus = modulus
+        self.default = default and method != 'hash'
+
+    @property
+    def clause(self) -> str:
+        """The `PARTITION BY ...` of the CREATE TABLE."""
+
+        return f'PARTITION BY {self.method.upper()} ({self.column})'
+
+def sql_literal(value) -> str:
+    """A value written in a statement that cannot bind parameters, such as the bounds of a partition."""
+
+    if value is None:
+        return 'NULL'
+
+    if isinstance(value, bool):
+        return 'TRUE' if value else 'FALSE'
+
+    if isinstance(value, (int, float)):
+        return repr(value)
+
+    if isinstance(value, (date, datetime)):
+        value = value.isoformat(sep=' ') if isinstance(value, datetime) else value.isoformat()
+
+    return "'" + str(value).replace("'", "''") + "'"
+
+# Index method to the operator class of a pg_trgm index.
+TRIGRAM_OPERATORS = {'gin': 'gin_trgm_ops', 'gist': 'gist_trgm_ops'}
+
 class Column:
     """
     Represents a SQL table column with various parameters.
@@ -198,7 +291,15 @@ class Column:
             Whether the column has a NOT NULL constraint.
         default_value (Any):
             The default value for the column.
+        trigram (str):
+            'gin' or 'gist' to create a pg_trgm index on the column with the table, which
+            CONTAIN, NOT_CONTAIN and SIMILAR_TO filters use. None (the default) for no index.
     """
+    __slots__ = (
+        'name', 'type', 'column_parameters', '__primary_key', '__auto_increment',
+        '__unique', '__not_null', '__default_value', 'trigram'
+    )
+
     def __init__(
         self,
         name: str,
@@ -208,10 +309,15 @@ class Column:
         unique: bool = False,
         not_null: bool = False,
         default_value = None,
+        trigram: str = None
     ):
+        if trigram is not None and trigram not in TRIGRAM_OPERATORS:
+            raise ValueError(f'O `trigram` deve ser um de {tuple(TRIGRAM_OPERATORS)}, e não {trigram!r}.')
+
         self.name = name
         self.type = column_type
         self.column_parameters = f'{name} {column_type}'
+        self.trigram = trigram
 
         self.__primary_key: bool = primary_key
         self.__auto_increment: bool = auto_increment
@@ -245,12 +351,15 @@ class Column:
             "unique":  self.__unique,
             "not_null":  self.__not_null,
             "default_value": self.__default_value,
+            "trigram": self.trigram,
         }
     
     def to_json(self):
         return json.dumps(self.__to_dict(), indent=4)
 
 class Table:
+    __slots__ = ('columns', 'name')
+
     def __init__(
         self,
         name: str
@@ -268,7 +377,11 @@ class Table:
     def to_json(self):
         return json.dumps(self.__to_dict(), indent=4)
 
+SEARCH_COLUMN = 'search_vector'
+
 class Filter:
+    __slots__ = ('column_name', '__condition', '__params')
+
     def __init__(
         self,
         column: str
@@ -332,16 +445,47 @@ class Filter:
         self.__add_filter(condition='<=', value=value)
         return self
     
-    def CONTAIN(self, value):
-        """Adds a 'LIKE' filter for partial matches."""
+    def CONTAIN(self, value, ignore_case: bool = False):
+        """
+        Adds a 'LIKE' filter for partial matches, 'ILIKE' with `ignore_case`.
+        A trigram index on the column (`Column(trigram=...)` or `create_index(trigram=...)`) serves both.
+        """
+
+        self.__add_filter(condition='ILIKE' if ignore_case else 'LIKE', value=like_value(value))
+        return self
+    
+    def NOT_CONTAIN(self, value, ignore_case: bool = False):
+        """Adds a 'NOT LIKE' filter for partial matches, 'NOT ILIKE' with `ignore_case`."""
 
-        self.__add_filter(condition='LIKE', value=f'%{value}%')
+        self.__add_filter(condition='NOT ILIKE' if ignore_case else 'NOT LIKE', value=like_value(value))
+        return self
+
+    def SIMILAR_TO(self, value, threshold: float = None):
+        """
+        Adds a fuzzy filter with the pg_trgm `%` operator: values whose trigram similarity to `value` reaches
+        `pg_trgm.similarity_threshold` (0.3 by default), found through a trigram index on the column.
+        A higher `threshold` keeps only the closer ones among them.
+        """
+
+        if threshold is None:
+            self.__add_filter(condition='%%', value=value)
+            return self
+
+        head, column = split_column(self.__condition)
+        self.__params.extend((value, value, threshold))
+        self.__condition = f'{head} ({column} %% %s AND similarity({column}, %s) >= %s) '
         return self
     
-    def NOT_CONTAIN(self, value):
-        """Adds a 'NOT LIKE' filter for partial matches."""
+    def MATCH(self, value, language: str = 'simple'):
+        """
+        Adds a full-text search on the table of the filter, e.g. `filter_by('posts').MATCH('sqlite or postgres')`.
+        Looks the words up in the GIN index of `create_search_index`, with the `websearch_to_tsquery` syntax;
+        `language` must be the one of the index.
+        """
 
-        self.__add_filter(condition='NOT LIKE', value=f'%{value}%')
+        head, table = split_column(self.__condition)
+        self.__params.extend((language, value))
+        self.__condition = f'{head} {table}.{SEARCH_COLUMN} @@ websearch_to_tsquery(%s::regconfig, %s) '
         return self
     
     def __add_filter(self, condition: str, value):
@@ -350,11 +494,52 @@ class Filter:
         self.__params.append(value)
         self.__condition += f'{condition} %s '
 
+    @property
+    def sql(self) -> str:
+        """The `WHERE ...` clause."""
+
+        return self.__condition.strip()
+
+    @property
+    def params(self) -> tuple:
+        """The values of the clause's placeholders, in order."""
+
+        return fixed_params(self.__params)
+
+    def compile(self) -> FilterTemplate:
+        """
+        Freezes the filter into a reusable template whose `param(...)` placeholders
+        are given values with `bind(...)`.
+        """
+
+        return FilterTemplate(self.sql, self.__params)
+
 class ColumnData:
+    __slots__ = ('column', 'value')
+
     def __init__(
         self,
         column: str,
         value: str | int | float | bool | None
     ):
         self.column = column
-        self.value = value
\ No newline at end of file
+        self.value = value
+
+def copy_value(value) -> str:
+    """Encodes a value for the text format of `COPY ... FROM STDIN`."""
+
+    if value is None:
+        return '\\N'
+
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return '\\\\x' + bytes(value).hex()
+
+    return str(value).replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+
+def copy_text(rows: list[tuple]) -> str:
+    """Encodes rows as tab separated lines for `COPY ... FROM STDIN`."""
+
+    return ''.join('\t'.join(map(copy_value, row)) + '\n' for row in rows)
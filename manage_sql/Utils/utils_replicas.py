@@ -0,0 +1,165 @@
+import itertools
+import re
+import threading
+import time
+from contextlib import contextmanager
+
+STRATEGIES = ('round_robin', 'least_outstanding')
+READ_ONLY_QUERY = re.compile(r'^\s*(select|show|explain|describe|desc|with)\b', re.IGNORECASE)
+WRITE_KEYWORD = re.compile(r'\b(insert|update|delete|merge|create|alter|drop|truncate|grant|revoke|lock|call)\b|\bfor\s+(update|share)\b', re.IGNORECASE)
+
+def is_read_only(query: str) -> bool:
+    """
+    Whether a raw query can run on a replica: a SELECT/SHOW/EXPLAIN/DESCRIBE (or a WITH)
+    that does not contain a write keyword nor a locking `FOR UPDATE`/`FOR SHARE`.
+    """
+
+    return bool(READ_ONLY_QUERY.match(query)) and not WRITE_KEYWORD.search(query)
+
+class ReplicaRouter:
+    """
+    Chooses the replica of each read and keeps track of the replicas' health.
+
+    A replica is skipped while it is unhealthy: after `max_errors` consecutive errors, or
+    when its measured lag is over `max_lag`. It is tried again `retry_after` seconds later.
+    Reads made less than `read_your_writes` seconds after a write go to the primary.
+
+    Attributes:
+        replicas (int): Number of replicas.
+        strategy (str): 'round_robin' or 'least_outstanding'.
+        read_your_writes (float): Seconds after a write during which reads stay on the primary. 0 disables it.
+        max_lag (float): Replication lag, in seconds, above which a replica is unhealthy. None disables the check.
+        max_errors (int): Consecutive errors after which a replica is unhealthy.
+        retry_after (float): Seconds an unhealthy replica is left out.
+        lag_interval (float): Minimum seconds between two lag measurements of a replica.
+    """
+
+    def __init__(
+        self,
+        replicas: int,
+        strategy: str = 'round_robin',
+        read_your_writes: float = 0.0,
+        max_lag: float = None,
+        max_errors: int = 3,
+        retry_after: float = 30.0,
+        lag_interval: float = 5.0
+    ):
+        if strategy not in STRATEGIES:
+            raise ValueError(f'O `replica_strategy` deve ser um de {STRATEGIES}, e não {strategy!r}.')
+
+        self.strategy = strategy
+        self.read_your_writes = read_your_writes
+        self.max_lag = max_lag
+        self.max_errors = max_errors
+        self.retry_after = retry_after
+        self.lag_interval = lag_interval
+
+        self.__lock = threading.Lock()
+        self.__next = itertools.count()
+        self.__outstanding = [0] * replicas
+        self.__errors = [0] * replicas
+        self.__unhealthy_until = [0.0] * replicas
+        self.__lag_checked = [0.0] * replicas
+        self.__last_write = 0.0
+
+    def wrote(self) -> None:
+        """Records a write on the primary, for the read-your-writes window."""
+
+        self.__last_write = time.monotonic()
+
+    def pick(self) -> int | None:
+        """Returns the replica for the next read, or None to read from the primary."""
+
+        now = time.monotonic()
+
+        if self.read_your_writes and now - self.__last_write < self.read_your_writes:
+            return None
+
+        with self.__lock:
+            healthy = [index for index, until in enumerate(self.__unhealthy_until) if until <= now]
+
+            if not healthy:
+                return None
+
+            if self.strategy == 'least_outstanding':
+                return min(healthy, key=lambda index: (self.__outstanding[index], index))
+
+            return healthy[next(self.__next) % len(healthy)]
+
+    @contextmanager
+    def using(self, index: int, errors: tuple = (Exception,)):
+        """Counts a read as outstanding on `index` and records whether it failed with one of `errors`."""
+
+        with self.__lock:
+            self.__outstanding[index] += 1
+
+        try:
+            yield
+
+        except errors:
+            with self.__lock:
+                self.__errors[index] += 1
+
+                if self.__errors[index] >= self.max_errors:
+                    self.__mark_unhealthy(index)
+
+            raise
+
+        else:
+            with self.__lock:
+                self.__errors[index] = 0
+
+        finally:
+            with self.__lock:
+                self.__outstanding[index] -= 1
+
+    def lag_due(self, index: int) -> bool:
+        """Whether the lag of `index` should be measured now. Marks it as measured."""
+
+        if self.max_lag is None:
+            return False
+
+        now = time.monotonic()
+
+        with self.__lock:
+            if now - self.__lag_checked[index] < self.lag_interval:
+                return False
+
+            self.__lag_checked[index] = now
+
+        return True
+
+    def record_lag(self, index: int, seconds: float | None) -> bool:
+        """
+        Records a lag measurement. None means replication is not running.
+
+        Returns:
+            bool: False when the replica is now unhealthy.
+        """
+
+        if seconds is None or seconds > self.max_lag:
+            with self.__lock:
+                self.__mark_unhealthy(index)
+
+            return False
+
+        return True
+
+    def status(self) -> list[dict]:
+        """The outstanding reads, consecutive errors and health of every replica."""
+
+        now = time.monotonic()
+
+        with self.__lock:
+            return [
+                {
+                    'outstanding': self.__outstanding[index],
+                    'errors': self.__errors[index],
+                    'healthy': self.__unhealthy_until[index] <= now
+                }
+                for index in range(len(self.__outstanding))
+            ]
+
+    def __mark_unhealthy(self, index: int) -> None:
+        self.__unhealthy_until[index] = time.monotonic() + self.retry_after
+        self.__errors[index] = 0
@@ -0,0 +1,222 @@
+import re
+from array import array
+from collections import namedtuple
+from functools import lru_cache
+
+ROW_FORMATS = ('tuple', 'dict', 'namedtuple', 'columns')
+INTEGER_TYPE = re.compile(r'^((tiny|small|medium|big)?int(eger)?|(small|big)?serial)\b')
+FLOAT_TYPES = ('real', 'double', 'float')
+DECIMAL_TYPES = ('decimal', 'numeric')
+
+@lru_cache(maxsize=256)
+def row_class(columns: tuple[str]):
+    """
+    Returns the namedtuple class for a set of column names.
+
+    The class is cached per column set, so repeated queries with the same shape reuse it.
+    Names that are not valid identifiers (e.g. `count(*)`) are renamed to `_0`, `_1`, ...
+    """
+
+    return namedtuple('Row', columns, rename=True)
+
+@lru_cache(maxsize=256)
+def insert_query(tablename: str, columns: tuple[str], placeholder: str = '?', rows: int = 1) -> str:
+    """
+    Returns the `INSERT INTO tablename (columns) VALUES (...)` statement for `rows` rows.
+
+    The statement is built once per table, column set and row count, so inserting in a
+    loop does not join the column names again on every call.
+    """
+
+    values = f"({', '.join([placeholder] * len(columns))})"
+
+    return f"INSERT INTO {tablename} ({', '.join(columns)}) VALUES {', '.join([values] * rows)}"
+
+def order_clause(order_by: str | list[str] = None, descending: bool = False) -> str:
+    """Returns the ` ORDER BY ...` suffix of a SELECT, or an empty string."""
+
+    if not order_by:
+        return ''
+
+    columns = [order_by] if isinstance(order_by, str) else order_by
+    direction = ' DESC' if descending else ''
+
+    return ' ORDER BY ' + ', '.join(f'{column}{direction}' for column in columns)
+
+# Aggregate function to its SQL, the same on the three backends.
+AGGREGATES = {
+    'count': 'COUNT({})',
+    'count_distinct': 'COUNT(DISTINCT {})',
+    'sum': 'SUM({})',
+    'avg': 'AVG({})',
+    'min': 'MIN({})',
+    'max': 'MAX({})'
+}
+
+def aggregate_query(
+    tablename: str,
+    aggregates: dict[str, tuple[str, str]],
+    group_by: str | list[str] = None,
+    condition = None,
+    having = None,
+    order_by: str | list[str] = None,
+    descending: bool = False
+) -> tuple[str, tuple]:
+    """
+    Returns the single `SELECT ... GROUP BY ... HAVING ...` statement of `aggregate` and its parameters.
+
+    Args:
+        aggregates (dict[str, tuple[str, str]]):
+            Alias to (function, column), e.g. `{'total': ('sum', 'price')}`. The function is one of
+            `AGGREGATES`; the column may be '*' for 'count'.
+        condition (Filter, optional):
+            Rows to aggregate (WHERE).
+        having (Filter, optional):
+            Groups to keep, filtered by alias. The aliases are replaced by their expression, since
+            PostgreSQL does not accept output names in HAVING.
+
+    Raises:
+        ValueError: If an aggregate is not a known (function, column) pair.
+    """
+
+    if not aggregates:
+        raise ValueError('Indique pelo menos uma agregação em `aggregates`.')
+
+    expressions: dict[str, str] = {}
+
+    for alias, spec in aggregates.items():
+        if not isinstance(spec, (tuple, list)) or len(spec) != 2 or spec[0] not in AGGREGATES:
+            raise ValueError(f'A agregação `{alias}` deve ser (função, coluna), com a função em {tuple(AGGREGATES)}, e não {spec!r}.')
+
+        expressions[alias] = AGGREGATES[spec[0]].format(spec[1])
+
+    groups = [group_by] if isinstance(group_by, str) else list(group_by or [])
+    selection = ', '.join([*groups, *(f'{expression} AS {alias}' for alias, expression in expressions.items())])
+    query = f'SELECT {selection} FROM {tablename}'
+    params = ()
+
+    if condition:
+        query += f' {condition.sql}'
+        params += condition.params
+
+    if groups:
+        query += f" GROUP BY {', '.join(groups)}"
+
+    if having:
+        clause = re.sub(r'^WHERE\b', 'HAVING', having.sql)
+        aliases = re.compile(r'\b(' + '|'.join(map(re.escape, expressions)) + r')\b')
+        query += ' ' + aliases.sub(lambda match: expressions[match.group(1)], clause)
+        params += having.params
+
+    return query + order_clause(order_by, descending), params
+
+def column_names(description) -> tuple[str]:
+    """Extracts the column names from a DB-API `cursor.description`."""
+
+    return tuple(column[0] for column in description or ())
+
+def type_kind(type_name: str) -> str:
+    """
+    Classifies a declared column type of any of the three backends.
+
+    Returns:
+        str: One of 'integer', 'float', 'decimal', 'bool', 'date', 'datetime', 'timestamptz',
+        'time', 'json', 'array' or 'text' (the fallback for text, blobs and unknown types).
+    """
+
+    name = str(getattr(type_name, 'value', type_name) or '').strip().lower()
+
+    if name.endswith('[]'):
+        return 'array'
+
+    if name.startswith('bool') or name == 'tinyint(1)':
+        return 'bool'
+
+    if INTEGER_TYPE.match(name):
+        return 'integer'
+
+    if name.startswith(FLOAT_TYPES):
+        return 'float'
+
+    if name.startswith(DECIMAL_TYPES):
+        return 'decimal'
+
+    if name == 'date':
+        return 'date'
+
+    if name.startswith(('timestamp', 'datetime')):
+        return 'timestamptz' if 'with time zone' in name else 'datetime'
+
+    if name.startswith('time'):
+        return 'time'
+
+    if name.startswith('json'):
+        return 'json'
+
+    return 'text'
+
+def column_types(tables: list, tablename: str) -> dict[str, str]:
+    """Returns the declared type of each column of `tablename` from the `tables` metadata."""
+
+    for table in tables:
+        if table.name == tablename:
+            return {column.name: getattr(column.type, 'value', column.type) for column in table.columns}
+
+    return {}
+
+def numeric_array(values: list):
+    """
+    Packs a column into an `array.array` when every value is an int (`q`) or a float (`d`).
+
+    Columns with NULLs, text or mixed values are returned unchanged as a list.
+    """
+
+    kinds = set(map(type, values))
+
+    try:
+        if kinds == {int}:
+            return array('q', values)
+
+        if kinds == {float} or kinds == {int, float}:
+            return array('d', values)
+
+    except OverflowError:
+        pass
+
+    return values
+
+def format_rows(description, rows: list[tuple], row_format: str = 'tuple'):
+    """
+    Converts fetched rows to the requested format in a single pass.
+
+    Args:
+        description:
+            The `cursor.description` of the query that produced the rows.
+        rows (list[tuple]):
+            The rows returned by `fetchall`/`fetchmany`.
+        row_format (str):
+            `'tuple'` keeps the rows as returned by the driver, `'dict'` maps column name to value,
+            `'namedtuple'` builds one cached namedtuple class per column set and `'columns'`
+            returns a dict of column name to list (or `array.array` for numeric columns).
+
+    Returns:
+        list | dict: The converted rows.
+    """
+
+    if row_format == 'tuple':
+        return rows
+
+    if row_format not in ROW_FORMATS:
+        raise ValueError(f'O `row_format` deve ser um de {ROW_FORMATS}, e não {row_format!r}.')
+
+    names = column_names(description)
+
+    if row_format == 'dict':
+        return [dict(zip(names, row)) for row in rows]
+
+    if row_format == 'namedtuple':
+        return list(map(row_class(names)._make, rows))
+
+    columns = zip(*rows) if rows else (() for _ in names)
+
+    return {name: numeric_array(list(values)) for name, values in zip(names, columns)}
@@ -1,6 +1,12 @@
 from enum import Enum
 import hashlib as sh
 
+try:
+    from ..Utils.utils_filters import FilterTemplate, like_value, fixed_params, split_column
+
+except:
+    from .utils_filters import FilterTemplate, like_value, fixed_params, split_column
+
 class EncryptValue:
     """
     Encrypts a given value using SHA-512 hashing.
@@ -63,6 +69,8 @@ class Column:
         not_null (bool):
             Whether the column has a NOT NULL constraint.
     """
+    __slots__ = ('name', 'type', 'column_parameters')
+
     def __init__(
         self,
         name: str,
@@ -108,6 +116,8 @@ class Column:
         }
 
 class Table:
+    __slots__ = ('columns', 'name')
+
     def __init__(
         self,
         name: str
@@ -122,7 +132,11 @@ class Table:
             'columns': [column.to_dict() for column in self.columns]
         }
 
+SEARCH_SUFFIX = '_fts'
+
 class Filter:
+    __slots__ = ('column_name', '__condition', '__params')
+
     def __init__(
         self,
         column: str
@@ -190,13 +204,24 @@ class Filter:
     def CONTAIN(self, value):
         """Adds a 'LIKE' filter for partial matches."""
 
-        self.__add_filter(condition='LIKE', value=f'%{value}%')
+        self.__add_filter(condition='LIKE', value=like_value(value))
         return self
     
     def NOT_CONTAIN(self, value):
         """Adds a 'NOT LIKE' filter for partial matches."""
 
-        self.__add_filter(condition='NOT LIKE', value=f'%{value}%')
+        self.__add_filter(condition='NOT LIKE', value=like_value(value))
+        return self
+    
+    def MATCH(self, value):
+        """
+        Adds a full-text search on the table of the filter, e.g. `filter_by('posts').MATCH('sqlite OR postgres')`.
+        Looks the words up in the FTS5 index of `create_search_index`, with the FTS5 query syntax.
+        """
+
+        head, table = split_column(self.__condition)
+        self.__params.append(value)
+        self.__condition = f'{head} {table}.rowid IN (SELECT rowid FROM {table}{SEARCH_SUFFIX} WHERE {table}{SEARCH_SUFFIX} MATCH ?) '
         return self
     
     def __add_filter(self, condition: str, value):
@@ -205,6 +230,26 @@ class Filter:
         self.__params.append(value)
         self.__condition += f'{condition} ? '
 
+    @property
+    def sql(self) -> str:
+        """The `WHERE ...` clause."""
+
+        return self.__condition.strip()
+
+    @property
+    def params(self) -> tuple:
+        """The values of the clause's placeholders, in order."""
+
+        return fixed_params(self.__params)
+
+    def compile(self) -> FilterTemplate:
+        """
+        Freezes the filter into a reusable template whose `param(...)` placeholders
+        are given values with `bind(...)`.
+        """
+
+        return FilterTemplate(self.sql, self.__params)
+
 class ColumnData:
     """
     Initialize a ColumnData instance.
@@ -212,6 +257,8 @@ class ColumnData:
     :param column: The name of the column.
     :param value: The value associated with the column.
     """
+    __slots__ = ('column', 'value')
+
     def __init__(
         self,
         column: str,
@@ -1,3 +1,25 @@
-from .Utils.SQLITE import SQLITE
-from .Utils.POSTGRESQL import POSTGRESQL
-from .Utils.MYSQL import MYSQL
\ No newline at end of file
+import importlib
+
+# The backends are imported on first access, so `import manage_sql` does not load
+# psycopg2 or mysql.connector (nor fail without them) when only SQLITE is used.
+_BACKENDS = {
+    'SQLITE': '.Utils.SQLITE',
+    'POSTGRESQL': '.Utils.POSTGRESQL',
+    'MYSQL': '.Utils.MYSQL',
+    'ShardedSQLITE': '.Utils.SHARDED_SQLITE',
+    'migrate_table': '.Utils.utils_migrate'
+}
+
+__all__ = list(_BACKENDS)
+
+def __getattr__(name: str):
+    if name not in _BACKENDS:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    backend = getattr(importlib.import_module(_BACKENDS[name], __name__), name)
+    globals()[name] = backend
+
+    return backend
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
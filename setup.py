@@ -9,7 +9,7 @@ setup(
     long_description=open('README.md', 'r', encoding='UTF-8').read(),
     long_description_content_type='text/markdown',
     url='https://github.com/webtechmoz/manage-sql.git',
-    packages=find_packages(),
+    packages=find_packages(exclude=['benchmarks', 'benchmarks.*']),
     keywords=['manage-sql', 'sqlite', 'sqlite manager', 'mysql', 'mysql manager', 'mysql python', 'mysql connector', 'postgresql connector', 'postgresql', 'postgresql python'],
     license='MIT',
     classifiers=[
@@ -21,10 +21,17 @@ setup(
         'License :: OSI Approved :: MIT License',
         'Operating System :: OS Independent',
     ],
-    install_requires=[
-        "mysql-connector",
-        "mysql-connector-python",
-        "psycopg2-binary"
-    ],
+    install_requires=[],
+    extras_require={
+        'postgresql': ['psycopg2-binary'],
+        'mysql': ['mysql-connector-python'],
+        'psycopg': ['psycopg[binary]'],
+        'mysqlclient': ['mysqlclient'],
+        'all': ['psycopg2-binary', 'mysql-connector-python'],
+        'numpy': ['numpy'],
+        'pandas': ['numpy', 'pandas'],
+        'parquet': ['pyarrow'],
+        'zstd': ['zstandard'],
+    },
     python_requires='>=3.6',
 )
\ No newline at end of file